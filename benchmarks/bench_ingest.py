@@ -0,0 +1,105 @@
+"""Compare the lean Gatus ingest path with the former pydantic path.
+
+Usage:
+    python -m benchmarks.bench_ingest [--sizes 100 500 2000] [--results 20]
+
+For each fleet size, reports the median parse time and the peak memory
+allocated while parsing (tracemalloc) for:
+  - pydantic: the former GatusEndpoint.model_validate({**raw, ...}) per
+    endpoint (the model is kept here only as the reference)
+  - lean: GatusClient._parse_endpoint -> slotted EndpointStatus
+
+The lean path is about 1.3x as fast, although it also parses the check
+timestamp once at ingest, and never copies the results history (about 6x
+less peak allocation at 20 results per endpoint).
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from benchmarks.fleet import make_fleet
+from stremio_status.clients.gatus_client import GatusClient
+
+
+class GatusEndpoint(BaseModel):
+    """The validated record the pydantic ingest path produced."""
+
+    name: str
+    group: str
+    key: str
+    healthy: bool
+    uptime: float | None = None
+    response_time: float | None = Field(default=None, alias="responseTime")
+    last_updated: str | None = Field(default=None, alias="lastUpdated")
+
+
+def parse_pydantic(client: GatusClient, data: list[dict[str, Any]]) -> list[Any]:
+    """The ingest path before EndpointStatus: spread the raw object into pydantic."""
+    parsed = []
+    for ep in data:
+        healthy, response_ms, last_updated = client._extract_health_data(ep)
+        parsed.append(
+            GatusEndpoint.model_validate(
+                {
+                    **ep,
+                    "key": client._generate_key(ep),
+                    "healthy": healthy,
+                    "responseTime": response_ms,
+                    "lastUpdated": last_updated,
+                }
+            )
+        )
+    return parsed
+
+
+def parse_lean(client: GatusClient, data: list[dict[str, Any]]) -> list[Any]:
+    return [client._parse_endpoint(ep) for ep in data]
+
+
+def measure(
+    fn: Callable[[GatusClient, list[dict[str, Any]]], list[Any]],
+    client: GatusClient,
+    data: list[dict[str, Any]],
+    repeat: int,
+) -> tuple[float, int]:
+    """Return (median seconds, peak bytes allocated) for parsing data."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(client, data)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = fn(client, data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return statistics.median(timings), peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--results", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    client = GatusClient("http://localhost:8080")
+    print(f"{'size':>6} {'path':>9} {'median ms':>10} {'peak KiB':>10}")
+    for size in args.sizes:
+        data = make_fleet(size, results=args.results)
+        for label, fn in (("pydantic", parse_pydantic), ("lean", parse_lean)):
+            seconds, peak = measure(fn, client, data, args.repeat)
+            print(f"{size:>6} {label:>9} {seconds * 1000:>10.2f} {peak / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Measure the overhead of the /metrics instrumentation.
+
+Usage:
+    python -m benchmarks.bench_metrics [--iterations 200000]
+
+Reports the median cost per call of:
+  - Counter.inc / Histogram.observe (the inline hot-path updates)
+  - MetricsMiddleware around a no-op ASGI app, minus the bare app
+  - a full GET /health through the app with and without the middleware
+  - rendering /metrics
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import httpx
+from fastapi import FastAPI
+from starlette.types import Message, Receive, Scope, Send
+
+from stremio_status.core import metrics
+from stremio_status.endpoints.health import health_router
+from stremio_status.endpoints.metrics import MetricsMiddleware
+
+
+def per_call(fn: Callable[[], Any], iterations: int, repeat: int = 5) -> float:
+    """Median seconds per call of fn over repeat runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        timings.append((time.perf_counter() - start) / iterations)
+    return statistics.median(timings)
+
+
+async def per_call_async(
+    fn: Callable[[], Awaitable[Any]], iterations: int, repeat: int = 5
+) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await fn()
+        timings.append((time.perf_counter() - start) / iterations)
+    return statistics.median(timings)
+
+
+async def noop_app(scope: Scope, receive: Receive, send: Send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def receive() -> Message:
+    return {"type": "http.request", "body": b""}
+
+
+async def send(message: Message) -> None:
+    pass
+
+
+def make_app(instrumented: bool) -> FastAPI:
+    app = FastAPI()
+    if instrumented:
+        app.add_middleware(MetricsMiddleware)
+    app.include_router(health_router)
+    return app
+
+
+async def bench(iterations: int) -> None:
+    counter = metrics.Counter("bench_total", "", ["route"])
+    histogram = metrics.Histogram("bench_seconds", "", ["route", "method"])
+    rows = [
+        ("Counter.inc", per_call(lambda: counter.inc("/r"), iterations)),
+        (
+            "Histogram.observe",
+            per_call(lambda: histogram.observe(0.0042, "/r", "GET"), iterations),
+        ),
+    ]
+
+    scope: Scope = {"type": "http", "method": "GET", "path": "/"}
+    middleware = MetricsMiddleware(noop_app)
+    bare = await per_call_async(lambda: noop_app(scope, receive, send), iterations)
+    wrapped = await per_call_async(
+        lambda: middleware(scope, receive, send), iterations
+    )
+    rows.append(("MetricsMiddleware (added)", wrapped - bare))
+
+    requests = max(1, iterations // 100)
+    for label, instrumented in (("GET /health", False), ("GET /health+metrics", True)):
+        transport = httpx.ASGITransport(app=make_app(instrumented))
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            rows.append(
+                (label, await per_call_async(lambda: c.get("/health"), requests))
+            )
+
+    rows.append(("render /metrics", per_call(metrics.registry.render, 1000)))
+
+    print(f"{'operation':>26} {'per call':>12}")
+    for label, seconds in rows:
+        print(f"{label:>26} {seconds * 1e6:>10.2f}us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--iterations", type=int, default=200_000)
+    args = parser.parse_args()
+    asyncio.run(bench(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Synthetic Gatus server for load tests.
+
+Serves /api/v1/endpoints/statuses for a generated fleet (see fleet.py),
+honouring page/pageSize like Gatus (newest results first), with optional
+latency injection, error injection and periodic fleet churn. Call counts
+are available from /__stats.
+
+Usage:
+    python -m benchmarks.fake_gatus --size 1000 --results 20 \\
+        --failure-rate 0.1 --latency-ms 50 --port 8089
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from benchmarks.fleet import make_fleet
+
+
+@dataclass
+class FakeGatusConfig:
+    size: int = 100
+    results: int = 20
+    failure_rate: float = 0.1
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    # Regenerate the fleet (new check results) every churn_seconds; 0 = never
+    churn_seconds: float = 0.0
+    seed: int = 0
+
+
+@dataclass
+class FakeGatusStats:
+    calls: int = 0
+    errors: int = 0
+    bytes_sent: int = 0
+    page_sizes: dict[int, int] = field(default_factory=dict)
+
+
+class FakeGatus:
+    """Pre-serializes the fleet per requested page size and serves it."""
+
+    def __init__(self, config: FakeGatusConfig) -> None:
+        self.config = config
+        self.stats = FakeGatusStats()
+        self._rng = random.Random(config.seed)
+        self._generation = 0
+        self._generated_at = 0.0
+        self._fleet: list[dict[str, Any]] = []
+        self._bodies: dict[tuple[int, int], bytes] = {}
+        self._regenerate()
+
+    def _regenerate(self) -> None:
+        self._fleet = make_fleet(
+            self.config.size,
+            results=self.config.results,
+            failure_rate=self.config.failure_rate,
+            seed=self.config.seed + self._generation,
+        )
+        self._bodies.clear()
+        self._generated_at = time.monotonic()
+        self._generation += 1
+
+    def body(self, page: int, page_size: int) -> bytes:
+        churn = self.config.churn_seconds
+        if churn and time.monotonic() - self._generated_at >= churn:
+            self._regenerate()
+
+        key = (page, page_size)
+        body = self._bodies.get(key)
+        if body is None:
+            # Page 1 holds the newest page_size results (kept oldest-first)
+            end = self.config.results - (page - 1) * page_size
+            start = max(0, end - page_size)
+            payload = [
+                {**ep, "results": ep["results"][start:max(0, end)]}
+                for ep in self._fleet
+            ]
+            body = self._bodies[key] = json.dumps(payload).encode()
+        return body
+
+    async def statuses(self, request: Request) -> Response:
+        self.stats.calls += 1
+        page = max(1, int(request.query_params.get("page", 1)))
+        page_size = max(1, int(request.query_params.get("pageSize", 20)))
+        self.stats.page_sizes[page_size] = self.stats.page_sizes.get(page_size, 0) + 1
+
+        delay = self.config.latency_ms + self._rng.uniform(0, self.config.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if self._rng.random() < self.config.error_rate:
+            self.stats.errors += 1
+            return Response("injected failure", status_code=500)
+
+        body = self.body(page, page_size)
+        self.stats.bytes_sent += len(body)
+        return Response(body, media_type="application/json")
+
+    async def stats_endpoint(self, request: Request) -> Response:
+        return JSONResponse(
+            {
+                "calls": self.stats.calls,
+                "errors": self.stats.errors,
+                "bytes_sent": self.stats.bytes_sent,
+                "page_sizes": self.stats.page_sizes,
+                "fleet_generation": self._generation,
+            }
+        )
+
+    def app(self) -> Starlette:
+        return Starlette(
+            routes=[
+                Route("/api/v1/endpoints/statuses", self.statuses),
+                Route("/__stats", self.stats_endpoint),
+            ]
+        )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    add_fleet_args(parser)
+    return parser.parse_args(argv)
+
+
+def add_fleet_args(parser: argparse.ArgumentParser) -> None:
+    """Fleet options, shared with the load generator."""
+    parser.add_argument("--size", type=int, default=100, help="endpoints (10-10000)")
+    parser.add_argument("--results", type=int, default=20, help="results per endpoint")
+    parser.add_argument("--failure-rate", type=float, default=0.1)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--churn-seconds", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def config_from_args(args: argparse.Namespace) -> FakeGatusConfig:
+    return FakeGatusConfig(
+        size=args.size,
+        results=args.results,
+        failure_rate=args.failure_rate,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        churn_seconds=args.churn_seconds,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    server = FakeGatus(config_from_args(args))
+    uvicorn.run(server.app(), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
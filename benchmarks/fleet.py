@@ -0,0 +1,57 @@
+"""Synthetic Gatus payloads shared by the benchmarks."""
+
+from __future__ import annotations
+
+import random
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+GROUPS = ["Addons", "Debrid", "Platform", "Catalogs", "Scrapers"]
+
+
+def make_fleet(
+    size: int,
+    results: int = 20,
+    failure_rate: float = 0.1,
+    interval_seconds: int = 300,
+    seed: int = 0,
+) -> list[dict[str, Any]]:
+    """Build a /api/v1/endpoints/statuses payload for `size` endpoints.
+
+    Each endpoint gets `results` check results spaced `interval_seconds`
+    apart, ending now, where each check fails with probability failure_rate.
+    """
+    rng = random.Random(seed)
+    now = datetime.now(UTC).replace(microsecond=0)
+
+    fleet: list[dict[str, Any]] = []
+    for i in range(size):
+        group = GROUPS[i % len(GROUPS)]
+        name = f"Service {i}"
+        history = []
+        for r in range(results):
+            ts = now - timedelta(seconds=interval_seconds * (results - 1 - r))
+            success = rng.random() >= failure_rate
+            history.append(
+                {
+                    "status": 200 if success else 503,
+                    "hostname": f"svc{i}.example.com",
+                    "duration": rng.randint(50, 2500) * 1_000_000,
+                    "conditionResults": [
+                        {"condition": "[STATUS] == 200", "success": success},
+                        {"condition": "[CERTIFICATE_EXPIRATION] > 72h", "success": True},
+                    ],
+                    "success": success,
+                    "timestamp": ts.isoformat().replace("+00:00", "Z"),
+                }
+            )
+        fleet.append(
+            {
+                "name": name,
+                "group": group,
+                "key": f"{group.lower()}_service-{i}",
+                "results": history,
+                "events": [],
+            }
+        )
+    return fleet
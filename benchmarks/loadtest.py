@@ -0,0 +1,385 @@
+"""Load-test the addon against a synthetic Gatus server.
+
+Starts benchmarks.fake_gatus and the addon as subprocesses (or targets an
+already running addon with --target), then drives /manifest.json, catalog,
+meta and stream routes with many concurrent clients and a realistic mix of
+distinct config tokens (a few popular, a long tail of rare ones). Reports
+throughput, p50/p95/p99 latency per route, upstream Gatus calls and the
+addon's RSS, and writes everything as JSON for comparison across commits.
+
+Usage:
+    python -m benchmarks.loadtest --size 1000 --duration 30 --concurrency 64
+    python -m benchmarks.loadtest --target http://localhost:7000 --pid 1234
+
+Extra addon settings can be passed through the environment (ADDON_*).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from benchmarks.fake_gatus import add_fleet_args
+from benchmarks.fleet import GROUPS
+from stremio_status.core.constants import ID_PREFIX
+
+# Share of requests per route (Stremio asks for streams far more than the rest)
+ROUTE_MIX = {"manifest": 0.05, "catalog": 0.15, "meta": 0.2, "stream": 0.6}
+CONTENT_TYPES = ["movie", "series", "tv"]
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def fleet_keys(size: int) -> list[str]:
+    """Endpoint keys generated by fleet.make_fleet for a fleet of size."""
+    return [f"{GROUPS[i % len(GROUPS)].lower()}_service-{i}" for i in range(size)]
+
+
+def make_tokens(keys: list[str], count: int, rng: random.Random) -> list[str]:
+    """Distinct config tokens: some "all addons", most a random selection."""
+    tokens = []
+    for _ in range(count):
+        config: dict[str, Any] = {
+            "onlyDown": rng.random() < 0.7,
+            "showWatchdog": rng.random() < 0.3,
+        }
+        if rng.random() >= 0.2:
+            config["addons"] = rng.sample(keys, rng.randint(1, min(20, len(keys))))
+        raw = json.dumps(config).encode()
+        tokens.append(base64.urlsafe_b64encode(raw).decode().rstrip("="))
+    return tokens
+
+
+class Workload:
+    """Random request paths following ROUTE_MIX and a Zipf-like token mix."""
+
+    def __init__(self, keys: list[str], tokens: list[str], seed: int = 0) -> None:
+        self.keys = keys
+        self.tokens = tokens
+        self.rng = random.Random(seed)
+        self.token_weights = [1 / (rank + 1) ** 1.1 for rank in range(len(tokens))]
+        self.routes = list(ROUTE_MIX)
+        self.route_weights = list(ROUTE_MIX.values())
+
+    def next(self) -> tuple[str, str]:
+        """Return (route name, path)."""
+        rng = self.rng
+        route = rng.choices(self.routes, self.route_weights)[0]
+        prefix = ""
+        if self.tokens and rng.random() >= 0.1:
+            prefix = "/" + rng.choices(self.tokens, self.token_weights)[0]
+
+        if route == "manifest":
+            return route, f"{prefix}/manifest.json"
+        if route == "catalog":
+            return route, f"{prefix}/catalog/other/addon-status.json"
+        if route == "meta":
+            return route, f"{prefix}/meta/tv/{ID_PREFIX}{rng.choice(self.keys)}.json"
+        content_id = f"tt{rng.randint(1, 9_999_999):07d}"
+        return route, f"{prefix}/stream/{rng.choice(CONTENT_TYPES)}/{content_id}.json"
+
+
+def rss_bytes(pid: int) -> int | None:
+    """Resident set size of pid and its children (Linux /proc only)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            rss = next(
+                int(line.split()[1]) * 1024 for line in f if line.startswith("VmRSS:")
+            )
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            children = [int(child) for child in f.read().split()]
+    except (OSError, StopIteration, ValueError):
+        return None
+    return rss + sum(rss_bytes(child) or 0 for child in children)
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """p50/p95/p99/max/mean of latencies in seconds, reported in ms."""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+    return {
+        "p50": pick(0.50),
+        "p95": pick(0.95),
+        "p99": pick(0.99),
+        "max": ordered[-1] * 1000,
+        "mean": statistics.fmean(ordered) * 1000,
+    }
+
+
+async def run_load(
+    base_url: str,
+    workload: Workload,
+    concurrency: int,
+    duration: float,
+    warmup: float,
+) -> tuple[dict[str, list[float]], dict[str, int], float]:
+    """Drive the addon; returns (latencies per route, errors per route, seconds)."""
+    latencies: dict[str, list[float]] = {route: [] for route in ROUTE_MIX}
+    errors: dict[str, int] = {route: 0 for route in ROUTE_MIX}
+    limits = httpx.Limits(max_connections=concurrency)
+    recording = False
+
+    async def worker(client: httpx.AsyncClient, deadline: float) -> None:
+        while time.monotonic() < deadline:
+            route, path = workload.next()
+            start = time.perf_counter()
+            try:
+                resp = await client.get(path)
+                ok = resp.status_code < 500 and resp.status_code != 429
+            except httpx.HTTPError:
+                ok = False
+            elapsed = time.perf_counter() - start
+            if recording:
+                latencies[route].append(elapsed)
+                if not ok:
+                    errors[route] += 1
+
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=30.0
+    ) as client:
+        if warmup > 0:
+            deadline = time.monotonic() + warmup
+            await asyncio.gather(
+                *(worker(client, deadline) for _ in range(concurrency))
+            )
+        recording = True
+        started = time.monotonic()
+        deadline = started + duration
+        await asyncio.gather(*(worker(client, deadline) for _ in range(concurrency)))
+        elapsed = time.monotonic() - started
+    return latencies, errors, elapsed
+
+
+def wait_ready(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url, timeout=1.0).status_code < 500:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"{url} did not become ready within {timeout}s")
+
+
+@contextmanager
+def spawn(cmd: list[str], env: dict[str, str]) -> Iterator[subprocess.Popen[bytes]]:
+    proc = subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL)
+    try:
+        yield proc
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def upstream_stats(gatus_url: str | None) -> dict[str, Any]:
+    if gatus_url is None:
+        return {}
+    try:
+        data: dict[str, Any] = httpx.get(f"{gatus_url}/__stats", timeout=5).json()
+        return data
+    except (httpx.HTTPError, ValueError):
+        return {}
+
+
+async def sample_rss(pid: int, peak: list[int], interval: float = 0.5) -> None:
+    while True:
+        rss = rss_bytes(pid)
+        if rss is not None:
+            peak[0] = max(peak[0], rss)
+        await asyncio.sleep(interval)
+
+
+def measure(
+    args: argparse.Namespace,
+    base_url: str,
+    pid: int | None,
+    gatus_url: str | None,
+) -> dict[str, Any]:
+    rng = random.Random(args.seed)
+    keys = fleet_keys(args.size)
+    workload = Workload(keys, make_tokens(keys, args.configs, rng), seed=args.seed)
+
+    before = upstream_stats(gatus_url)
+    rss_start = rss_bytes(pid) if pid else None
+    peak = [rss_start or 0]
+
+    async def run() -> tuple[dict[str, list[float]], dict[str, int], float]:
+        sampler = asyncio.create_task(sample_rss(pid, peak)) if pid else None
+        try:
+            return await run_load(
+                base_url, workload, args.concurrency, args.duration, args.warmup
+            )
+        finally:
+            if sampler is not None:
+                sampler.cancel()
+
+    latencies, errors, elapsed = asyncio.run(run())
+    after = upstream_stats(gatus_url)
+
+    all_latencies = [s for samples in latencies.values() for s in samples]
+    total = len(all_latencies)
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "params": {
+            key: value
+            for key, value in vars(args).items()
+            if key not in ("output", "target", "pid")
+        },
+        "duration_seconds": elapsed,
+        "requests": total,
+        "errors": sum(errors.values()),
+        "throughput_rps": total / elapsed if elapsed else 0.0,
+        "latency_ms": percentiles(all_latencies),
+        "routes": {
+            route: {
+                "requests": len(samples),
+                "errors": errors[route],
+                "latency_ms": percentiles(samples),
+            }
+            for route, samples in latencies.items()
+        },
+        "upstream": {
+            "calls": after.get("calls", 0) - before.get("calls", 0),
+            "errors": after.get("errors", 0) - before.get("errors", 0),
+            "bytes": after.get("bytes_sent", 0) - before.get("bytes_sent", 0),
+        }
+        if after
+        else None,
+        "rss_bytes": {
+            "start": rss_start,
+            "end": rss_bytes(pid) if pid else None,
+            "peak": peak[0] or None,
+        },
+    }
+
+
+def print_report(result: dict[str, Any]) -> None:
+    print(
+        f"{result['requests']} requests in {result['duration_seconds']:.1f}s "
+        f"= {result['throughput_rps']:.0f} req/s, {result['errors']} errors"
+    )
+    print(f"{'route':>9} {'requests':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for route, stats in [*result["routes"].items(), ("all", result)]:
+        lat = stats["latency_ms"]
+        if not lat:
+            continue
+        print(
+            f"{route:>9} {stats['requests']:>9} "
+            f"{lat['p50']:>8.2f} {lat['p95']:>8.2f} {lat['p99']:>8.2f}"
+        )
+    if result["upstream"]:
+        up = result["upstream"]
+        print(f"upstream: {up['calls']} Gatus calls, {up['bytes'] / 1024:.0f} KiB")
+    rss = result["rss_bytes"]
+    if rss["peak"]:
+        start, peak = rss["start"] / 2**20, rss["peak"] / 2**20
+        print(f"rss: start {start:.1f} MiB, peak {peak:.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n")[0],
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--target", help="addon base URL (default: start one)")
+    parser.add_argument("--pid", type=int, help="addon PID for RSS with --target")
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--warmup", type=float, default=3.0)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--configs", type=int, default=500, help="distinct tokens")
+    parser.add_argument("--addon-port", type=int, default=7099)
+    parser.add_argument("--gatus-port", type=int, default=8099)
+    parser.add_argument("--output", type=Path, help="result JSON path")
+    add_fleet_args(parser)
+    args = parser.parse_args()
+
+    if args.target:
+        result = measure(args, args.target.rstrip("/"), args.pid, None)
+    else:
+        gatus_url = f"http://127.0.0.1:{args.gatus_port}"
+        base_url = f"http://127.0.0.1:{args.addon_port}"
+        gatus_cmd = [
+            sys.executable,
+            "-m",
+            "benchmarks.fake_gatus",
+            "--port",
+            str(args.gatus_port),
+            "--size",
+            str(args.size),
+            "--results",
+            str(args.results),
+            "--failure-rate",
+            str(args.failure_rate),
+            "--latency-ms",
+            str(args.latency_ms),
+            "--jitter-ms",
+            str(args.jitter_ms),
+            "--error-rate",
+            str(args.error_rate),
+            "--churn-seconds",
+            str(args.churn_seconds),
+            "--seed",
+            str(args.seed),
+        ]
+        env = {
+            **os.environ,
+            "ADDON_HEALTH_BASE_URL": gatus_url,
+            "ADDON_PORT": str(args.addon_port),
+            "ADDON_HOST": "127.0.0.1",
+            "ADDON_LOG_LEVEL": os.environ.get("ADDON_LOG_LEVEL", "warning"),
+        }
+        with spawn(gatus_cmd, env):
+            wait_ready(f"{gatus_url}/__stats")
+            addon_cmd = [sys.executable, "-m", "stremio_status.main"]
+            with spawn(addon_cmd, env) as addon:
+                wait_ready(f"{base_url}/health")
+                result = measure(args, base_url, addon.pid, gatus_url)
+
+    print_report(result)
+    output = args.output or RESULTS_DIR / (
+        f"loadtest-{result['commit'] or 'unknown'}-{int(time.time())}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2) + "\n")
+    print(f"wrote {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""Microbenchmarks for the functions every Stremio request runs.
+
+Times decode_config, the snapshot filters, the ui helpers, the check
+history stats and the build_catalog/build_streams pipelines (dict and
+pydantic paths) at several fleet sizes, and compares them against a saved
+baseline.
+
+Usage:
+    python -m benchmarks.microbench --compare         # fail on regressions
+    python -m benchmarks.microbench --save            # update the baseline
+    python -m benchmarks.microbench --compare --threshold 0.25 --sizes 1000
+
+--compare exits with status 1 if any case is slower than the baseline by
+more than --threshold (a fraction, default 0.2) and by more than
+--min-delta-us microseconds. The default baseline, benchmarks/baseline.json,
+is committed so a local run has something to compare against; re-save it
+with the change when a slowdown is intended. Timings are machine specific,
+so CI records a fresh baseline from the base commit on the same runner and
+compares the pull request against that, or only reports the timings if
+the base commit has no microbenchmarks (see .github/workflows/ci.yml).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import platform
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from benchmarks.fleet import make_fleet
+from stremio_status.clients.gatus_client import GatusClient
+from stremio_status.core import user_config
+from stremio_status.core.history import HistoryStore
+from stremio_status.core.snapshot import StatusSnapshot
+from stremio_status.core.user_config import UserConfig, decode_config
+from stremio_status.services import status_service
+from stremio_status.utils import ui
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+# A case returns a callable to time (sync, or async returning an awaitable)
+Case = Callable[[StatusSnapshot], Callable[[], Any]]
+
+
+def _token(config: dict[str, Any]) -> str:
+    raw = json.dumps(config).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _selection(snapshot: StatusSnapshot, count: int = 20) -> UserConfig:
+    """Config selecting count addons spread over the fleet."""
+    step = max(1, len(snapshot.endpoints) // count)
+    keys = [ep.key for ep in snapshot.endpoints[::step][:count]]
+    return UserConfig(addons=tuple(keys), onlyDown=False, showWatchdog=True)
+
+
+def case_decode_config_hit(snapshot: StatusSnapshot) -> Callable[[], Any]:
+    token = _token({"addons": [ep.key for ep in snapshot.endpoints[:20]]})
+    decode_config(token)
+    return lambda: decode_config(token)
+
+
+def case_decode_config_miss(snapshot: StatusSnapshot) -> Callable[[], Any]:
+    token = _token({"addons": [ep.key for ep in snapshot.endpoints[:20]]})
+    return lambda: user_config._decode(token)
+
+
+def case_filter_selection_all(snapshot: StatusSnapshot) -> Callable[[], Any]:
+    config = UserConfig()
+    return lambda: status_service.filter_by_addon_selection(snapshot, config)
+
+
+def case_filter_selection_20(snapshot: StatusSnapshot) -> Callable[[], Any]:
+    config = _selection(snapshot)
+    return lambda: status_service.filter_by_addon_selection(snapshot, config)
+
+
+def case_filter_by_health(snapshot: StatusSnapshot) -> Callable[[], Any]:
+    endpoints = snapshot.index.ordered
+    return lambda: status_service.filter_by_health(endpoints, True)
+
+
+def case_sort_endpoints(snapshot: StatusSnapshot) -> Callable[[], Any]:
+    endpoints = snapshot.endpoints
+    return lambda: ui.sort_endpoints(endpoints)
+
+
+def case_format_status_desc(snapshot: StatusSnapshot) -> Callable[[], Any]:
+    ep = snapshot.endpoints[0]
+    return lambda: ui.format_status_desc(ep)
+
+
+def case_status_summary(snapshot: StatusSnapshot) -> Callable[[], Any]:
+    endpoints = snapshot.endpoints
+    return lambda: ui.get_status_summary(endpoints)
+
+
+def case_history_stats(snapshot: StatusSnapshot) -> Callable[[], Any]:
+    # A full day of 5-minute checks per endpoint
+    store = HistoryStore(1440)
+    histories = [
+        store.record(ep["key"], ep["results"])
+        for ep in make_fleet(len(snapshot.endpoints), results=288)
+    ]
+    now = time.time()
+    return lambda: [history.stats(now) for history in histories]
+
+
+def case_catalog_dicts(snapshot: StatusSnapshot) -> Callable[[], Any]:
+    config = UserConfig()
+    return lambda: status_service.build_catalog_dicts(config, snapshot)
+
+
+def case_catalog_pydantic(snapshot: StatusSnapshot) -> Callable[[], Any]:
+    config = UserConfig()
+    return lambda: status_service.build_catalog(config, snapshot)
+
+
+def case_streams_dicts(snapshot: StatusSnapshot) -> Callable[[], Any]:
+    config = UserConfig(onlyDown=False, showWatchdog=True)
+    return lambda: status_service.build_stream_dicts(config, snapshot)
+
+
+def case_streams_dicts_20(snapshot: StatusSnapshot) -> Callable[[], Any]:
+    config = _selection(snapshot)
+    return lambda: status_service.build_stream_dicts(config, snapshot)
+
+
+def case_streams_pydantic(snapshot: StatusSnapshot) -> Callable[[], Any]:
+    config = UserConfig(onlyDown=False, showWatchdog=True)
+    return lambda: status_service.build_streams(config, snapshot)
+
+
+CASES: dict[str, Case] = {
+    "decode_config[hit]": case_decode_config_hit,
+    "decode_config[miss]": case_decode_config_miss,
+    "filter_by_addon_selection[all]": case_filter_selection_all,
+    "filter_by_addon_selection[20]": case_filter_selection_20,
+    "filter_by_health": case_filter_by_health,
+    "ui.sort_endpoints": case_sort_endpoints,
+    "ui.format_status_desc": case_format_status_desc,
+    "ui.get_status_summary": case_status_summary,
+    "history.stats[all]": case_history_stats,
+    "build_catalog_dicts[all]": case_catalog_dicts,
+    "build_catalog[all]": case_catalog_pydantic,
+    "build_stream_dicts[all]": case_streams_dicts,
+    "build_stream_dicts[20]": case_streams_dicts_20,
+    "build_streams[all]": case_streams_pydantic,
+}
+
+
+def make_snapshot(size: int) -> StatusSnapshot:
+    client = GatusClient("http://localhost:8080")
+    endpoints = [client._parse_endpoint(ep) for ep in make_fleet(size, results=1)]
+    return StatusSnapshot(endpoints=endpoints, generation=1)
+
+
+async def _time_async(fn: Callable[[], Awaitable[Any]], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        await fn()
+    return time.perf_counter() - start
+
+
+def _time_sync(fn: Callable[[], Any], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return time.perf_counter() - start
+
+
+def time_case(fn: Callable[[], Any], repeat: int, min_time: float) -> float:
+    """Best seconds per call over repeat runs of at least min_time each."""
+    is_async = asyncio.iscoroutine(probe := fn())
+    if is_async:
+        probe.close()
+
+    def run(number: int) -> float:
+        if is_async:
+            return asyncio.run(_time_async(fn, number))
+        return _time_sync(fn, number)
+
+    number = 1
+    while (elapsed := run(number)) < min_time:
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        best = min(best, run(number) / number)
+    return best
+
+
+def run_benchmarks(
+    sizes: list[int], pattern: str | None, repeat: int, min_time: float
+) -> dict[str, float]:
+    """Return {"case@size": seconds per call}."""
+    results: dict[str, float] = {}
+    for size in sizes:
+        snapshot = make_snapshot(size)
+        for name, case in CASES.items():
+            if pattern and pattern not in name:
+                continue
+            key = f"{name}@{size}"
+            results[key] = time_case(case(snapshot), repeat, min_time)
+            print(f"{key:>40} {results[key] * 1e6:>12.2f}us", file=sys.stderr)
+    return results
+
+
+def compare(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    threshold: float,
+    min_delta: float = 0.0,
+) -> list[str]:
+    """Print a comparison table; return the cases that regressed.
+
+    A case regresses if it is slower by more than threshold (relative) and
+    by more than min_delta seconds, so sub-microsecond noise is ignored.
+    """
+    regressions = []
+    print(f"{'case':>40} {'baseline':>12} {'current':>12} {'change':>8}")
+    for key, seconds in results.items():
+        base = baseline.get(key)
+        if base is None:
+            print(f"{key:>40} {'-':>12} {seconds * 1e6:>10.2f}us {'new':>8}")
+            continue
+        change = seconds / base - 1
+        flag = ""
+        if change > threshold and seconds - base > min_delta:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(
+            f"{key:>40} {base * 1e6:>10.2f}us {seconds * 1e6:>10.2f}us "
+            f"{change:>+7.1%}{flag}"
+        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n")[0],
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("-k", dest="pattern", help="only cases containing this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="s per run")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true", help="write the baseline")
+    parser.add_argument("--compare", action="store_true", help="check the baseline")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument(
+        "--min-delta-us", type=float, default=1.0, help="ignore smaller slowdowns"
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.sizes, args.pattern, args.repeat, args.min_time)
+
+    if args.compare:
+        data = json.loads(args.baseline.read_text())
+        regressions = compare(
+            results, data["results"], args.threshold, args.min_delta_us / 1e6
+        )
+        if regressions:
+            print(
+                f"{len(regressions)} case(s) regressed by more than "
+                f"{args.threshold:.0%}: {', '.join(regressions)}"
+            )
+            sys.exit(1)
+        print("No regressions")
+
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        doc = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "results": results,
+        }
+        args.baseline.write_text(json.dumps(doc, indent=2) + "\n")
+        print(f"wrote {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
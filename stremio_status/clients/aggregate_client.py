@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Sequence
+
+from stremio_status.clients.base import StatusSource
+from stremio_status.core import metrics
+from stremio_status.core.history import HistoryStore
+from stremio_status.core.models import EndpointStatus
+
+logger = logging.getLogger(__name__)
+
+SOURCE_FETCH_SECONDS = metrics.histogram(
+    "stremio_status_source_fetch_seconds",
+    "Duration of fetches per aggregated health source by outcome "
+    "(changed, unchanged, error, timeout)",
+    ["source", "outcome"],
+)
+SOURCE_UP = metrics.gauge(
+    "stremio_status_source_up",
+    "Whether the last fetch of an aggregated health source succeeded",
+    ["source"],
+)
+
+
+class AggregateClient(StatusSource):
+    """Merges several health sources (e.g. regional Gatus instances).
+
+    Sources are fetched concurrently, each bounded by its own timeout, so a
+    refresh takes as long as the slowest source that answers in time rather
+    than the sum. A failing source contributes its last good endpoints, so
+    the others keep being served, until it has been failing for
+    max_stale_seconds: its endpoints are then dropped rather than shown with
+    outdated health. Only if all sources fail does the fetch fail.
+
+    Endpoints are tagged with their source name. Keys present in several
+    sources are kept once, from the source listed first.
+    """
+
+    def __init__(
+        self, sources: Sequence[StatusSource], max_stale_seconds: float = 600.0
+    ) -> None:
+        super().__init__(max(source.timeout for source in sources))
+        self.sources = list(sources)
+        self.max_stale_seconds = max_stale_seconds
+        # Last list accepted from each source, to detect "no change"
+        self._parts: list[list[EndpointStatus] | None] = [None] * len(sources)
+        # When each source last answered (time.monotonic())
+        self._answered_at = [0.0] * len(sources)
+
+    async def _fetch(self) -> list[EndpointStatus]:
+        """Fetch all sources and merge them.
+
+        Returns the previous list if no source changed. Raises the first
+        error if no source could be fetched.
+        """
+        results = await asyncio.gather(
+            *(self._fetch_source(source) for source in self.sources),
+            return_exceptions=True,
+        )
+
+        now = time.monotonic()
+        parts: list[list[EndpointStatus] | None] = []
+        errors: list[BaseException] = []
+        for i, (source, result) in enumerate(zip(self.sources, results)):
+            previous = self._parts[i]
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                errors.append(result)
+                failing_for = now - self._answered_at[i]
+                if previous is not None and failing_for > self.max_stale_seconds:
+                    logger.warning(
+                        f"Dropping endpoints of {source.name}, failing for "
+                        f"{failing_for:.0f}s: {result!r}"
+                    )
+                    previous = None
+                elif previous is not None:
+                    logger.warning(
+                        f"Serving last known endpoints of {source.name}: {result!r}"
+                    )
+                parts.append(previous)
+            else:
+                self._answered_at[i] = now
+                parts.append(result)
+        if len(errors) == len(self.sources):
+            raise errors[0]
+
+        if self.last_endpoints is not None and all(
+            part is previous for part, previous in zip(parts, self._parts)
+        ):
+            return self.last_endpoints
+
+        endpoints: list[EndpointStatus] = []
+        seen: set[str] = set()
+        duplicates = 0
+        for part in parts:
+            for ep in part or ():
+                if ep.key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(ep.key)
+                endpoints.append(ep)
+        if duplicates:
+            logger.debug(f"Dropped {duplicates} endpoints with duplicate keys")
+
+        self._parts = parts
+        self.last_endpoints = endpoints
+        logger.debug(
+            f"Merged {len(endpoints)} endpoints from "
+            f"{len(self.sources) - len(errors)}/{len(self.sources)} sources"
+        )
+        return endpoints
+
+    async def _fetch_source(self, source: StatusSource) -> list[EndpointStatus]:
+        """Fetch one source within its timeout, recording its metrics."""
+        name = source.name or ""
+        previous = source.last_endpoints
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            endpoints = await asyncio.wait_for(source._fetch(), source.timeout)
+            outcome = "unchanged" if endpoints is previous else "changed"
+            return endpoints
+        except TimeoutError:
+            outcome = "timeout"
+            raise TimeoutError(
+                f"{name} did not answer within {source.timeout}s"
+            ) from None
+        finally:
+            SOURCE_FETCH_SECONDS.observe(time.perf_counter() - start, name, outcome)
+            SOURCE_UP.set(name, value=0 if outcome in ("error", "timeout") else 1)
+
+    def histories(self) -> list[HistoryStore]:
+        return [store for source in self.sources for store in source.histories()]
+
+    async def close(self) -> None:
+        """Close all sources."""
+        for source in self.sources:
+            await source.close()
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import dataclasses
+import time
+from abc import ABC, abstractmethod
+from typing import Any
+
+from stremio_status.core import metrics
+from stremio_status.core.history import NO_STATS, HistoryStore
+from stremio_status.core.models import EndpointStatus
+from stremio_status.utils import ui
+
+FETCH_SECONDS = metrics.histogram(
+    "stremio_status_gatus_fetch_seconds",
+    "Duration of health data fetches by outcome (changed, unchanged, error)",
+    ["outcome"],
+)
+
+# Unchanged endpoints still get their uptime/latency stats recomputed at
+# this age (seconds), as old samples leave the rolling windows
+STATS_MAX_AGE_SECONDS = 60.0
+
+
+class StatusSource(ABC):
+    """Base of the health data sources (Gatus API, Gatus storage).
+
+    Subclasses implement _fetch(). Records are built from endpoints in the
+    Gatus API format by _parse_endpoint, which also feeds the check history.
+    """
+
+    def __init__(
+        self, timeout: float, history_size: int = 0, name: str | None = None
+    ) -> None:
+        self.timeout = timeout
+        # Tags parsed endpoints (EndpointStatus.source) when aggregated
+        self.name = name
+        # Rolling check history for uptime/latency stats (disabled at 0)
+        self.history = HistoryStore(history_size) if history_size > 0 else None
+        # Last accepted result, returned as-is while the source is unchanged
+        self.last_endpoints: list[EndpointStatus] | None = None
+        # When the stats of last_endpoints were computed (time.time())
+        self._stats_at = 0.0
+
+    async def fetch_statuses(self) -> list[EndpointStatus]:
+        """Fetch health status for all monitored endpoints (timed, see _fetch)."""
+        previous = self.last_endpoints
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            endpoints = await self._fetch()
+            outcome = "unchanged" if endpoints is previous else "changed"
+            return endpoints
+        finally:
+            FETCH_SECONDS.observe(time.perf_counter() - start, outcome)
+
+    @abstractmethod
+    async def _fetch(self) -> list[EndpointStatus]:
+        """Fetch all endpoint records.
+
+        Returns the previous list object if nothing changed, so callers can
+        detect "no change" by identity. Raises on errors.
+        """
+
+    def _unchanged(self) -> list[EndpointStatus]:
+        """The previous list, for a fetch that found nothing new.
+
+        Returned as-is unless its stats are older than STATS_MAX_AGE_SECONDS:
+        then they are recomputed from the history and a new list is returned
+        if any changed, so uptimes decay while a source has no new results.
+        """
+        endpoints = self.last_endpoints
+        assert endpoints is not None
+        now = time.time()
+        if self.history is None or now - self._stats_at < STATS_MAX_AGE_SECONDS:
+            return endpoints
+        self._stats_at = now
+        refreshed = [self._refresh_stats(ep, now) for ep in endpoints]
+        if all(new is old for new, old in zip(refreshed, endpoints)):
+            return endpoints
+        self.last_endpoints = refreshed
+        return refreshed
+
+    def _refresh_stats(self, ep: EndpointStatus, now: float) -> EndpointStatus:
+        """ep with stats recomputed from its history (ep itself if the same)."""
+        assert self.history is not None
+        history = self.history.get(ep.key)
+        stats = history.stats(now) if history is not None else NO_STATS
+        if (
+            stats.uptime_24h == ep.uptime
+            and stats.uptime_1h == ep.uptime_1h
+            and stats.latency_p50 == ep.latency_p50
+            and stats.latency_p95 == ep.latency_p95
+        ):
+            return ep
+        return dataclasses.replace(
+            ep,
+            uptime=stats.uptime_24h,
+            uptime_1h=stats.uptime_1h,
+            latency_p50=stats.latency_p50,
+            latency_p95=stats.latency_p95,
+        )
+
+    def _parse_endpoint(
+        self, ep: dict[str, Any], now: float | None = None
+    ) -> EndpointStatus:
+        """Parse raw Gatus API response into an EndpointStatus record.
+
+        Only the fields the addon uses are read; the results history is
+        never copied, only new results are added to the check history.
+        """
+        healthy, response_ms, last_updated = self._extract_health_data(ep)
+        key = self._generate_key(ep)
+
+        stats = NO_STATS
+        if self.history is not None:
+            history = self.history.record(key, ep.get("results") or [])
+            stats = history.stats(time.time() if now is None else now)
+
+        return EndpointStatus(
+            name=str(ep.get("name") or ""),
+            group=str(ep.get("group") or ""),
+            key=key,
+            healthy=healthy,
+            uptime=stats.uptime_24h,
+            response_time=response_ms,
+            last_updated=last_updated,
+            checked_at=ui.parse_timestamp(last_updated),
+            uptime_1h=stats.uptime_1h,
+            latency_p50=stats.latency_p50,
+            latency_p95=stats.latency_p95,
+            source=self.name,
+        )
+
+    def _extract_health_data(
+        self, ep: dict[str, Any]
+    ) -> tuple[bool, int | None, str | None]:
+        """Extract health status, response time, and last check time.
+
+        Returns (healthy, response_ms, last_updated).
+        """
+        results = ep.get("results") or []
+        if not results:
+            return False, None, None
+
+        last = results[-1]
+        healthy = bool(last.get("success"))
+
+        # Convert nanoseconds to milliseconds
+        duration_ns = last.get("duration")
+        response_ms = (
+            int(duration_ns / 1_000_000)
+            if isinstance(duration_ns, (int, float))
+            else None
+        )
+
+        # Get timestamp from multiple possible fields
+        last_updated = last.get("timestamp") or ep.get("lastUpdated") or ep.get("time")
+
+        return healthy, response_ms, last_updated
+
+    def _generate_key(self, ep: dict[str, Any]) -> str:
+        """Generate unique key for endpoint.
+
+        Uses existing key or creates one from group + name.
+        Replaces '/' and spaces with '-' for URL safety.
+        """
+        if ep.get("key"):
+            return str(ep["key"])
+
+        group = (ep.get("group") or "").replace("/", "-")
+        name = (ep.get("name") or "").replace("/", "-")
+        return f"{group}_{name}".replace(" ", "-")
+
+    def histories(self) -> list[HistoryStore]:
+        """Check histories held by this source (for metrics)."""
+        return [] if self.history is None else [self.history]
+
+    async def close(self) -> None:
+        """Release connections."""
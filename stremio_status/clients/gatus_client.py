@@ -1,113 +1,189 @@
 from __future__ import annotations
 
+import hashlib
 import logging
-
-from typing import Any
+import time
+from collections.abc import Callable
 
 import httpx
 
-from stremio_status.core.config import get_settings
-from stremio_status.core.models import GatusEndpoint
+from stremio_status.clients.aggregate_client import AggregateClient
+from stremio_status.clients.base import StatusSource
+from stremio_status.clients.storage_client import StorageClient
+from stremio_status.core import metrics
+from stremio_status.core.config import HealthSource, get_settings
+from stremio_status.core.history import HistoryStore
+from stremio_status.core.metrics import Samples
+from stremio_status.core.models import EndpointStatus
 
 logger = logging.getLogger(__name__)
 
+FETCH_BYTES = metrics.counter(
+    "stremio_status_gatus_response_bytes_total",
+    "Bytes received from Gatus (as transferred, before decompression)",
+)
+
 
-class GatusClient:
+class GatusClient(StatusSource):
     """Async HTTP client for fetching health data from Gatus API."""
 
-    def __init__(self, base_url: str, timeout: float = 3.0) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 3.0,
+        results_page_size: int = 1,
+        history_size: int = 0,
+        name: str | None = None,
+    ) -> None:
+        super().__init__(timeout, history_size, name)
         self.base_url = base_url.rstrip("/")
-        self.timeout = timeout
+        self.results_page_size = max(1, results_page_size)
+        # httpx negotiates gzip/deflate by default; Gatus compresses API responses
         self._client = httpx.AsyncClient(timeout=timeout)
 
-    async def fetch_statuses(self) -> list[GatusEndpoint]:
+        # Validators of the last accepted response (see StatusSource.last_endpoints)
+        self._digest: bytes | None = None
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+
+    async def _fetch(self) -> list[EndpointStatus]:
         """Fetch health status for all monitored endpoints.
 
-        Returns list of GatusEndpoint models with health data.
+        Returns list of EndpointStatus records with health data.
         Raises httpx.HTTPError on network/API errors.
+
+        Gatus pages the results history of each endpoint (not the endpoint
+        list), newest page first. Only the latest result is shown, so just the
+        first page of results_page_size results is requested instead of the
+        default 20 (or more) per endpoint, sized to hold the checks of one
+        poll interval. New results are added to the history, and its stats
+        computed once here rather than per request.
+
+        If the response is unchanged (304 for our ETag/Last-Modified, or the
+        same body hash), the previous list object is returned without
+        parsing, so callers can detect "no change" by identity (see
+        _unchanged for when its stats are recomputed).
         """
         url = f"{self.base_url}/api/v1/endpoints/statuses"
-        logger.debug(f"Fetching statuses from {url}")
-
-        resp = await self._client.get(url)
+        params = {"page": 1, "pageSize": self.results_page_size}
+        logger.debug(f"Fetching statuses from {url} ({params})")
+
+        headers = {}
+        if self.last_endpoints is not None:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+
+        resp = await self._client.get(url, params=params, headers=headers)
+        FETCH_BYTES.inc(amount=resp.num_bytes_downloaded)
+        if resp.status_code == 304 and self.last_endpoints is not None:
+            logger.debug("Statuses not modified (304)")
+            return self._unchanged()
         resp.raise_for_status()
+
+        digest = hashlib.blake2b(resp.content, digest_size=16).digest()
+        if digest == self._digest and self.last_endpoints is not None:
+            logger.debug("Statuses unchanged (same content hash)")
+            return self._unchanged()
+
         data = resp.json()
 
-        endpoints: list[GatusEndpoint] = []
+        now = time.time()
+        endpoints: list[EndpointStatus] = []
         for ep in data:
-            endpoint = self._parse_endpoint(ep)
+            endpoint = self._parse_endpoint(ep, now)
             endpoints.append(endpoint)
+        if self.history is not None:
+            self.history.retain(ep.key for ep in endpoints)
+
+        self.last_endpoints = endpoints
+        self._stats_at = now
+        self._digest = digest
+        self._etag = resp.headers.get("ETag")
+        self._last_modified = resp.headers.get("Last-Modified")
 
         logger.debug(f"Fetched {len(endpoints)} endpoints")
         return endpoints
 
-    def _parse_endpoint(self, ep: dict[str, Any]) -> GatusEndpoint:
-        """Parse raw Gatus API response into GatusEndpoint model."""
-        healthy, response_ms, last_updated = self._extract_health_data(ep)
-        key = self._generate_key(ep)
-
-        return GatusEndpoint.model_validate(
-            {
-                **ep,
-                "key": key,
-                "healthy": healthy,
-                "responseTime": response_ms,
-                "lastUpdated": last_updated,
-            }
-        )
-
-    def _extract_health_data(
-        self, ep: dict[str, Any]
-    ) -> tuple[bool, int | None, str | None]:
-        """Extract health status, response time, and last check time.
-
-        Returns (healthy, response_ms, last_updated).
-        """
-        results = ep.get("results") or []
-        if not results:
-            return False, None, None
-
-        last = results[-1]
-        healthy = bool(last.get("success"))
-
-        # Convert nanoseconds to milliseconds
-        duration_ns = last.get("duration")
-        response_ms = (
-            int(duration_ns / 1_000_000)
-            if isinstance(duration_ns, (int, float))
-            else None
-        )
-
-        # Get timestamp from multiple possible fields
-        last_updated = last.get("timestamp") or ep.get("lastUpdated") or ep.get("time")
-
-        return healthy, response_ms, last_updated
-
-    def _generate_key(self, ep: dict[str, Any]) -> str:
-        """Generate unique key for endpoint.
-
-        Uses existing key or creates one from group + name.
-        Replaces '/' and spaces with '-' for URL safety.
-        """
-        if ep.get("key"):
-            return str(ep["key"])
-
-        group = (ep.get("group") or "").replace("/", "-")
-        name = (ep.get("name") or "").replace("/", "-")
-        return f"{group}_{name}".replace(" ", "-")
-
     async def close(self) -> None:
         """Close the HTTP client and release connections."""
         await self._client.aclose()
 
 
-_client: GatusClient | None = None
+_client: StatusSource | None = None
+
 
+def get_client() -> StatusSource:
+    """Get or create the singleton health data source.
 
-def get_client() -> GatusClient:
-    """Get or create the singleton Gatus client instance."""
+    The Gatus API client, or a reader of Gatus' storage if health_source is
+    "storage"; with health_sources set, an aggregate of those.
+    """
     global _client
     if _client is None:
         settings = get_settings()
-        _client = GatusClient(str(settings.health_base_url))
+        if settings.health_sources:
+            _client = AggregateClient(
+                [_make_source(source) for source in settings.health_sources],
+                max_stale_seconds=settings.cache_max_stale_seconds,
+            )
+        elif settings.health_source == "storage":
+            _client = StorageClient(
+                settings.storage_url,
+                timeout=settings.storage_timeout_seconds,
+                history_size=settings.history_size,
+            )
+        else:
+            _client = GatusClient(
+                str(settings.health_base_url),
+                results_page_size=settings.results_page_size,
+                history_size=settings.history_size,
+            )
     return _client
+
+
+def _make_source(source: HealthSource) -> StatusSource:
+    """Client for one of health_sources (storage URL or Gatus API)."""
+    settings = get_settings()
+    if source.url.startswith(("postgres://", "postgresql://", "sqlite://")):
+        return StorageClient(
+            source.url,
+            timeout=source.timeout_seconds,
+            history_size=settings.history_size,
+            name=source.name,
+        )
+    return GatusClient(
+        source.url,
+        timeout=source.timeout_seconds,
+        results_page_size=settings.results_page_size,
+        history_size=settings.history_size,
+        name=source.name,
+    )
+
+
+def _history_samples(measure: Callable[[HistoryStore], int]) -> Callable[[], Samples]:
+    def collect() -> Samples:
+        stores = _client.histories() if _client is not None else []
+        if not stores:
+            return []
+        return [((), sum(measure(store) for store in stores))]
+
+    return collect
+
+
+metrics.add_collector(
+    "stremio_status_history_endpoints",
+    "Endpoints with a check history",
+    _history_samples(len),
+)
+metrics.add_collector(
+    "stremio_status_history_samples",
+    "Check results held in the history",
+    _history_samples(HistoryStore.samples),
+)
+metrics.add_collector(
+    "stremio_status_history_memory_bytes",
+    "Memory held by check history arrays",
+    _history_samples(HistoryStore.memory_bytes),
+)
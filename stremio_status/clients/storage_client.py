@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import sqlite3
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from stremio_status.clients.base import StatusSource
+from stremio_status.core.models import EndpointStatus
+
+try:
+    import asyncpg
+
+    HAS_ASYNCPG = True
+except ImportError:  # optional, see the "postgres" extra
+    HAS_ASYNCPG = False
+
+logger = logging.getLogger(__name__)
+
+# Latest result of every endpoint in one statement, on the schema Gatus
+# creates in both Postgres and SQLite. Result ids grow with inserts, so the
+# per-endpoint MAX is the newest result and uses the endpoint_id index.
+LATEST_RESULTS_QUERY = """
+SELECT e.endpoint_key, e.endpoint_name, e.endpoint_group,
+       r.endpoint_result_id, r.success, r.duration, r.timestamp
+FROM endpoints e
+LEFT JOIN endpoint_results r ON r.endpoint_result_id = (
+    SELECT MAX(endpoint_result_id) FROM endpoint_results
+    WHERE endpoint_id = e.endpoint_id
+)
+ORDER BY e.endpoint_id
+"""
+
+# Results added since a result id, for the check history: the latest
+# result per poll would only sample one check per poll interval
+NEW_RESULTS_QUERY = """
+SELECT e.endpoint_key, r.success, r.duration, r.timestamp
+FROM endpoint_results r
+JOIN endpoints e ON e.endpoint_id = r.endpoint_id
+WHERE r.endpoint_result_id > {after}
+ORDER BY r.endpoint_result_id
+"""
+
+Row = tuple[Any, ...]
+
+
+def _format_timestamp(value: datetime | str | None) -> str | None:
+    """Gatus result timestamp (datetime, or text in SQLite) as ISO 8601 UTC."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    else:
+        parsed = value
+    # Gatus stores UTC; Postgres TIMESTAMP columns come back naive
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC).isoformat().replace("+00:00", "Z")
+
+
+class StorageClient(StatusSource):
+    """Reads the latest results straight from Gatus' storage.
+
+    Skips the Gatus API, which serializes the results history of every
+    endpoint: one indexed query returns a row per endpoint. Supports
+    Postgres (postgres://..., needs asyncpg) and SQLite (sqlite:///path,
+    read-only, queried in a worker thread on a connection of its own).
+    """
+
+    def __init__(
+        self,
+        url: str,
+        timeout: float = 3.0,
+        history_size: int = 0,
+        name: str | None = None,
+    ) -> None:
+        super().__init__(timeout, history_size, name)
+        self.url = url
+        parts = urlsplit(url)
+        self.scheme = parts.scheme
+        if self.scheme in ("postgres", "postgresql"):
+            if not HAS_ASYNCPG:
+                raise RuntimeError(
+                    "Reading Postgres storage requires asyncpg "
+                    "(pip install 'stremio-status[postgres]')"
+                )
+        elif self.scheme == "sqlite":
+            # sqlite:///relative/path or sqlite:////absolute/path
+            self.sqlite_path = Path(url.removeprefix("sqlite:///")).resolve()
+        else:
+            raise ValueError(f"Unsupported storage URL scheme: {self.scheme!r}")
+
+        self._pg: Any = None
+        self._rows: list[Row] | None = None
+        # Newest result id read, to add the results since to the history
+        self._last_result_id: int | None = None
+
+    async def _fetch(self) -> list[EndpointStatus]:
+        """Fetch health status for all monitored endpoints.
+
+        Returns the previous list if no endpoint has a new result. With a
+        history, every result since the previous fetch is added to it, not
+        just the latest one.
+        """
+        rows = await self._query(LATEST_RESULTS_QUERY)
+
+        if rows == self._rows and self.last_endpoints is not None:
+            logger.debug("Statuses unchanged (no new results)")
+            return self._unchanged()
+
+        last_result_id = max(
+            (row[3] for row in rows if row[3] is not None), default=None
+        )
+        new_results: dict[str, list[dict[str, Any]]] = {}
+        if (
+            self.history is not None
+            and self._last_result_id is not None
+            and last_result_id is not None
+            and last_result_id > self._last_result_id
+        ):
+            new_results = await self._query_new_results(self._last_result_id)
+
+        now = time.time()
+        endpoints = [
+            self._parse_endpoint(_as_endpoint(row, new_results.get(row[0])), now)
+            for row in rows
+        ]
+        if self.history is not None:
+            self.history.retain(ep.key for ep in endpoints)
+        self.last_endpoints = endpoints
+        self._stats_at = now
+        self._rows = rows
+        self._last_result_id = last_result_id
+        logger.debug(f"Read {len(endpoints)} endpoints from storage")
+        return endpoints
+
+    async def _query_new_results(self, after: int) -> dict[str, list[dict[str, Any]]]:
+        """Results newer than result id after, oldest first, by endpoint key."""
+        rows = await self._query(NEW_RESULTS_QUERY.format(after=int(after)))
+        results: dict[str, list[dict[str, Any]]] = {}
+        for key, success, duration, timestamp in rows:
+            results.setdefault(key, []).append(_as_result(success, duration, timestamp))
+        return results
+
+    async def _query(self, query: str) -> list[Row]:
+        if self.scheme == "sqlite":
+            return await self._query_sqlite(query)
+        return await self._query_postgres(query)
+
+    async def _query_postgres(self, query: str) -> list[Row]:
+        try:
+            if self._pg is None:
+                self._pg = await asyncpg.connect(self.url, timeout=self.timeout)
+            records = await self._pg.fetch(query, timeout=self.timeout)
+        except BaseException:
+            await self._close_postgres()
+            raise
+        return [tuple(record) for record in records]
+
+    async def _query_sqlite(self, query: str) -> list[Row]:
+        """Run query in a worker thread, on a connection used only by it.
+
+        A query still running at the timeout is interrupted; its thread then
+        closes the connection, so no connection is shared with a thread that
+        may still be running.
+        """
+        # Read-only; waits up to timeout while Gatus holds a write lock
+        conn = sqlite3.connect(
+            f"{self.sqlite_path.as_uri()}?mode=ro",
+            uri=True,
+            timeout=self.timeout,
+            check_same_thread=False,
+        )
+        try:
+            return await asyncio.wait_for(
+                asyncio.to_thread(_fetch_all, conn, query), self.timeout
+            )
+        except (TimeoutError, asyncio.CancelledError):
+            # Unless the thread finished (and closed it) meanwhile
+            with contextlib.suppress(sqlite3.ProgrammingError):
+                conn.interrupt()
+            raise
+
+    async def _close_postgres(self) -> None:
+        if self._pg is not None:
+            pg, self._pg = self._pg, None
+            try:
+                await pg.close(timeout=self.timeout)
+            except (
+                OSError,
+                TimeoutError,
+                asyncpg.PostgresError,
+                asyncpg.InterfaceError,
+            ):
+                pg.terminate()
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        await self._close_postgres()
+
+
+def _fetch_all(conn: sqlite3.Connection, query: str) -> list[Row]:
+    """Run query on conn and close it (in the worker thread)."""
+    try:
+        return conn.execute(query).fetchall()
+    finally:
+        conn.close()
+
+
+def _as_result(success: Any, duration: Any, timestamp: Any) -> dict[str, Any]:
+    """Storage result as a result in the Gatus API format."""
+    return {
+        "success": bool(success),
+        "duration": duration,
+        "timestamp": _format_timestamp(timestamp),
+    }
+
+
+def _as_endpoint(
+    row: Row, results: list[dict[str, Any]] | None = None
+) -> dict[str, Any]:
+    """Storage row as an endpoint in the Gatus API format.
+
+    results are the endpoint's results since the previous fetch (oldest
+    first, ending with the row's); just the row's result if not given.
+    """
+    key, name, group, result_id, success, duration, timestamp = row
+    if not results:
+        results = []
+        if result_id is not None:
+            results.append(_as_result(success, duration, timestamp))
+    return {"key": key, "name": name, "group": group, "results": results}
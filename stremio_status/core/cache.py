@@ -1,27 +1,146 @@
 from __future__ import annotations
 
+import asyncio
 import time
-from typing import Any, Optional
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
 
 
 class TTLCache:
-    """Simple in-memory cache with time-to-live expiration."""
+    """Bounded in-memory cache with time-to-live expiration and LRU eviction.
 
-    def __init__(self, ttl_seconds: int) -> None:
+    Expiry uses time.monotonic(), so wall-clock jumps don't expire or revive
+    entries. Expired entries are dropped when read and by a full sweep at
+    most every sweep_interval seconds (run from set()), so keys that are
+    never read again don't pile up. When full, the least recently used
+    entry is evicted.
+
+    Args:
+        ttl_seconds: Default time-to-live; None means entries never expire.
+        max_entries: Size bound.
+        sweep_interval: Seconds between expiry sweeps (default: ttl_seconds).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float | None,
+        max_entries: int = 1024,
+        sweep_interval: float | None = None,
+    ) -> None:
         self.ttl = ttl_seconds
-        self._store: dict[str, tuple[float, Any]] = {}
+        self.max_entries = max(1, max_entries)
+        if sweep_interval is None:
+            sweep_interval = ttl_seconds
+        self.sweep_interval = sweep_interval
+        # key -> (expires at, or None for no expiry; value)
+        self._store: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+        self._next_sweep = time.monotonic() + (self.sweep_interval or 0)
+        self._inflight: dict[Hashable, asyncio.Task[Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
 
-    def get(self, key: str) -> Optional[Any]:
-        """Get value if not expired, None otherwise."""
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get value if not expired (marking it recently used), None otherwise."""
         entry = self._store.get(key)
-        if not entry:
+        if entry is None:
+            self.misses += 1
             return None
         expires, value = entry
-        if time.time() > expires:
-            self._store.pop(key, None)
+        if expires is not None and time.monotonic() >= expires:
+            del self._store[key]
+            self.expirations += 1
+            self.misses += 1
             return None
+        self._store.move_to_end(key)
+        self.hits += 1
         return value
 
-    def set(self, key: str, value: Any) -> None:
-        """Store value with TTL expiration."""
-        self._store[key] = (time.time() + self.ttl, value)
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Store value with TTL expiration (ttl overrides the default).
+
+        Evicts the least recently used entries when full.
+        """
+        now = time.monotonic()
+        ttl = self.ttl if ttl is None else ttl
+        self._store[key] = (None if ttl is None else now + ttl, value)
+        self._store.move_to_end(key)
+
+        if self.sweep_interval is not None and now >= self._next_sweep:
+            self.sweep(now)
+        while len(self._store) > self.max_entries:
+            self._store.popitem(last=False)
+            self.evictions += 1
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: float | None = None,
+    ) -> Any:
+        """Return the cached value, or await compute() and cache its result.
+
+        Concurrent misses for the same key share one compute() call. None
+        results are returned but not cached.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        task = self._inflight.get(key)
+        if task is None:
+
+            async def fill() -> Any:
+                try:
+                    result = await compute()
+                    if result is not None:
+                        self.set(key, result, ttl)
+                    return result
+                finally:
+                    self._inflight.pop(key, None)
+
+            task = asyncio.ensure_future(fill())
+            self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    def sweep(self, now: float | None = None) -> int:
+        """Drop all expired entries. Returns how many were dropped."""
+        now = time.monotonic() if now is None else now
+        expired = [
+            key
+            for key, (expires, _) in self._store.items()
+            if expires is not None and now >= expires
+        ]
+        for key in expired:
+            del self._store[key]
+        self.expirations += len(expired)
+        if self.sweep_interval is not None:
+            self._next_sweep = now + self.sweep_interval
+        return len(expired)
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        self._store.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return size and hit/miss/eviction/expiration counters."""
+        return {
+            "size": len(self._store),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class LRUCache(TTLCache):
+    """Bounded in-memory cache evicting the least recently used entry."""
+
+    def __init__(self, max_entries: int) -> None:
+        super().__init__(None, max_entries)
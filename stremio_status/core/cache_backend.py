@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import secrets
+import time
+from collections.abc import Awaitable, Callable
+from typing import Protocol
+
+from stremio_status.core.cache import TTLCache
+from stremio_status.core.config import get_settings
+
+try:
+    import redis.asyncio as redis
+
+    HAS_REDIS = True
+except ImportError:  # optional, see the "redis" extra
+    HAS_REDIS = False
+
+logger = logging.getLogger(__name__)
+
+Compute = Callable[[], Awaitable[bytes | None]]
+
+
+class CacheBackendError(Exception):
+    """The cache backend could not be reached."""
+
+
+class CacheBackend(Protocol):
+    """Byte-valued cache with per-key TTL and a refresh lock.
+
+    Attributes:
+        shared: True if entries are visible to other replicas, i.e. worth
+            checking before doing expensive work ourselves.
+    """
+
+    shared: bool
+
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    async def get_or_compute(
+        self, key: str, ttl: float, compute: Compute
+    ) -> bytes | None:
+        """Return the cached value, or compute, store and return it.
+
+        compute may return None (e.g. upstream down), which is not cached.
+        """
+        ...
+
+    async def acquire_lock(self, name: str, ttl: float) -> str | None:
+        """Take the named lock for at most ttl seconds.
+
+        Returns a token for release_lock, or None if someone else holds it.
+        """
+        ...
+
+    async def release_lock(self, name: str, token: str) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class MemoryCacheBackend:
+    """In-process backend: every replica caches (and refreshes) on its own."""
+
+    shared = False
+
+    def __init__(self) -> None:
+        # Entries carry their own TTL; sweep expired ones once a minute
+        self._cache = TTLCache(None, sweep_interval=60.0)
+        self._locks: dict[str, tuple[float, str]] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        value = self._cache.get(key)
+        return value if isinstance(value, bytes) else None
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._cache.set(key, value, ttl)
+
+    async def get_or_compute(
+        self, key: str, ttl: float, compute: Compute
+    ) -> bytes | None:
+        value = await self._cache.get_or_compute(key, compute, ttl)
+        return value if isinstance(value, bytes) else None
+
+    async def acquire_lock(self, name: str, ttl: float) -> str | None:
+        now = time.monotonic()
+        held = self._locks.get(name)
+        if held is not None and held[0] > now:
+            return None
+        token = secrets.token_hex(16)
+        self._locks[name] = (now + ttl, token)
+        return token
+
+    async def release_lock(self, name: str, token: str) -> None:
+        held = self._locks.get(name)
+        if held is not None and held[1] == token:
+            del self._locks[name]
+
+    async def close(self) -> None:
+        pass
+
+
+# Delete the lock only if we still own it (it may have expired and been
+# taken over by another replica)
+_RELEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+class RedisCacheBackend:
+    """Backend shared by all replicas through a Redis server (redis.asyncio).
+
+    get_or_compute takes a distributed lock (SET NX PX) around compute, so
+    only one replica refreshes an expired key while the others wait for its
+    result. If the lock holder does not deliver within the lock TTL, the
+    waiters compute themselves.
+    """
+
+    shared = True
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        prefix: str = "",
+        lock_ttl: float = 10.0,
+        poll_interval: float = 0.1,
+    ) -> None:
+        self.client = client
+        self.prefix = prefix
+        self.lock_ttl = lock_ttl
+        self.poll_interval = poll_interval
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            value = await self.client.get(self.prefix + key)
+        except redis.RedisError as e:
+            raise CacheBackendError(str(e)) from e
+        return value if isinstance(value, bytes) else None
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        try:
+            await self.client.set(
+                self.prefix + key, value, px=max(1, int(ttl * 1000))
+            )
+        except redis.RedisError as e:
+            raise CacheBackendError(str(e)) from e
+
+    async def get_or_compute(
+        self, key: str, ttl: float, compute: Compute
+    ) -> bytes | None:
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        lock = f"{key}:lock"
+        token = await self.acquire_lock(lock, self.lock_ttl)
+        if token is None:
+            # Another replica is refreshing: wait for its result
+            deadline = time.monotonic() + self.lock_ttl
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.poll_interval)
+                value = await self.get(key)
+                if value is not None:
+                    return value
+            logger.warning(f"Timed out waiting for another replica to fill {key}")
+
+        try:
+            value = await compute()
+            if value is not None:
+                try:
+                    await self.set(key, value, ttl)
+                except CacheBackendError as e:
+                    logger.warning(f"Failed to store {key} in cache backend: {e}")
+            return value
+        finally:
+            if token is not None:
+                await self.release_lock(lock, token)
+
+    async def acquire_lock(self, name: str, ttl: float) -> str | None:
+        token = secrets.token_hex(16)
+        try:
+            acquired = await self.client.set(
+                self.prefix + name, token, px=max(1, int(ttl * 1000)), nx=True
+            )
+        except redis.RedisError as e:
+            raise CacheBackendError(str(e)) from e
+        return token if acquired else None
+
+    async def release_lock(self, name: str, token: str) -> None:
+        try:
+            await self.client.eval(_RELEASE_SCRIPT, 1, self.prefix + name, token)
+        except redis.RedisError as e:
+            # The lock expires on its own
+            logger.warning(f"Failed to release lock {name}: {e}")
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+_backend: CacheBackend | None = None
+
+
+def get_cache_backend() -> CacheBackend:
+    """Get or create the cache backend selected by settings.cache_backend."""
+    global _backend
+    if _backend is None:
+        settings = get_settings()
+        if settings.cache_backend == "redis":
+            if not HAS_REDIS:
+                raise RuntimeError(
+                    "The redis cache backend requires redis "
+                    "(pip install 'stremio-status[redis]')"
+                )
+            # Connections are pooled and re-opened after failures; rediss://
+            # URLs use TLS. RESP2 works with every Redis-compatible server
+            client = redis.Redis.from_url(
+                settings.redis_url,
+                protocol=2,
+                socket_timeout=settings.redis_timeout_seconds,
+                socket_connect_timeout=settings.redis_timeout_seconds,
+            )
+            _backend = RedisCacheBackend(
+                client,
+                prefix=settings.cache_key_prefix,
+                lock_ttl=settings.cache_lock_ttl_seconds,
+            )
+        else:
+            _backend = MemoryCacheBackend()
+    return _backend
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from stremio_status.core.models import EndpointStatus
+from stremio_status.core.snapshot import StatusSnapshot
+
+# Upper bounds (ms) of the latency buckets; moving within a bucket is not
+# a change, so latency jitter doesn't flood the feed
+LATENCY_BUCKETS_MS = (100, 300, 1000, 3000)
+
+
+def latency_bucket(response_time: float | None) -> int:
+    """Index of the latency bucket of a response time (-1 if unknown)."""
+    if response_time is None:
+        return -1
+    return bisect_right(LATENCY_BUCKETS_MS, response_time)
+
+
+def _signature(ep: EndpointStatus) -> tuple[bool, int, str | None]:
+    return ep.healthy, latency_bucket(ep.response_time), ep.last_updated
+
+
+@dataclass(frozen=True, slots=True)
+class Change:
+    """Keys that changed (or disappeared) from one snapshot to the next.
+
+    Snapshots are identified by (origin, generation), as generations are
+    numbered by the process that built the snapshot.
+    """
+
+    previous_origin: str
+    previous: int
+    origin: str
+    generation: int
+    keys: frozenset[str]
+
+
+class ChangeLog:
+    """Bounded log of per-generation endpoint changes.
+
+    Each accepted snapshot is diffed once against the one it replaces, so
+    clients asking what changed since a generation get the union of a few
+    entries instead of diffing the fleet themselves. Entries form one
+    unbroken chain up to the newest snapshot; a gap (e.g. a restored or
+    renumbered snapshot) clears the log. Workers that adopt the same
+    snapshots log the same chain, so any of them can answer for it.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._entries: deque[Change] = deque(maxlen=max(1, max_entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def record(
+        self,
+        previous: StatusSnapshot | None,
+        snapshot: StatusSnapshot,
+        keys: Iterable[str] | None = None,
+    ) -> None:
+        """Log the change from previous to snapshot.
+
+        keys are the changed keys if already known (pushed transitions);
+        otherwise both snapshots are diffed.
+        """
+        if previous is None or previous.generation >= snapshot.generation:
+            self._entries.clear()
+            return
+        if self._entries:
+            last = self._entries[-1]
+            if (last.origin, last.generation) != (previous.origin, previous.generation):
+                self._entries.clear()
+        if keys is None:
+            keys = _diff(previous.endpoints, snapshot.endpoints)
+        self._entries.append(
+            Change(
+                previous.origin,
+                previous.generation,
+                snapshot.origin,
+                snapshot.generation,
+                frozenset(keys),
+            )
+        )
+
+    def since(
+        self, origin: str, generation: int, current: StatusSnapshot
+    ) -> set[str] | None:
+        """Keys changed from the snapshot (origin, generation) up to current.
+
+        None if the log doesn't reach back to that snapshot (or not up to
+        current): the client has to resync from the full list.
+        """
+        if (origin, generation) == (current.origin, current.generation):
+            return set()
+        if not self._entries:
+            return None
+        last = self._entries[-1]
+        if (last.origin, last.generation) != (current.origin, current.generation):
+            return None
+        keys: set[str] = set()
+        # Generations only grow along the chain
+        for change in reversed(self._entries):
+            keys |= change.keys
+            if change.previous == generation:
+                return keys if change.previous_origin == origin else None
+            if change.previous < generation:
+                break
+        return None
+
+
+def _diff(old: list[EndpointStatus], new: list[EndpointStatus]) -> set[str]:
+    """Keys whose health, latency bucket or check time differ, or that were
+    added or removed."""
+    before = {ep.key: ep for ep in old}
+    changed = set()
+    for ep in new:
+        prior = before.pop(ep.key, None)
+        if prior is ep:
+            continue
+        if prior is None or _signature(prior) != _signature(ep):
+            changed.add(ep.key)
+    changed.update(before)
+    return changed
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from enum import Enum
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop calling a failing upstream and probe it with exponential backoff.
+
+    - Closed: calls pass through; consecutive failures are counted.
+    - Open: after failure_threshold failures, calls are rejected until the
+      backoff delay expires.
+    - Half-open: a single probe call is let through. Success closes the
+      circuit, failure re-opens it with the backoff doubled (capped at
+      max_backoff_seconds).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        backoff_seconds: float = 5.0,
+        max_backoff_seconds: float = 300.0,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._trips = 0
+        self._retry_at = 0.0
+
+    def is_closed(self) -> bool:
+        return self.state is CircuitState.CLOSED
+
+    def retry_in(self) -> float:
+        """Seconds until the next half-open probe is allowed (0 if closed)."""
+        if self.state is not CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._retry_at - time.monotonic())
+
+    def allow(self) -> bool:
+        """Check whether a call may go through right now."""
+        if self.state is CircuitState.CLOSED:
+            return True
+        if self.state is CircuitState.OPEN and time.monotonic() >= self._retry_at:
+            logger.info(f"Circuit '{self.name}' half-open, probing upstream")
+            self.state = CircuitState.HALF_OPEN
+            return True
+        # Open and still backing off, or a half-open probe is already running
+        return False
+
+    def record_success(self) -> None:
+        if self.state is not CircuitState.CLOSED:
+            logger.info(f"Circuit '{self.name}' closed, upstream recovered")
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._trips = 0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if (
+            self.state is CircuitState.HALF_OPEN
+            or self.failures >= self.failure_threshold
+        ):
+            delay = min(
+                self.max_backoff_seconds, self.backoff_seconds * 2**self._trips
+            )
+            if 0 < delay < self.max_backoff_seconds:
+                # Past the cap 2**trips would only grow (until it overflows)
+                self._trips += 1
+            self._retry_at = time.monotonic() + delay
+            self.state = CircuitState.OPEN
+            logger.warning(
+                f"Circuit '{self.name}' open after {self.failures} failures, "
+                f"retrying in {delay:.0f}s"
+            )
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn() through the breaker.
+
+        Raises CircuitOpenError without calling fn() if the circuit is open.
+        Exceptions from fn() are recorded as failures and re-raised.
+        """
+        if not self.allow():
+            raise CircuitOpenError(
+                f"Circuit '{self.name}' is open, retry in {self.retry_in():.0f}s"
+            )
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # A cancelled probe proves nothing; let the next call probe again
+            if self.state is CircuitState.HALF_OPEN:
+                self.state = CircuitState.OPEN
+            raise
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+        return result
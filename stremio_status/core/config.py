@@ -1,10 +1,26 @@
 from __future__ import annotations
 
+import math
 from functools import lru_cache
+from pathlib import Path
+from typing import Literal
 
-from pydantic import AnyHttpUrl
+from pydantic import AnyHttpUrl, BaseModel, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Largest results page the Gatus API serves
+MAX_RESULTS_PAGE_SIZE = 100
+
+
+class HealthSource(BaseModel):
+    """One of several status pages aggregated into one snapshot."""
+
+    # Tags its endpoints; listed first, a source wins duplicate keys
+    name: str
+    # Gatus API base URL, or a storage URL (postgres://..., sqlite:///...)
+    url: str
+    timeout_seconds: float = 3.0
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -19,9 +35,134 @@ class Settings(BaseSettings):
     port: int = 7000
     log_level: str = "info"
 
+    # Uvicorn worker processes; with more than one, a single leader polls
+    # Gatus and shares snapshots with the others through snapshot_path
+    workers: int = 1
+    share_poll_interval_seconds: float = 1.0
+    # Uvicorn event loop ("auto", "asyncio", "uvloop") and HTTP parser
+    # ("auto", "h11", "httptools"); "auto" prefers uvloop/httptools
+    loop: str = "auto"
+    http: str = "auto"
+
+    # Expose Prometheus metrics on /metrics (and time every request)
+    metrics_enabled: bool = True
+    # Break Stremio responses down by phase in a Server-Timing header
+    server_timing: bool = True
+    # Requests sending this token in X-Profile-Token are profiled (sampling
+    # the event loop every profiling_interval_seconds); the profile is stored
+    # in profiling_dir, or returned instead of the response if unset
+    profiling_token: str | None = None
+    profiling_interval_seconds: float = 0.001
+    profiling_dir: Path | None = None
+
     health_base_url: AnyHttpUrl = AnyHttpUrl("http://localhost:8080")
     public_base_url: AnyHttpUrl = AnyHttpUrl("http://localhost:7000")
     cache_ttl_seconds: int = 45
+    # Where health data is read from: the Gatus API at health_base_url, or
+    # Gatus' storage database at storage_url (postgres://... or
+    # sqlite:///path/to/data.db), which skips serializing result histories
+    health_source: Literal["api", "storage"] = "api"
+    storage_url: str = "sqlite:///data/data.db"
+    storage_timeout_seconds: float = 3.0
+    # Several status pages (e.g. one per region), fetched concurrently and
+    # merged into one snapshot; replaces the above when set (JSON list)
+    health_sources: list[HealthSource] = []
+    # Results per endpoint requested from Gatus (the latest one is shown, all
+    # new ones are added to the history); unset, enough to cover one poll
+    # interval at the given check interval (see results_page_size)
+    gatus_results_page_size: int | None = None
+    gatus_check_interval_seconds: float = 60.0
+    # Check results kept per endpoint for rolling uptime and latency
+    # percentiles (13 bytes each, see core/history.py); 0 disables
+    history_size: int = 1440
+
+    # Background refresh: snapshots older than cache_ttl_seconds are served
+    # while a refresh runs; older than cache_max_stale_seconds, requests wait
+    background_refresh: bool = True
+    refresh_interval_seconds: int = 40
+    cache_max_stale_seconds: int = 600
+
+    # Gatus pushes health changes (custom alerts / external endpoint
+    # results) with this bearer token; enabled when set. Polling then only
+    # reconciles every reconcile_interval_seconds
+    ingest_token: str | None = None
+    reconcile_interval_seconds: int = 300
+
+    # Circuit breaker around Gatus fetches; the last good snapshot is served
+    # (flagged stale) while the circuit is open
+    breaker_failure_threshold: int = 3
+    breaker_backoff_seconds: float = 5.0
+    breaker_max_backoff_seconds: float = 300.0
+
+    # Max serialized catalog/meta/stream bodies kept per snapshot generation
+    response_cache_max_entries: int = 2048
+    # Snapshot generations whose changed keys are kept for /api/changes;
+    # clients further behind get the full list
+    change_log_size: int = 256
+
+    # Decoded config tokens are memoized; oversized tokens fall back to defaults
+    config_cache_size: int = 1024
+    config_token_max_length: int = 4096
+    config_max_addons: int = 512
+
+    # Render responses from plain dicts (and orjson if installed); disable to
+    # go through the pydantic models, e.g. to verify identical output
+    fast_serialization: bool = True
+
+    # Persist accepted snapshots here and serve them (flagged stale) on startup
+    # until the first live refresh; disabled when unset
+    snapshot_path: Path | None = None
+    snapshot_mmap: bool = True
+
+    # Where snapshots are cached: "memory" (per process) or "redis" (shared by
+    # all replicas, so only one of them polls Gatus per cache_ttl_seconds)
+    cache_backend: Literal["memory", "redis"] = "memory"
+    redis_url: str = "redis://localhost:6379/0"
+    redis_timeout_seconds: float = 1.0
+    cache_key_prefix: str = "stremio-status:"
+    # Max time one replica may hold the refresh lock before others take over
+    cache_lock_ttl_seconds: float = 10.0
+
+    @field_validator("health_sources")
+    @classmethod
+    def _unique_source_names(cls, sources: list[HealthSource]) -> list[HealthSource]:
+        names = [source.name for source in sources]
+        if len(set(names)) != len(names):
+            raise ValueError("health source names must be unique")
+        return sources
+
+    @property
+    def snapshot_ttl_seconds(self) -> int:
+        """Snapshot age after which Gatus is polled again.
+
+        With push ingestion, pushes keep the snapshot current and polling
+        only reconciles; otherwise cache_ttl_seconds.
+        """
+        if self.ingest_token:
+            return self.reconcile_interval_seconds
+        return self.cache_ttl_seconds
+
+    @property
+    def poll_interval_seconds(self) -> int:
+        """Interval of the background Gatus poll."""
+        if self.ingest_token:
+            return self.reconcile_interval_seconds
+        return self.refresh_interval_seconds
+
+    @property
+    def results_page_size(self) -> int:
+        """Results per endpoint requested from Gatus per poll.
+
+        gatus_results_page_size if set; otherwise the checks that fit in a
+        poll interval plus one, so every check reaches the history (within
+        Gatus' page size limit of 100).
+        """
+        if self.gatus_results_page_size is not None:
+            return self.gatus_results_page_size
+        checks = self.poll_interval_seconds / max(
+            1.0, self.gatus_check_interval_seconds
+        )
+        return min(MAX_RESULTS_PAGE_SIZE, math.ceil(checks) + 1)
 
 
 @lru_cache(maxsize=1)
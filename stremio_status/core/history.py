@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from stremio_status.utils import ui
+
+HOUR = 3600
+DAY = 86400
+
+# Bytes per sample: uint32 timestamp, float32 duration, success byte, and
+# the float32 copy in the sorted latency window
+SAMPLE_BYTES = array("I").itemsize + 2 * array("f").itemsize + 1
+
+
+@dataclass(frozen=True, slots=True)
+class EndpointStats:
+    """Rolling uptime (0-1) and latency percentiles (ms) of one endpoint.
+
+    Uptimes are None when the window has no samples; percentiles cover the
+    last 24h and are None when no sample has a duration.
+    """
+
+    uptime_1h: float | None
+    uptime_24h: float | None
+    latency_p50: float | None
+    latency_p95: float | None
+
+
+NO_STATS = EndpointStats(None, None, None, None)
+
+
+def _percentile(ordered: array[float], q: float) -> float:
+    """Nearest-rank percentile of a sorted, non-empty list."""
+    return ordered[max(1, math.ceil(len(ordered) * q)) - 1]
+
+
+class EndpointHistory:
+    """Bounded check history of one endpoint in parallel fixed-width arrays.
+
+    Samples are kept oldest first as whole-second timestamps, durations in
+    ms (-1 if unknown) and success bytes; no object per sample. Once
+    capacity is reached the oldest samples are dropped, so memory per
+    endpoint is at most capacity * SAMPLE_BYTES.
+
+    The known durations of the last 24h are also kept sorted, maintained
+    as samples enter and leave the window, so stats() never sorts: uptimes
+    are a bisect plus a byte count and percentiles a direct index.
+    """
+
+    __slots__ = (
+        "_last_raw",
+        "_sorted",
+        "_window_start",
+        "capacity",
+        "durations",
+        "successes",
+        "timestamps",
+    )
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.timestamps = array("I")
+        self.durations = array("f")
+        self.successes = bytearray()
+        # Known durations of samples from _window_start on, sorted
+        self._sorted = array("f")
+        self._window_start = 0
+        # Raw timestamp of the newest sample, to skip known results cheaply
+        self._last_raw: str | None = None
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def memory_bytes(self) -> int:
+        return len(self) * SAMPLE_BYTES
+
+    def add_results(self, results: list[dict[str, Any]]) -> int:
+        """Append the Gatus results (oldest first) not seen yet.
+
+        Results are matched on their raw timestamp, so only new ones are
+        parsed; results not newer than the latest sample (e.g. seen again
+        after a gap in the pages) are skipped. Returns the number of samples
+        added.
+        """
+        new = []
+        for result in reversed(results):
+            raw = result.get("timestamp")
+            if not raw:
+                continue
+            if raw == self._last_raw:
+                break
+            new.append(result)
+        if not new:
+            return 0
+
+        latest = self.timestamps[-1] if self.timestamps else 0
+        added = 0
+        for result in reversed(new):
+            checked_at = ui.parse_timestamp(result["timestamp"])
+            if checked_at is None or int(checked_at) <= latest:
+                continue
+            duration = result.get("duration")
+            self.timestamps.append(int(checked_at))
+            self.durations.append(
+                duration / 1_000_000 if isinstance(duration, (int, float)) else -1.0
+            )
+            self.successes.append(1 if result.get("success") else 0)
+            if self.durations[-1] >= 0:
+                insort(self._sorted, self.durations[-1])
+            latest = int(checked_at)
+            added += 1
+        self._last_raw = new[0]["timestamp"]
+
+        excess = len(self.timestamps) - self.capacity
+        if excess > 0:
+            self._leave_window(excess)
+            del self.timestamps[:excess]
+            del self.durations[:excess]
+            del self.successes[:excess]
+            self._window_start -= excess
+        return added
+
+    def _leave_window(self, end: int) -> None:
+        """Remove samples before index end from the sorted latency window."""
+        for i in range(self._window_start, end):
+            duration = self.durations[i]
+            if duration >= 0:
+                del self._sorted[bisect_left(self._sorted, duration)]
+        self._window_start = max(self._window_start, end)
+
+    def stats(self, now: float) -> EndpointStats:
+        """Uptime over the last hour and day and p50/p95 latency over the day."""
+        total = len(self.timestamps)
+        hour = bisect_left(self.timestamps, now - HOUR)
+        day = bisect_left(self.timestamps, now - DAY)
+        self._leave_window(day)
+
+        ok = self.successes
+        uptime_1h = ok.count(1, hour) / (total - hour) if hour < total else None
+        uptime_24h = ok.count(1, day) / (total - day) if day < total else None
+        latencies = self._sorted
+        if not latencies:
+            return EndpointStats(uptime_1h, uptime_24h, None, None)
+        return EndpointStats(
+            uptime_1h,
+            uptime_24h,
+            _percentile(latencies, 0.5),
+            _percentile(latencies, 0.95),
+        )
+
+
+class HistoryStore:
+    """Check histories of all endpoints, by endpoint key."""
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._histories: dict[str, EndpointHistory] = {}
+
+    def record(self, key: str, results: list[dict[str, Any]]) -> EndpointHistory:
+        """Add new results of an endpoint and return its history."""
+        history = self._histories.get(key)
+        if history is None:
+            history = self._histories[key] = EndpointHistory(self.capacity)
+        history.add_results(results)
+        return history
+
+    def get(self, key: str) -> EndpointHistory | None:
+        return self._histories.get(key)
+
+    def retain(self, keys: Iterable[str]) -> None:
+        """Forget endpoints that are no longer monitored."""
+        keep = set(keys)
+        for key in [key for key in self._histories if key not in keep]:
+            del self._histories[key]
+
+    def __len__(self) -> int:
+        return len(self._histories)
+
+    def samples(self) -> int:
+        return sum(len(h) for h in self._histories.values())
+
+    def memory_bytes(self) -> int:
+        """Bytes held by sample arrays (bounded by capacity per endpoint)."""
+        return self.samples() * SAMPLE_BYTES
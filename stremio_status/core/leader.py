@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+
+try:
+    import fcntl
+
+    HAS_FCNTL = True
+except ImportError:  # Windows: no flock, every process acts as leader
+    HAS_FCNTL = False
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderLock:
+    """Elect one process on the host as leader via an exclusive file lock.
+
+    The lock is non-blocking: followers simply retry later. The OS releases
+    it when the leader process exits, so a follower takes over on its next
+    attempt.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._fd: int | None = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._fd is not None or not HAS_FCNTL
+
+    def try_acquire(self) -> bool:
+        """Become leader if nobody else is. Returns whether we are leader."""
+        if self.is_leader:
+            return True
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+
+        self._fd = fd
+        logger.info(f"Process {os.getpid()} is now the leader")
+        return True
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+
+
+class FileLock:
+    """Exclusive, blocking file lock shared by the workers on a host.
+
+    Serializes read-modify-writes of a shared file (e.g. applying a push to
+    the shared snapshot). acquire() blocks, so call it off the event loop.
+    Without flock it does nothing.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._fd: int | None = None
+
+    def acquire(self) -> None:
+        if not HAS_FCNTL or self._fd is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
@@ -0,0 +1,271 @@
+"""Minimal Prometheus metrics (text exposition format 0.0.4).
+
+Metrics are plain Python counters updated inline on the hot path (a dict
+lookup and an addition, no locks: everything runs on the event loop).
+Values owned by other components (cache stats, snapshot age, ...) are read
+by collectors registered with add_collector() only when /metrics is scraped.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+
+# (labels, value) samples of one metric
+Samples = Iterable[tuple[tuple[str, ...], float]]
+
+# Default latency buckets in seconds
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _header(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+    def samples(self) -> Samples:
+        return ()
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for labels, value in self.samples():
+            lines.append(
+                f"{self.name}{_format_labels(self.labelnames, labels)} "
+                f"{_format_value(value)}"
+            )
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label combination."""
+
+    kind = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> Samples:
+        return list(self._values.items())
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, *labels: str, value: float) -> None:
+        self._values[labels] = value
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class CallbackMetric(_Metric):
+    """Gauge or counter whose samples are produced at scrape time."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        collect: Callable[[], Samples],
+        labelnames: Sequence[str] = (),
+        kind: str = "gauge",
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.kind = kind
+        self._collect = collect
+
+    def samples(self) -> Samples:
+        return self._collect()
+
+
+class Histogram(_Metric):
+    """Cumulative histogram with fixed buckets per label combination."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (+Inf last)..., sum]
+        self._values: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._values.get(labels)
+        if series is None:
+            series = self._values[labels] = [0.0] * (len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, *labels: str) -> int:
+        series = self._values.get(labels)
+        return 0 if series is None else int(sum(series[:-1]))
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        names = (*self.labelnames, "le")
+        bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+        for labels, series in self._values.items():
+            cumulative = 0.0
+            for bound, count in zip(bounds, series):
+                cumulative += count
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(names, (*labels, bound))} "
+                    f"{_format_value(cumulative)}"
+                )
+            suffix = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{suffix} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{suffix} {_format_value(cumulative)}")
+        return lines
+
+
+class Registry:
+    """Ordered collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+    metric = Counter(name, documentation, labelnames)
+    registry.register(metric)
+    return metric
+
+
+def gauge(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+    metric = Gauge(name, documentation, labelnames)
+    registry.register(metric)
+    return metric
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str] = (),
+    buckets: Sequence[float] = LATENCY_BUCKETS,
+) -> Histogram:
+    metric = Histogram(name, documentation, labelnames, buckets)
+    registry.register(metric)
+    return metric
+
+
+def add_collector(
+    name: str,
+    documentation: str,
+    collect: Callable[[], Samples],
+    labelnames: Sequence[str] = (),
+    kind: str = "gauge",
+) -> None:
+    """Register a metric whose samples are computed by collect() on scrape."""
+    registry.register(CallbackMetric(name, documentation, collect, labelnames, kind))
+
+
+# In-memory caches reported by the cache collectors: name -> stats()
+_caches: dict[str, Callable[[], dict[str, int]]] = {}
+
+
+def track_cache(name: str, stats: Callable[[], dict[str, int]]) -> None:
+    """Report a cache's stats() counters (hits, misses, ...) on /metrics."""
+    _caches[name] = stats
+
+
+def _cache_samples(field: str) -> Callable[[], Samples]:
+    def collect() -> Samples:
+        return [
+            ((name,), stats().get(field, 0)) for name, stats in list(_caches.items())
+        ]
+
+    return collect
+
+
+for _field, _kind in (
+    ("hits", "counter"),
+    ("misses", "counter"),
+    ("evictions", "counter"),
+    ("expirations", "counter"),
+    ("size", "gauge"),
+):
+    _suffix = "_total" if _kind == "counter" else "_entries"
+    add_collector(
+        f"stremio_status_cache_{_field}{_suffix}",
+        f"In-memory cache {_field}",
+        _cache_samples(_field),
+        ["cache"],
+        _kind,
+    )
@@ -1,20 +1,51 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
 
-class GatusEndpoint(BaseModel):
-    """Health status of a monitored endpoint from Gatus."""
+@dataclass(slots=True)
+class EndpointStatus:
+    """Latest health status of a monitored endpoint (internal record).
+
+    Built directly from the fields the addon uses, without validation or
+    copying the raw Gatus payload, so refreshing large fleets stays cheap.
+    Not frozen, as that about doubles the construction cost; records are
+    shared by snapshots, so never modify one (use dataclasses.replace).
+    """
 
     name: str
     group: str
     key: str
     healthy: bool
-    uptime: Optional[float] = None
-    response_time: Optional[float] = Field(default=None, alias="responseTime")
-    last_updated: Optional[str] = Field(default=None, alias="lastUpdated")
+    # Share of successful checks (0-1) over the last 24h
+    uptime: float | None = None
+    response_time: float | None = None
+    last_updated: str | None = None
+    # last_updated as a Unix timestamp, parsed once at ingest (None if
+    # missing or not a timezone-aware ISO timestamp)
+    checked_at: float | None = None
+    # Rolling stats from the check history (see core/history.py); None
+    # until there are samples for the window
+    uptime_1h: float | None = None
+    latency_p50: float | None = None
+    latency_p95: float | None = None
+    # Name of the status page this came from when several are aggregated
+    source: str | None = None
+
+
+class AlertEvent(BaseModel):
+    """Health change pushed by a Gatus custom alert (see the README template).
+
+    status is Gatus' [ALERT_TRIGGERED_OR_RESOLVED] placeholder.
+    """
+
+    name: str | None = None
+    group: str | None = None
+    key: str | None = None
+    status: str
 
 
 class StremioManifest(BaseModel):
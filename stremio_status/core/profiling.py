@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType, TracebackType
+from typing import Self
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    filename = os.path.basename(code.co_filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Sampling profiler for one thread, built on sys._current_frames().
+
+    A background thread records the target thread's stack every interval
+    seconds, so the profiled code runs unmodified (no tracing hooks) and the
+    cost is bounded by the sampling rate. Profiling the event loop thread
+    covers everything it runs meanwhile: time spent waiting (e.g. on Gatus)
+    shows up in the selector, and concurrent requests appear too.
+
+    Use as a context manager; the result is available via collapsed().
+    """
+
+    def __init__(self, thread_id: int | None = None, interval: float = 0.001) -> None:
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = max(0.0001, interval)
+        self.samples: Counter[tuple[str, ...]] = Counter()
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started = 0.0
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.perf_counter() - self._started
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                self.samples[tuple(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        """Samples in collapsed-stack format (one "root;...;leaf count" per line).
+
+        Loadable by flamegraph.pl, speedscope and most flame graph viewers.
+        """
+        lines = [
+            f"{';'.join(stack)} {count}" for stack, count in self.samples.most_common()
+        ]
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+
+class SingleFlight[T]:
+    """Coalesce concurrent calls for the same key into one in-flight task.
+
+    The first caller for a key starts the work; every caller arriving while
+    it runs awaits the same task instead of starting its own.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Task[T]] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def start(
+        self, key: str, fn: Callable[[], Coroutine[Any, Any, T]]
+    ) -> asyncio.Task[T]:
+        """Return the in-flight task for key, starting fn() if there is none."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return task
+
+        self.calls += 1
+        task = asyncio.create_task(fn())
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task
+
+    async def do(self, key: str, fn: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Await the shared result for key.
+
+        The shared task is shielded so one cancelled waiter doesn't cancel
+        the work for everybody else.
+        """
+        return await asyncio.shield(self.start(key, fn))
+
+    def in_flight(self) -> int:
+        """Number of keys with work currently running."""
+        return len(self._inflight)
+
+    def stats(self) -> dict[str, int]:
+        """Return counters for started calls and coalesced waiters."""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": self.in_flight(),
+        }
+
+    def cancel_all(self) -> list[asyncio.Task[T]]:
+        """Cancel all in-flight tasks and return them for awaiting."""
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        return tasks
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from stremio_status.core.models import EndpointStatus
+from stremio_status.utils import ui
+
+
+class EndpointIndex:
+    """Lookup structures built once per snapshot so requests never scan the fleet.
+
+    Attributes:
+        ordered: All endpoints in ui.sort_endpoints order (down first, by name).
+        unhealthy: Unhealthy endpoints, in display order.
+        healthy: Healthy endpoints, in display order.
+
+    Display strings (ui.EndpointText) are built here too, see text(); those
+    of endpoints also in a previous index are reused.
+    The lists are shared between requests and must not be mutated.
+    """
+
+    __slots__ = (
+        "_by_id",
+        "_by_lower",
+        "_rank",
+        "_texts",
+        "healthy",
+        "ordered",
+        "unhealthy",
+    )
+
+    def __init__(
+        self, endpoints: list[EndpointStatus], previous: EndpointIndex | None = None
+    ) -> None:
+        self.ordered = ui.sort_endpoints(endpoints)
+        self.unhealthy = [ep for ep in self.ordered if not ep.healthy]
+        self.healthy = [ep for ep in self.ordered if ep.healthy]
+
+        self._rank = {id(ep): i for i, ep in enumerate(self.ordered)}
+        # Endpoints carried over from a previous index keep their strings
+        reused: dict[int, ui.EndpointText] = {}
+        if previous is not None:
+            reused = previous._texts
+        self._texts: dict[int, ui.EndpointText] = {
+            id(ep): reused.get(id(ep)) or ui.EndpointText(ep) for ep in endpoints
+        }
+
+        # Exact key/name -> candidates in fetch order (meta lookup), and
+        # lowercase key/name -> endpoints (addon selection)
+        self._by_id: dict[str, list[EndpointStatus]] = {}
+        self._by_lower: dict[str, list[EndpointStatus]] = {}
+        for ep in endpoints:
+            for ident in dict.fromkeys((ep.key, ep.name)):
+                self._by_id.setdefault(ident, []).append(ep)
+            for ident in dict.fromkeys((ep.key.lower(), ep.name.lower())):
+                self._by_lower.setdefault(ident, []).append(ep)
+
+    def select(self, addons: Iterable[str] | None) -> list[EndpointStatus]:
+        """Endpoints whose key or name matches addons (case-insensitive).
+
+        None selects everything. Cost is proportional to the selection, not
+        to the fleet. The result is in display order.
+        """
+        if addons is None:
+            return self.ordered
+
+        matched: dict[int, EndpointStatus] = {}
+        for addon in addons:
+            for ep in self._by_lower.get(addon.lower(), ()):
+                matched[id(ep)] = ep
+        return sorted(matched.values(), key=lambda ep: self._rank[id(ep)])
+
+    def text(self, ep: EndpointStatus) -> ui.EndpointText:
+        """Precomputed display strings of an endpoint of this snapshot."""
+        return self._texts[id(ep)]
+
+    def lookup(
+        self, key: str | None, name: str | None = None, group: str | None = None
+    ) -> EndpointStatus | None:
+        """Endpoint with exactly this key, or else this name (and group if given)."""
+        if key:
+            for ep in self._by_id.get(key, ()):
+                if ep.key == key:
+                    return ep
+        if name:
+            for ep in self._by_id.get(name, ()):
+                if ep.name == name and (group is None or ep.group == group):
+                    return ep
+        return None
+
+    def find(self, ident: str, addons: Iterable[str] | None) -> EndpointStatus | None:
+        """First endpoint whose exact key or name is ident, within the selection."""
+        candidates = self._by_id.get(ident)
+        if not candidates:
+            return None
+        if addons is None:
+            return candidates[0]
+
+        wanted = {addon.lower() for addon in addons}
+        for ep in candidates:
+            if ep.key.lower() in wanted or ep.name.lower() in wanted:
+                return ep
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class StatusSnapshot:
+    """Immutable view of all endpoint statuses from a single Gatus fetch.
+
+    Attributes:
+        endpoints: Endpoint statuses as returned by the Gatus client.
+        generation: Monotonic counter bumped on every swap. 0 means "no data".
+        origin: ID of the process that built this content (by polling or
+            applying a push). Workers and replicas number generations on
+            their own, so only generation and origin together identify the
+            same content.
+        fetched_at: time.monotonic() value when the data was fetched.
+        stale: True if the latest refresh failed and this is the last
+            known-good data.
+        index: Lookup structures over endpoints, built on creation and shared
+            by copies made with dataclasses.replace().
+    """
+
+    endpoints: list[EndpointStatus]
+    generation: int = 0
+    origin: str = ""
+    fetched_at: float = field(default_factory=time.monotonic)
+    stale: bool = False
+    index: EndpointIndex = field(default=None, repr=False, compare=False)  # type: ignore[assignment]
+
+    def __post_init__(self) -> None:
+        if self.index is None:
+            object.__setattr__(self, "index", EndpointIndex(self.endpoints))
+
+    def age(self) -> float:
+        """Seconds elapsed since this snapshot was fetched."""
+        return time.monotonic() - self.fetched_at
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import tempfile
+import time
+from dataclasses import astuple, fields
+from pathlib import Path
+from typing import Any
+
+from stremio_status.core.models import EndpointStatus
+from stremio_status.core.snapshot import StatusSnapshot
+from stremio_status.utils.serialization import dump_json, load_json
+
+logger = logging.getLogger(__name__)
+
+FORMAT = "stremio-status-snapshot"
+# Bump when the file layout changes; files with another version are ignored
+FORMAT_VERSION = 5
+
+_FIELDS = [f.name for f in fields(EndpointStatus)]
+
+
+def encode_snapshot(snapshot: StatusSnapshot) -> bytes:
+    """Serialize a snapshot to the compact versioned format.
+
+    Endpoints are stored as rows of values in EndpointStatus field order,
+    with the field names once in the header.
+    """
+    return dump_json(
+        {
+            "format": FORMAT,
+            "version": FORMAT_VERSION,
+            "generation": snapshot.generation,
+            "origin": snapshot.origin,
+            "saved_at": time.time(),
+            "fields": _FIELDS,
+            "endpoints": [list(astuple(ep)) for ep in snapshot.endpoints],
+        }
+    )
+
+
+def decode_snapshot(data: bytes | memoryview) -> tuple[StatusSnapshot, float] | None:
+    """Parse a snapshot file. Returns (snapshot, saved_at) or None if unusable."""
+    try:
+        doc = load_json(data)
+        if not isinstance(doc, dict):
+            raise TypeError("not a JSON object")
+        if (
+            doc.get("format") != FORMAT
+            or doc.get("version") != FORMAT_VERSION
+            or doc.get("fields") != _FIELDS
+        ):
+            logger.warning("Ignoring snapshot file with unknown format/version")
+            return None
+        endpoints = [_decode_endpoint(row) for row in doc["endpoints"]]
+        snapshot = StatusSnapshot(
+            endpoints=endpoints,
+            generation=int(doc["generation"]),
+            origin=str(doc["origin"]),
+            stale=True,
+        )
+        return snapshot, float(doc["saved_at"])
+    except (ValueError, TypeError, KeyError) as e:
+        logger.warning(f"Ignoring corrupt snapshot file: {e}")
+        return None
+
+
+def _decode_endpoint(row: Any) -> EndpointStatus:
+    """Build an endpoint from a row of values in EndpointStatus field order."""
+    if not isinstance(row, list) or len(row) != len(_FIELDS):
+        raise TypeError(f"malformed endpoint row: {row!r:.80}")
+    return EndpointStatus(*row)
+
+
+def save_snapshot(snapshot: StatusSnapshot, path: Path) -> None:
+    """Atomically write snapshot to path (temp file + rename)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(encode_snapshot(snapshot))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def load_snapshot(
+    path: Path, use_mmap: bool = True
+) -> tuple[StatusSnapshot, float] | None:
+    """Load a snapshot saved by save_snapshot.
+
+    Returns (snapshot flagged stale, saved_at wall-clock time), or None if
+    the file is missing or unusable. With use_mmap, the file is parsed from
+    a read-only memory map (without copying it when orjson is installed).
+    """
+    try:
+        with path.open("rb") as f:
+            if not use_mmap or os.fstat(f.fileno()).st_size == 0:
+                return decode_snapshot(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    return decode_snapshot(view)
+                finally:
+                    view.release()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Failed to read snapshot file {path}: {e}")
+        return None
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Phase name -> seconds spent, for the request being served (None: not timed)
+_phases: ContextVar[dict[str, float] | None] = ContextVar(
+    "server_timing_phases", default=None
+)
+
+
+def begin() -> dict[str, float]:
+    """Start collecting phase timings for the current request."""
+    phases: dict[str, float] = {}
+    _phases.set(phases)
+    return phases
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time the enclosed block as part of phase name (no-op outside begin())."""
+    phases = _phases.get()
+    if phases is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases[name] = phases.get(name, 0.0) + time.perf_counter() - start
+
+
+def server_timing_header(**descriptions: str) -> str | None:
+    """Server-Timing value for the phases timed so far (None if not timing).
+
+    descriptions are added as extra metrics without a duration.
+    """
+    phases = _phases.get()
+    if phases is None:
+        return None
+    entries = [f"{name};dur={seconds * 1000:.3f}" for name, seconds in phases.items()]
+    entries += [f'{name};desc="{desc}"' for name, desc in descriptions.items()]
+    return ", ".join(entries)
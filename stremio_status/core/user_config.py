@@ -3,27 +3,50 @@ from __future__ import annotations
 import base64
 import binascii
 import json
+import logging
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from stremio_status.core import metrics
+from stremio_status.core.cache import LRUCache
+from stremio_status.core.config import get_settings
+
+logger = logging.getLogger(__name__)
 
 
 class UserConfig(BaseModel):
     """User configuration for addon filtering.
 
+    Instances are frozen and hashable. Addons are stored canonicalized
+    (lowercased, de-duplicated, sorted) since selection is case-insensitive
+    and order-independent, so configs that render identical responses
+    compare equal and can be used directly as cache keys.
+
     Attributes:
-        addons: list of addon keys to monitor. Empty list = no addons.
+        addons: tuple of addon keys to monitor. Empty tuple = no addons.
                 If None (omitted from JSON), means "all addons".
         only_down: If True, only show unhealthy addons in streams.
         hide_addon_status_catalog: If True, hide the "Service Status" catalog in Stremio.
     """
 
-    addons: list[str] | None = None  # None = all addons, [] = no addons
+    model_config = ConfigDict(frozen=True)
+
+    addons: tuple[str, ...] | None = None  # None = all addons, () = no addons
     only_down: bool = Field(default=True, alias="onlyDown")
     hide_addon_status_catalog: bool = Field(
         default=False, alias="hideAddonStatusCatalog"
     )
     show_watchdog: bool = Field(default=False, alias="showWatchdog")
 
+    @field_validator("addons")
+    @classmethod
+    def _canonicalize_addons(
+        cls, addons: tuple[str, ...] | None
+    ) -> tuple[str, ...] | None:
+        if addons is None:
+            return None
+        return tuple(sorted({key.lower() for key in addons}))
+
     def wants_all_addons(self) -> bool:
         """Check if config means 'show all addons'."""
         return self.addons is None
@@ -33,18 +56,44 @@ class UserConfig(BaseModel):
         return self.addons is not None and len(self.addons) == 0
 
 
-def decode_config(token: str) -> UserConfig:
-    """Decode base64 token to UserConfig.
+settings = get_settings()
+_decoded = LRUCache(settings.config_cache_size)
+metrics.track_cache("config", _decoded.stats)
 
-    Returns default config (all addons, only DOWN) on any error.
-    """
+
+def _decode(token: str) -> UserConfig:
+    """Decode base64 token to UserConfig (uncached)."""
     try:
         padded = token + "=" * (-len(token) % 4)
         json_bytes = base64.urlsafe_b64decode(padded)
         data = json.loads(json_bytes)
+        addons = data.get("addons") if isinstance(data, dict) else None
+        if isinstance(addons, list) and len(addons) > settings.config_max_addons:
+            logger.debug(f"Config token selects {len(addons)} addons, using defaults")
+            return UserConfig()
         return UserConfig.model_validate(data)
     except (ValueError, json.JSONDecodeError, binascii.Error):
         return UserConfig()
     except Exception:
         # Pydantic validation errors or unexpected issues
         return UserConfig()
+
+
+def decode_config(token: str) -> UserConfig:
+    """Decode base64 token to UserConfig (memoized per raw token).
+
+    Returns default config (all addons, only DOWN) on any error, or when the
+    token or its addon list exceeds the configured limits. Oversized tokens
+    are rejected before decoding and never enter the cache.
+    """
+    if len(token) > settings.config_token_max_length:
+        logger.debug(f"Config token too long ({len(token)} chars), using defaults")
+        return UserConfig()
+
+    cached = _decoded.get(token)
+    if isinstance(cached, UserConfig):
+        return cached
+
+    config = _decode(token)
+    _decoded.set(token, config)
+    return config
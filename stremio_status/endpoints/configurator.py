@@ -7,6 +7,7 @@ from fastapi import APIRouter
 from fastapi.responses import FileResponse, RedirectResponse
 
 from stremio_status.core.constants import STATIC_DIR
+from stremio_status.core.models import EndpointStatus
 from stremio_status.services import status_service
 
 logger = logging.getLogger(__name__)
@@ -50,23 +51,78 @@ async def root_redirect() -> RedirectResponse:
     return RedirectResponse(url="/stremio/configure", status_code=301)
 
 
+def _endpoint_json(ep: EndpointStatus) -> dict[str, Any]:
+    return {
+        "key": ep.key,
+        "name": ep.name,
+        "group": ep.group,
+        "healthy": ep.healthy,
+        "responseTime": ep.response_time,
+        "lastUpdated": ep.last_updated,
+        "uptime1h": ep.uptime_1h,
+        "uptime24h": ep.uptime,
+        "latencyP50": ep.latency_p50,
+        "latencyP95": ep.latency_p95,
+        "source": ep.source,
+    }
+
+
 @configurator_router.get("/api/endpoints")
-async def get_endpoints() -> dict[str, list[dict[str, Any]]]:
+async def get_endpoints() -> dict[str, Any]:
     """Return available endpoints for the configurator UI.
 
     Uses the cached status snapshot (same cache as catalog).
+    `stale` is True when Gatus is unreachable and the data is last known-good.
+    Uptimes (0-1) and latency percentiles (ms) come from the check history
+    and are null until it has samples for the window. `source` names the
+    status page of each endpoint when several are aggregated (else null).
+    `cursor` identifies the snapshot, see /api/changes.
     """
     logger.debug("Fetching endpoints for configurator API")
-    endpoints = await status_service.get_status_snapshot()
+    snapshot = await status_service.get_snapshot()
+
+    return {
+        "stale": snapshot.stale,
+        "cursor": status_service.change_cursor(snapshot),
+        "endpoints": [_endpoint_json(ep) for ep in snapshot.endpoints],
+    }
+
 
+@configurator_router.get("/api/changes")
+async def get_changes(since: str | None = None) -> dict[str, Any]:
+    """Return the endpoints that changed since the snapshot of cursor `since`.
+
+    An endpoint changed if its health, latency bucket (see core/changelog.py)
+    or last check time did, or if it appeared; `removed` lists the keys of
+    endpoints that are gone. Pass the returned `cursor` (opaque) as the next
+    `since`. Cursors are valid on every worker and replica sharing the
+    snapshot. If `since` is missing, or names a snapshot the change log no
+    longer reaches back to (or never saw, e.g. from before a restart),
+    `resync` is true and `endpoints` holds the full list instead.
+    """
+    snapshot, keys = await status_service.get_changes(since)
+    cursor = status_service.change_cursor(snapshot)
+    if keys is None:
+        return {
+            "stale": snapshot.stale,
+            "cursor": cursor,
+            "resync": True,
+            "endpoints": [_endpoint_json(ep) for ep in snapshot.endpoints],
+            "removed": [],
+        }
+
+    changed = []
+    removed = []
+    for key in sorted(keys):
+        ep = snapshot.index.lookup(key)
+        if ep is None:
+            removed.append(key)
+        else:
+            changed.append(_endpoint_json(ep))
     return {
-        "endpoints": [
-            {
-                "key": ep.key,
-                "name": ep.name,
-                "group": ep.group,
-                "healthy": ep.healthy,
-            }
-            for ep in endpoints
-        ]
+        "stale": snapshot.stale,
+        "cursor": cursor,
+        "resync": False,
+        "endpoints": changed,
+        "removed": removed,
     }
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import logging
+import re
+import secrets
+from typing import Any
+
+from fastapi import APIRouter, Header, HTTPException, Response
+
+from stremio_status.core.config import get_settings
+from stremio_status.core.models import AlertEvent
+from stremio_status.services import status_service
+
+logger = logging.getLogger(__name__)
+
+ingest_router = APIRouter()
+
+# Go duration units (as sent to Gatus external endpoints), in ms
+_DURATION_UNITS = {
+    "ns": 1e-6,
+    "us": 1e-3,
+    "µs": 1e-3,
+    "ms": 1.0,
+    "s": 1000.0,
+    "m": 60_000.0,
+    "h": 3_600_000.0,
+}
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ns|us|µs|ms|s|m|h)")
+
+
+def _authorize(authorization: str | None) -> None:
+    """Require "Authorization: Bearer <ingest_token>"."""
+    token = get_settings().ingest_token or ""
+    scheme, _, value = (authorization or "").partition(" ")
+    if not token or scheme.lower() != "bearer" or not secrets.compare_digest(
+        value.strip().encode(), token.encode()
+    ):
+        raise HTTPException(status_code=401, detail="Invalid ingest token")
+
+
+def parse_duration(value: str | None) -> float | None:
+    """Parse a Go duration like "1.5s" or "1m30s" to ms. None if invalid."""
+    if not value:
+        return None
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(n + u for n, u in parts) != value:
+        return None
+    return sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+
+
+def _respond(result: str, response: Response) -> dict[str, Any]:
+    if result == "unknown":
+        response.status_code = 404
+    return {"result": result}
+
+
+@ingest_router.post("/api/v1/endpoints/{key}/external")
+async def ingest_external(
+    key: str,
+    response: Response,
+    success: bool,
+    error: str | None = None,
+    duration: str | None = None,
+    authorization: str | None = Header(default=None),
+) -> dict[str, Any]:
+    """Apply a result in the format of Gatus' external endpoint API.
+
+    Whatever pushes results to Gatus can push them here too (same path,
+    query parameters and bearer token scheme).
+    """
+    _authorize(authorization)
+    if error:
+        logger.debug(f"Pushed failure of {key}: {error}")
+    result = await status_service.apply_transition(
+        success, key=key, response_time=parse_duration(duration)
+    )
+    return _respond(result, response)
+
+
+@ingest_router.post("/api/ingest/alert")
+async def ingest_alert(
+    event: AlertEvent,
+    response: Response,
+    authorization: str | None = Header(default=None),
+) -> dict[str, Any]:
+    """Apply a Gatus custom alert (TRIGGERED: down, RESOLVED: up again)."""
+    _authorize(authorization)
+    status = event.status.strip().upper()
+    if status not in ("TRIGGERED", "RESOLVED"):
+        raise HTTPException(status_code=422, detail="Unknown alert status")
+    result = await status_service.apply_transition(
+        status == "RESOLVED", key=event.key, name=event.name, group=event.group
+    )
+    return _respond(result, response)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from stremio_status.core import metrics
+
+metrics_router = APIRouter()
+
+REQUEST_SECONDS = metrics.histogram(
+    "stremio_status_http_request_duration_seconds",
+    "Time to serve HTTP requests by route template and method",
+    ["route", "method"],
+)
+REQUESTS = metrics.counter(
+    "stremio_status_http_requests_total",
+    "HTTP requests by route template, method and status code",
+    ["route", "method", "status"],
+)
+IN_FLIGHT = metrics.gauge(
+    "stremio_status_http_requests_in_flight",
+    "HTTP requests currently being served",
+)
+
+
+@metrics_router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    """Prometheus metrics in the text exposition format."""
+    return Response(metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
+
+
+def _route_label(scope: Scope) -> str:
+    # Route templates (not raw paths, which embed config tokens) keep the
+    # label cardinality bounded
+    route: Any = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+# Any other method (clients can send arbitrary ones) is counted as "other"
+METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"})
+
+
+def _method_label(scope: Scope) -> str:
+    method: str = scope["method"]
+    return method if method in METHODS else "other"
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording latency, status and in-flight requests."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            IN_FLIGHT.dec()
+            route = _route_label(scope)
+            method = _method_label(scope)
+            REQUEST_SECONDS.observe(time.perf_counter() - start, route, method)
+            REQUESTS.inc(route, method, str(status))
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import secrets
+import time
+from pathlib import Path
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from stremio_status.core.profiling import StackSampler
+
+logger = logging.getLogger(__name__)
+
+TOKEN_HEADER = b"x-profile-token"
+
+
+class ProfilingMiddleware:
+    """Profile single requests on demand, for operators holding the token.
+
+    A request carrying the token in X-Profile-Token is served while a
+    StackSampler samples the event loop. The collapsed stacks are written to
+    profile_dir (and the file name returned in an X-Profile header), or,
+    without profile_dir, returned as the response body instead of the
+    normal response. One request is profiled at a time; others carrying the
+    token meanwhile are served normally with "X-Profile: busy".
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        token: str,
+        interval: float = 0.001,
+        profile_dir: Path | None = None,
+    ) -> None:
+        self.app = app
+        self.token = token.encode()
+        self.interval = interval
+        self.profile_dir = profile_dir
+        self._busy = False
+
+    def _wants_profile(self, scope: Scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == TOKEN_HEADER:
+                return secrets.compare_digest(value, self.token)
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+        if self._busy:
+            await self.app(scope, receive, _with_header(send, b"busy"))
+            return
+
+        self._busy = True
+        name = f"profile-{time.time_ns()}.txt"
+
+        async def discard(message: Message) -> None:
+            pass
+
+        if self.profile_dir is not None:
+            send_to = _with_header(send, name.encode())
+        else:
+            send_to = discard
+        try:
+            with StackSampler(interval=self.interval) as sampler:
+                await self.app(scope, receive, send_to)
+        finally:
+            self._busy = False
+
+        profile = sampler.collapsed()
+        logger.info(
+            f"Profiled {scope['method']} {scope['path']}: "
+            f"{sum(sampler.samples.values())} samples in {sampler.duration:.3f}s"
+        )
+        if self.profile_dir is not None:
+            await asyncio.to_thread(self._store, self.profile_dir / name, profile)
+            return
+
+        body = profile.encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"x-profile", b"collapsed-stacks"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    def _store(self, path: Path, profile: str) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(profile)
+        except OSError as e:
+            logger.warning(f"Failed to store profile: {e}")
+            return
+        logger.info(f"Stored profile in {path}")
+
+
+def _with_header(send: Send, value: bytes) -> Send:
+    """Wrap send to add an X-Profile header to the response."""
+
+    async def wrapped(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            message = {
+                **message,
+                "headers": [*message.get("headers", []), (b"x-profile", value)],
+            }
+        await send(message)
+
+    return wrapped
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+from collections.abc import Awaitable, Callable, Hashable
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 
+from stremio_status.core import timing
 from stremio_status.core.config import get_settings
 from stremio_status.core.constants import ID_PREFIX
 from stremio_status.core.models import Meta, StremioManifest
+from stremio_status.core.snapshot import StatusSnapshot
 from stremio_status.core.user_config import UserConfig, decode_config
 from stremio_status.services import status_service
+from stremio_status.services.response_cache import response_cache
+from stremio_status.utils import ui
+from stremio_status.utils.serialization import dump_json
 
 logger = logging.getLogger(__name__)
 
@@ -70,10 +77,103 @@ def _manifest_response(config: UserConfig) -> StremioManifest:
     )
 
 
+def _cache_headers(snapshot: StatusSnapshot, expires_in: float) -> dict[str, str]:
+    """Freshness headers for a response rendered from snapshot.
+
+    max-age is the time left until the snapshot goes stale or the
+    relative-time bucket ends.
+    """
+    settings = get_settings()
+    max_age = 0.0 if snapshot.stale else settings.cache_ttl_seconds - snapshot.age()
+    max_age = min(max_age, expires_in)
+    swr = settings.cache_max_stale_seconds - settings.cache_ttl_seconds
+    return {
+        "Cache-Control": (
+            f"public, max-age={max(0, int(max_age))}, "
+            f"stale-while-revalidate={max(0, swr)}"
+        ),
+    }
+
+
+def _etag(body: bytes) -> str:
+    """Strong validator of a rendered body.
+
+    Hashing the body (not the snapshot generation, which every worker and
+    replica numbers on its own) makes equal ETags mean equal bodies across
+    processes, and lets every config token or content ID that renders the
+    same body share one.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _is_not_modified(request: Request, etag: str) -> bool:
+    """Check If-None-Match against etag (weak comparison, per RFC 9110).
+
+    "*" is not honoured: whether a meta item exists is only known after
+    rendering, so it always gets a full response.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+async def _cached_json(
+    request: Request,
+    snapshot: StatusSnapshot,
+    key: Hashable,
+    render: Callable[[], Awaitable[Any]],
+) -> Response:
+    """Respond with the cached body for key, rendering it on a miss.
+
+    The ETag is stored with the body, so conditional requests for a cached
+    body are answered with 304 without rendering or hashing it.
+    """
+    bucket, expires_in = ui.relative_time_bucket()
+    version = (snapshot.generation, bucket)
+    headers = _cache_headers(snapshot, expires_in)
+
+    cached = response_cache.get(version, key)
+    if cached is None:
+        content = await render()
+        with timing.phase("serialize"):
+            body = dump_json(content, fast=get_settings().fast_serialization)
+        etag = _etag(body)
+        response_cache.set(version, key, (body, etag))
+        cache = "miss"
+    else:
+        body, etag = cached
+        cache = "hit"
+
+    headers["ETag"] = etag
+    if _is_not_modified(request, etag):
+        _add_server_timing(headers, cache="not-modified")
+        return Response(status_code=304, headers=headers)
+    _add_server_timing(headers, cache=cache)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _begin_timing() -> None:
+    """Start timing the phases of this request, if Server-Timing is enabled."""
+    if get_settings().server_timing:
+        timing.begin()
+
+
+def _add_server_timing(headers: dict[str, str], cache: str) -> None:
+    value = timing.server_timing_header(cache=cache)
+    if value is not None:
+        headers["Server-Timing"] = value
+
+
+async def _timed_snapshot() -> StatusSnapshot:
+    with timing.phase("snapshot"):
+        return await status_service.get_snapshot()
+
+
 async def _get_catalog(
-    config: UserConfig, catalog_type: str, catalog_id: str
-) -> list[dict[str, Any]]:
-    """Build catalog items with validation."""
+    request: Request, config: UserConfig, catalog_type: str, catalog_id: str
+) -> Response:
+    """Build catalog response with validation."""
     logger.debug(f"Catalog request: type={catalog_type}, id={catalog_id}")
 
     if catalog_type not in VALID_CATALOG_TYPES:
@@ -81,39 +181,73 @@ async def _get_catalog(
     if catalog_id not in VALID_CATALOG_IDS:
         raise HTTPException(status_code=404, detail="Catalog not found")
 
-    items = await status_service.build_catalog(config)
-    return [item.model_dump() for item in items]
+    _begin_timing()
+    snapshot = await _timed_snapshot()
 
+    async def render() -> dict[str, Any]:
+        if get_settings().fast_serialization:
+            metas = await status_service.build_catalog_dicts(config, snapshot)
+            return {"metas": metas}
+        items = await status_service.build_catalog(config, snapshot)
+        with timing.phase("validate"):
+            return {"metas": [item.model_dump() for item in items]}
 
-async def _get_meta(config: UserConfig, meta_type: str, meta_id: str) -> dict[str, Any]:
-    """Build meta for a specific addon."""
+    return await _cached_json(request, snapshot, ("catalog", config), render)
+
+
+async def _get_meta(
+    request: Request, config: UserConfig, meta_type: str, meta_id: str
+) -> Response:
+    """Build meta response for a specific addon."""
     logger.debug(f"Meta request: type={meta_type}, id={meta_id}")
 
     if meta_type not in VALID_CONTENT_TYPES:
         raise HTTPException(status_code=404, detail="Meta type not found")
 
-    m = await status_service.build_meta(meta_id, config)
-    if not m:
-        raise HTTPException(status_code=404, detail="Not found")
-    return Meta.model_validate(m).model_dump()
+    _begin_timing()
+    snapshot = await _timed_snapshot()
+
+    async def render() -> dict[str, Any]:
+        if get_settings().fast_serialization:
+            meta_dict = await status_service.build_meta_dict(meta_id, config, snapshot)
+        else:
+            m = await status_service.build_meta(meta_id, config, snapshot)
+            with timing.phase("validate"):
+                meta_dict = Meta.model_validate(m).model_dump() if m else None
+        if not meta_dict:
+            raise HTTPException(status_code=404, detail="Not found")
+        return {"meta": meta_dict}
+
+    return await _cached_json(request, snapshot, ("meta", config, meta_id), render)
 
 
 async def _get_streams(
-    config: UserConfig, stream_type: str, stream_id: str
-) -> list[dict[str, Any]]:
-    """Build streams list.
+    request: Request, config: UserConfig, stream_type: str, stream_id: str
+) -> Response:
+    """Build streams response.
 
     Note: `stream_id` is intentionally ignored because this addon provides
     global health status streams regardless of the specific content ID requested.
-    It returns status streams for all monitored addons matching the config.
+    It returns status streams for all monitored addons matching the config,
+    so one cached body (and ETag) serves every content ID.
     """
     logger.debug(f"Stream request: type={stream_type}, id={stream_id}")
 
     if stream_type not in VALID_CONTENT_TYPES:
         raise HTTPException(status_code=404, detail="Stream type not found")
 
-    streams = await status_service.build_streams(config)
-    return [s.model_dump() for s in streams]
+    _begin_timing()
+    snapshot = await _timed_snapshot()
+
+    async def render() -> dict[str, Any]:
+        if get_settings().fast_serialization:
+            stream_dicts = await status_service.build_stream_dicts(config, snapshot)
+            return {"streams": stream_dicts}
+        streams = await status_service.build_streams(config, snapshot)
+        with timing.phase("validate"):
+            return {"streams": [s.model_dump() for s in streams]}
+
+    return await _cached_json(request, snapshot, ("stream", config), render)
 
 
 # Default routes (no config - shows all addons)
@@ -126,30 +260,21 @@ async def manifest() -> StremioManifest:
 
 
 @stremio_router.get("/catalog/{catalog_type}/{catalog_id}.json")
-async def catalog(
-    catalog_type: str,
-    catalog_id: str,
-) -> dict[str, list[dict[str, Any]]]:
+async def catalog(request: Request, catalog_type: str, catalog_id: str) -> Response:
     """Default catalog endpoint (all addons)."""
-    metas = await _get_catalog(UserConfig(), catalog_type, catalog_id)
-    return {"metas": metas}
+    return await _get_catalog(request, UserConfig(), catalog_type, catalog_id)
 
 
 @stremio_router.get("/meta/{meta_type}/{meta_id}.json")
-async def meta(meta_type: str, meta_id: str) -> dict[str, dict[str, Any]]:
+async def meta(request: Request, meta_type: str, meta_id: str) -> Response:
     """Default meta endpoint (all addons)."""
-    meta_data = await _get_meta(UserConfig(), meta_type, meta_id)
-    return {"meta": meta_data}
+    return await _get_meta(request, UserConfig(), meta_type, meta_id)
 
 
 @stremio_router.get("/stream/{stream_type}/{stream_id}.json")
-async def stream(
-    stream_type: str,
-    stream_id: str,
-) -> dict[str, list[dict[str, Any]]]:
+async def stream(request: Request, stream_type: str, stream_id: str) -> Response:
     """Default stream endpoint (all addons)."""
-    streams = await _get_streams(UserConfig(), stream_type, stream_id)
-    return {"streams": streams}
+    return await _get_streams(request, UserConfig(), stream_type, stream_id)
 
 
 # Configured routes (with base64 config token)
@@ -168,35 +293,35 @@ async def manifest_configured(config_token: str) -> StremioManifest:
 
 @stremio_router.get("/{config_token}/catalog/{catalog_type}/{catalog_id}.json")
 async def catalog_configured(
+    request: Request,
     config_token: str,
     catalog_type: str,
     catalog_id: str,
-) -> dict[str, list[dict[str, Any]]]:
+) -> Response:
     """Configured catalog endpoint."""
     config = decode_config(config_token)
-    metas = await _get_catalog(config, catalog_type, catalog_id)
-    return {"metas": metas}
+    return await _get_catalog(request, config, catalog_type, catalog_id)
 
 
 @stremio_router.get("/{config_token}/meta/{meta_type}/{meta_id}.json")
 async def meta_configured(
+    request: Request,
     config_token: str,
     meta_type: str,
     meta_id: str,
-) -> dict[str, dict[str, Any]]:
+) -> Response:
     """Configured meta endpoint."""
     config = decode_config(config_token)
-    meta_data = await _get_meta(config, meta_type, meta_id)
-    return {"meta": meta_data}
+    return await _get_meta(request, config, meta_type, meta_id)
 
 
 @stremio_router.get("/{config_token}/stream/{stream_type}/{stream_id}.json")
 async def stream_configured(
+    request: Request,
     config_token: str,
     stream_type: str,
     stream_id: str,
-) -> dict[str, list[dict[str, Any]]]:
+) -> Response:
     """Configured stream endpoint."""
     config = decode_config(config_token)
-    streams = await _get_streams(config, stream_type, stream_id)
-    return {"streams": streams}
+    return await _get_streams(request, config, stream_type, stream_id)
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import logging
+import os
+import shutil
+import tempfile
 from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import AsyncGenerator
 
 import uvicorn
@@ -10,26 +14,35 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from stremio_status.clients.gatus_client import get_client
+from stremio_status.core.cache_backend import get_cache_backend
 from stremio_status.core.config import get_settings
 from stremio_status.core.constants import STATIC_DIR
 from stremio_status.endpoints.configurator import configurator_router
 from stremio_status.endpoints.health import health_router
+from stremio_status.endpoints.ingest import ingest_router
+from stremio_status.endpoints.metrics import MetricsMiddleware, metrics_router
+from stremio_status.endpoints.profiling import ProfilingMiddleware
 from stremio_status.endpoints.static import static_router
 from stremio_status.endpoints.stremio import stremio_router
-
+from stremio_status.services import status_service
 
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    # Lazy init client; nothing else to start
+    # Serve the last persisted snapshot until Gatus answers, and keep the
+    # status snapshot warm so request handlers never wait on it
+    status_service.restore_snapshot()
+    status_service.start_refresher()
     yield
+    await status_service.stop_refresher()
     client = get_client()
     try:
         await client.close()
     except Exception:
         pass
+    await get_cache_backend().close()
 
 
 def create_app() -> FastAPI:
@@ -41,6 +54,19 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    settings = get_settings()
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+        app.include_router(metrics_router)
+    if settings.profiling_token:
+        app.add_middleware(
+            ProfilingMiddleware,
+            token=settings.profiling_token,
+            interval=settings.profiling_interval_seconds,
+            profile_dir=settings.profiling_dir,
+        )
+    if settings.ingest_token:
+        app.include_router(ingest_router)
     app.include_router(health_router)
     app.include_router(stremio_router)
     app.include_router(configurator_router)
@@ -56,12 +82,27 @@ def run() -> None:
     settings = get_settings()
     logging.basicConfig(level=settings.log_level.upper())
 
-    uvicorn.run(
-        "stremio_status.main:app",
-        host=settings.host,
-        port=settings.port,
-        log_level=settings.log_level,
-    )
+    shared_dir = None
+    if settings.workers > 1 and settings.snapshot_path is None:
+        # Workers share snapshots through a file; they read settings from
+        # the environment, so publish it there. The directory is private
+        # to this run (mode 0700), so nothing stale or planted is restored
+        shared_dir = tempfile.mkdtemp(prefix="stremio-status-")
+        os.environ["ADDON_SNAPSHOT_PATH"] = str(Path(shared_dir) / "snapshot.json")
+
+    try:
+        uvicorn.run(
+            "stremio_status.main:app",
+            host=settings.host,
+            port=settings.port,
+            log_level=settings.log_level,
+            workers=settings.workers,
+            loop=settings.loop,
+            http=settings.http,
+        )
+    finally:
+        if shared_dir is not None:
+            shutil.rmtree(shared_dir, ignore_errors=True)
 
 
 if __name__ == "__main__":
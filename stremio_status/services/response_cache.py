@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from collections.abc import Hashable
+
+from stremio_status.core import metrics
+from stremio_status.core.cache import LRUCache
+from stremio_status.core.config import get_settings
+
+# (snapshot generation, relative-time bucket) a body was rendered from
+RenderVersion = tuple[int, int]
+# Serialized body and its ETag (a hash of the body)
+CachedBody = tuple[bytes, str]
+
+
+class ResponseCache:
+    """Fully serialized response bodies for the current render version.
+
+    Each body is stored with its ETag, so conditional requests are answered
+    without rendering or hashing.
+
+    Responses only depend on the snapshot, the canonical user config and the
+    "Xm ago" texts in descriptions, so bodies are stored per (route, config)
+    and the whole cache is dropped as soon as a newer render version (new
+    snapshot generation or relative-time bucket) is seen.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._cache = LRUCache(max_entries)
+        self.version: RenderVersion = (0, 0)
+
+    def _sync(self, version: RenderVersion) -> bool:
+        """Invalidate on version change. Returns False for outdated versions."""
+        if version > self.version:
+            self._cache.clear()
+            self.version = version
+        return version == self.version
+
+    def get(self, version: RenderVersion, key: Hashable) -> CachedBody | None:
+        """Return the cached body and ETag for key rendered at this version."""
+        if not self._sync(version):
+            return None
+        entry = self._cache.get(key)
+        return entry if isinstance(entry, tuple) else None
+
+    def set(self, version: RenderVersion, key: Hashable, entry: CachedBody) -> None:
+        """Store a body (and its ETag) rendered at this version."""
+        if self._sync(version):
+            self._cache.set(key, entry)
+
+    def stats(self) -> dict[str, int]:
+        return {"generation": self.version[0], **self._cache.stats()}
+
+
+response_cache = ResponseCache(get_settings().response_cache_max_entries)
+metrics.track_cache("response", response_cache.stats)
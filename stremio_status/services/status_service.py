@@ -1,70 +1,685 @@
 from __future__ import annotations
 
-from typing import cast
-
+import asyncio
+import dataclasses
 import logging
+import secrets
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
 
 from stremio_status.clients.gatus_client import get_client
-from stremio_status.core.cache import TTLCache
+from stremio_status.core import metrics, timing
+from stremio_status.core.cache_backend import CacheBackendError, get_cache_backend
+from stremio_status.core.changelog import ChangeLog
+from stremio_status.core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
 from stremio_status.core.config import get_settings
 from stremio_status.core.constants import ID_PREFIX
-from stremio_status.core.models import CatalogItem, GatusEndpoint, Meta, Stream
+from stremio_status.core.leader import FileLock, LeaderLock
+from stremio_status.core.models import CatalogItem, EndpointStatus, Meta, Stream
+from stremio_status.core.singleflight import SingleFlight
+from stremio_status.core.snapshot import EndpointIndex, StatusSnapshot
+from stremio_status.core.snapshot_store import (
+    decode_snapshot,
+    encode_snapshot,
+    load_snapshot,
+    save_snapshot,
+)
 from stremio_status.core.user_config import UserConfig
 from stremio_status.utils import ui
 
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
-cache = TTLCache(ttl_seconds=settings.cache_ttl_seconds)
 
+# All concurrent refreshes (scheduled, stale reads and cold misses) share
+# one in-flight Gatus fetch
+fetches: SingleFlight[StatusSnapshot | None] = SingleFlight()
+breaker = CircuitBreaker(
+    "gatus",
+    failure_threshold=settings.breaker_failure_threshold,
+    backoff_seconds=settings.breaker_backoff_seconds,
+    max_backoff_seconds=settings.breaker_max_backoff_seconds,
+)
+
+# Key of the encoded snapshot in the cache backend, and of the lock held
+# by a replica while it applies a push to it
+SNAPSHOT_KEY = "snapshot"
+PUSH_LOCK = f"{SNAPSHOT_KEY}:push-lock"
+
+# Origin of the snapshots this process builds (see StatusSnapshot.origin)
+# and epoch of its change cursors
+INSTANCE_ID = secrets.token_hex(8)
+
+_snapshot: StatusSnapshot | None = None
+_generation = 0
+# (generation, origin) of the published snapshot _snapshot was adopted
+# from, if it had to be renumbered; None once we build our own
+_adopted_from: tuple[int, str] | None = None
+# Keys changed per generation, for clients polling /api/changes
+changes = ChangeLog(settings.change_log_size)
+_refresher_task: asyncio.Task[None] | None = None
+
+# Multi-worker mode: only the leader process polls Gatus and publishes each
+# snapshot to snapshot_path; the other workers load it from there
+_leader: LeaderLock | None = None
+_shared_stat: tuple[int, int] | None = None
+# Pushes are applied one at a time: per process, per host (file lock next to
+# the snapshot) and across replicas (cache backend lock)
+_push_lock = asyncio.Lock()
+_push_file_lock: FileLock | None = None
+
+REFRESHES = metrics.counter(
+    "stremio_status_snapshot_refreshes_total",
+    "Snapshot refreshes by outcome (changed, unchanged, failed, adopted)",
+    ["outcome"],
+)
+INGESTED = metrics.counter(
+    "stremio_status_ingest_events_total",
+    "Pushed health changes by result (applied, unchanged, unknown)",
+    ["result"],
+)
+
+
+def _snapshot_samples() -> list[tuple[tuple[str, ...], float]]:
+    snapshot = _snapshot
+    if snapshot is None:
+        return []
+    return [(("age_seconds",), snapshot.age()), (("stale",), float(snapshot.stale))]
+
+
+def _endpoint_samples() -> list[tuple[tuple[str, ...], float]]:
+    snapshot = _snapshot
+    if snapshot is None:
+        return []
+    return [
+        (("healthy",), len(snapshot.index.healthy)),
+        (("unhealthy",), len(snapshot.index.unhealthy)),
+    ]
 
-async def get_status_snapshot() -> list[GatusEndpoint]:
-    """Fetch current endpoint statuses (cached).
 
-    Returns cached data if fresh, otherwise fetches from Gatus.
-    On fetch failure, returns empty list.
+def _circuit_samples() -> list[tuple[tuple[str, ...], float]]:
+    return [((state.value,), float(breaker.state is state)) for state in CircuitState]
+
+
+metrics.add_collector(
+    "stremio_status_snapshot_generation",
+    "Generation of the current snapshot (bumped when its content changes)",
+    lambda: [((), _snapshot.generation if _snapshot is not None else 0)],
+)
+metrics.add_collector(
+    "stremio_status_snapshot",
+    "Age in seconds of the current snapshot, and whether it is stale (1/0)",
+    _snapshot_samples,
+    ["field"],
+)
+metrics.add_collector(
+    "stremio_status_endpoints",
+    "Endpoints in the current snapshot by health",
+    _endpoint_samples,
+    ["health"],
+)
+metrics.add_collector(
+    "stremio_status_gatus_fetches_coalesced_total",
+    "Refresh requests that joined an already running Gatus fetch",
+    lambda: [((), fetches.coalesced)],
+    kind="counter",
+)
+metrics.add_collector(
+    "stremio_status_gatus_fetches_in_flight",
+    "Gatus fetches currently running",
+    lambda: [((), fetches.in_flight())],
+)
+metrics.add_collector(
+    "stremio_status_circuit_state",
+    "Gatus circuit breaker state (1 for the current state)",
+    _circuit_samples,
+    ["state"],
+)
+
+
+async def refresh_snapshot() -> StatusSnapshot | None:
+    """Refresh the snapshot, through the shared cache backend if there is one.
+
+    With a shared backend, a snapshot cached by another replica within
+    snapshot_ttl_seconds is adopted instead of polling Gatus, and only the
+    replica holding the backend's refresh lock polls when it has expired.
+    If the backend is unreachable, Gatus is polled directly.
+
+    Returns the new snapshot, or None if the refresh failed.
     """
-    cached = cache.get("endpoints")
-    if cached is not None:
-        logger.debug("Returning cached endpoints")
-        return cast(list[GatusEndpoint], cached)
+    backend = get_cache_backend()
+    if not backend.shared:
+        return await _refresh_from_gatus()
+
+    # Set if this replica polls: the snapshot is then used as-is, and only
+    # its encoding goes to the backend
+    polled: StatusSnapshot | None = None
 
-    # Cache expired or empty - fetch fresh data
+    async def fetch_encoded() -> bytes | None:
+        nonlocal polled
+        polled = await _refresh_from_gatus()
+        return None if polled is None else encode_snapshot(polled)
+
+    try:
+        data = await backend.get_or_compute(
+            SNAPSHOT_KEY, settings.snapshot_ttl_seconds, fetch_encoded
+        )
+    except CacheBackendError as e:
+        logger.warning(f"Cache backend unavailable, polling Gatus directly: {e}")
+        return await _refresh_from_gatus()
+    if polled is not None:
+        return polled
+    if data is None:
+        return None
+
+    decoded = decode_snapshot(data)
+    if decoded is None:
+        return await _refresh_from_gatus()
+    return _adopt(*decoded)
+
+
+async def _refresh_from_gatus() -> StatusSnapshot | None:
+    """Fetch fresh statuses from Gatus and atomically swap the snapshot.
+
+    The generation is only bumped when the content changed; an unchanged
+    fetch keeps the snapshot (and everything cached per generation) and
+    just resets its age.
+
+    Returns the new snapshot, or None if the fetch failed or the circuit
+    breaker is open. The previous snapshot is kept, flagged stale.
+    """
+    global _snapshot, _generation, _adopted_from
     client = get_client()
     try:
         logger.debug("Fetching fresh endpoints from Gatus")
-        endpoints = await client.fetch_statuses()
-        cache.set("endpoints", endpoints)
-        logger.debug(f"Cached {len(endpoints)} endpoints")
-        return endpoints
+        endpoints = await breaker.call(client.fetch_statuses)
+    except CircuitOpenError as e:
+        logger.debug(str(e))
+        REFRESHES.inc("failed")
+        _mark_stale()
+        return None
     except Exception as e:
         logger.error(f"Failed to fetch from Gatus: {e}")
-        return []
+        REFRESHES.inc("failed")
+        _mark_stale()
+        return None
+
+    if _snapshot is not None and endpoints is _snapshot.endpoints:
+        # Client reused its previous result: same generation, just fresher
+        _snapshot = dataclasses.replace(
+            _snapshot, fetched_at=time.monotonic(), stale=False
+        )
+        logger.debug(f"Snapshot #{_generation} unchanged, extended")
+        REFRESHES.inc("unchanged")
+        if _leader is not None:
+            # Let followers know the shared snapshot is still fresh
+            await _persist(_snapshot)
+        return _snapshot
+
+    _generation += 1
+    snapshot = StatusSnapshot(
+        endpoints=endpoints, generation=_generation, origin=INSTANCE_ID
+    )
+    changes.record(_snapshot, snapshot)
+    _snapshot = snapshot
+    _adopted_from = None
+    logger.debug(f"Swapped in snapshot #{_generation} with {len(endpoints)} endpoints")
+    REFRESHES.inc("changed")
+    await _persist(snapshot)
+    return snapshot
+
+
+async def _persist(snapshot: StatusSnapshot) -> None:
+    """Write an accepted snapshot to disk (if configured) off the event loop."""
+    global _shared_stat
+    path = settings.snapshot_path
+    if path is None:
+        return
+    try:
+        await asyncio.to_thread(save_snapshot, snapshot, path)
+        st = path.stat()
+    except OSError as e:
+        logger.warning(f"Failed to persist snapshot: {e}")
+        return
+    # Our own write; nothing to adopt from it
+    _shared_stat = (st.st_mtime_ns, st.st_size)
+
+
+async def apply_transition(
+    healthy: bool,
+    key: str | None = None,
+    name: str | None = None,
+    group: str | None = None,
+    response_time: float | None = None,
+) -> str:
+    """Apply a pushed health change of one endpoint to the live snapshot.
+
+    The endpoint is found by key, or else by name (and group). Only actual
+    transitions are applied: the endpoint gets a new record, and a new
+    generation is swapped in that reuses the display strings of all other
+    endpoints. The snapshot keeps its age, so the reconciliation poll still
+    runs on schedule (and wins if Gatus disagrees). The change is shared with
+    other workers and replicas like a polled snapshot.
+
+    Returns "applied", "unchanged", or "unknown" (not in the snapshot; a
+    poll is started to pick up new endpoints).
+
+    Pushes are applied one at a time under a lock shared with the other
+    workers and replicas, each on top of the latest published snapshot, so
+    concurrent pushes to different workers are never lost.
+    """
+    async with _pushing():
+        await _catch_up()
+        return await _apply_transition(healthy, key, name, group, response_time)
+
+
+async def _apply_transition(
+    healthy: bool,
+    key: str | None,
+    name: str | None,
+    group: str | None,
+    response_time: float | None,
+) -> str:
+    global _snapshot, _generation, _adopted_from
+    snapshot = _snapshot
+    ep = None if snapshot is None else snapshot.index.lookup(key, name, group)
+    if snapshot is None or ep is None:
+        INGESTED.inc("unknown")
+        if not _is_follower():
+            _revalidate()
+        return "unknown"
+    if ep.healthy == healthy:
+        INGESTED.inc("unchanged")
+        return "unchanged"
+
+    now = time.time()
+    updated = dataclasses.replace(
+        ep,
+        healthy=healthy,
+        response_time=ep.response_time if response_time is None else response_time,
+        last_updated=ui.format_timestamp(now),
+        checked_at=now,
+    )
+    endpoints = [updated if other is ep else other for other in snapshot.endpoints]
+    _generation += 1
+    _snapshot = StatusSnapshot(
+        endpoints=endpoints,
+        generation=_generation,
+        origin=INSTANCE_ID,
+        fetched_at=snapshot.fetched_at,
+        stale=snapshot.stale,
+        index=EndpointIndex(endpoints, previous=snapshot.index),
+    )
+    _adopted_from = None
+    changes.record(snapshot, _snapshot, keys=(ep.key,))
+    logger.info(
+        f"Pushed: {ep.key} is now {'up' if healthy else 'down'} "
+        f"(snapshot #{_generation})"
+    )
+    INGESTED.inc("applied")
+    await _publish(_snapshot)
+    return "applied"
+
+
+@asynccontextmanager
+async def _pushing() -> AsyncIterator[None]:
+    """Hold the push lock of this process, its host and the cache backend.
+
+    The backend lock is waited for up to cache_lock_ttl_seconds, after which
+    its holder's lock has expired anyway.
+    """
+    async with _push_lock:
+        file_lock = _push_file_lock
+        if file_lock is not None:
+            acquiring = asyncio.ensure_future(asyncio.to_thread(file_lock.acquire))
+            try:
+                await asyncio.shield(acquiring)
+            except asyncio.CancelledError:
+                # The thread still takes the lock; hand it back when it does
+                acquiring.add_done_callback(lambda _: file_lock.release())
+                raise
+        backend = get_cache_backend()
+        token = None
+        try:
+            if backend.shared:
+                token = await _acquire_backend_lock()
+            yield
+        finally:
+            if token is not None:
+                await backend.release_lock(PUSH_LOCK, token)
+            if file_lock is not None:
+                file_lock.release()
+
+
+async def _acquire_backend_lock() -> str | None:
+    """Take the cache backend's push lock; None if it is unavailable."""
+    backend = get_cache_backend()
+    ttl = settings.cache_lock_ttl_seconds
+    deadline = time.monotonic() + ttl
+    while True:
+        try:
+            token = await backend.acquire_lock(PUSH_LOCK, ttl)
+        except CacheBackendError as e:
+            logger.warning(f"Applying push without the cache backend lock: {e}")
+            return None
+        if token is not None:
+            return token
+        if time.monotonic() >= deadline:
+            logger.warning("Timed out waiting for another replica's push")
+            return None
+        await asyncio.sleep(settings.share_poll_interval_seconds / 10)
+
+
+async def _catch_up() -> None:
+    """Adopt snapshots published by other workers and replicas, if newer."""
+    if _leader is not None:
+        await _follow_leader()
+    backend = get_cache_backend()
+    if not backend.shared:
+        return
+    try:
+        data = await backend.get(SNAPSHOT_KEY)
+    except CacheBackendError as e:
+        logger.warning(f"Cache backend unavailable, applying push locally: {e}")
+        return
+    decoded = None if data is None else decode_snapshot(data)
+    if decoded is not None:
+        _adopt(*decoded)
+
+
+async def _publish(snapshot: StatusSnapshot) -> None:
+    """Share a locally changed snapshot with other workers and replicas."""
+    await _persist(snapshot)
+    backend = get_cache_backend()
+    ttl = settings.snapshot_ttl_seconds - snapshot.age()
+    if not backend.shared or ttl <= 0:
+        return
+    try:
+        # Keep the expiry of the polled snapshot so reconciliation isn't delayed
+        await backend.set(SNAPSHOT_KEY, encode_snapshot(snapshot), ttl)
+    except CacheBackendError as e:
+        logger.warning(f"Failed to publish pushed snapshot: {e}")
+
+
+def restore_snapshot() -> StatusSnapshot | None:
+    """Load the persisted snapshot (if configured) for an instant warm start.
+
+    The restored snapshot is flagged stale and aged past snapshot_ttl_seconds,
+    so it is served immediately while the first live refresh runs.
+    """
+    global _snapshot, _generation
+    if settings.snapshot_path is None or _snapshot is not None:
+        return None
+
+    loaded = load_snapshot(settings.snapshot_path, use_mmap=settings.snapshot_mmap)
+    if loaded is None:
+        return None
+    snapshot, saved_at = loaded
+
+    snapshot = dataclasses.replace(
+        snapshot, fetched_at=time.monotonic() - settings.snapshot_ttl_seconds
+    )
+    _generation = max(_generation, snapshot.generation)
+    _snapshot = snapshot
+    changes.record(None, snapshot)
+    logger.info(
+        f"Restored snapshot #{snapshot.generation} with "
+        f"{len(snapshot.endpoints)} endpoints "
+        f"(saved {time.time() - saved_at:.0f}s ago)"
+    )
+    return snapshot
+
+
+def _is_follower() -> bool:
+    """True in a worker that reads the leader's snapshot instead of polling."""
+    return _leader is not None and not _leader.is_leader
+
+
+async def _follow_leader() -> None:
+    """Adopt the leader's published snapshot if the shared file changed."""
+    global _shared_stat
+    path = settings.snapshot_path
+    if path is None:
+        return
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return
+
+    stat = (st.st_mtime_ns, st.st_size)
+    if stat == _shared_stat:
+        if _snapshot is not None and _snapshot.age() > settings.snapshot_ttl_seconds:
+            # Leader hasn't published anything fresh in a while
+            _mark_stale()
+        return
+
+    loaded = await asyncio.to_thread(load_snapshot, path, settings.snapshot_mmap)
+    if loaded is None:
+        return
+    _shared_stat = stat
+    _adopt(*loaded)
+
+
+def _adopt(snapshot: StatusSnapshot, saved_at: float) -> StatusSnapshot:
+    """Swap in a snapshot published by another worker or replica.
+
+    Its age is derived from the wall-clock saved_at. A re-published copy of
+    the current snapshot (same generation and origin) only refreshes the
+    age, keeping our index and everything cached for it. Snapshots that
+    would not move our generation forward are renumbered as our own, so
+    caches keyed by generation never go back or mix up contents.
+    """
+    global _snapshot, _generation, _adopted_from
+    source = (snapshot.generation, snapshot.origin)
+    if _snapshot is not None and source in (
+        (_snapshot.generation, _snapshot.origin),
+        _adopted_from,
+    ):
+        snapshot = _snapshot
+    else:
+        if snapshot.generation > _generation:
+            _generation = snapshot.generation
+            _adopted_from = None
+        else:
+            _generation += 1
+            snapshot = dataclasses.replace(
+                snapshot, generation=_generation, origin=INSTANCE_ID
+            )
+            _adopted_from = source
+        changes.record(_snapshot, snapshot)
+        REFRESHES.inc("adopted")
+
+    age = max(0.0, time.time() - saved_at)
+    _snapshot = dataclasses.replace(
+        snapshot, fetched_at=time.monotonic() - age, stale=False
+    )
+    return _snapshot
+
+
+def _mark_stale() -> None:
+    """Flag the current snapshot as last known-good after a failed refresh."""
+    global _snapshot
+    if _snapshot is not None and not _snapshot.stale:
+        _snapshot = dataclasses.replace(_snapshot, stale=True)
+
+
+def _revalidate() -> asyncio.Task[StatusSnapshot | None]:
+    """Start a background refresh unless one is already running."""
+    return fetches.start("endpoints", refresh_snapshot)
+
+
+async def get_snapshot() -> StatusSnapshot:
+    """Return the current status snapshot (stale-while-revalidate).
+
+    - Younger than snapshot_ttl_seconds: returned as-is.
+    - Younger than cache_max_stale_seconds: returned immediately while a
+      background refresh is started.
+    - Missing or older than that: the caller waits for a fresh fetch.
+
+    While Gatus is failing (circuit not closed), the last known-good
+    snapshot is returned immediately, flagged stale. Without any data to
+    fall back on, returns an empty snapshot.
+    """
+    snapshot = _snapshot
+    if snapshot is not None:
+        age = snapshot.age()
+        if age < settings.snapshot_ttl_seconds:
+            return snapshot
+        if _is_follower():
+            # The refresh loop picks up the leader's next snapshot
+            return snapshot
+        if age < settings.cache_max_stale_seconds or not breaker.is_closed():
+            logger.debug(f"Serving stale snapshot ({age:.1f}s old) while refreshing")
+            _revalidate()
+            return snapshot
+
+    if _is_follower():
+        return await _wait_for_leader()
+
+    fresh = await fetches.do("endpoints", refresh_snapshot)
+    if fresh is not None:
+        return fresh
+    if _snapshot is not None:
+        return _snapshot
+    return StatusSnapshot(endpoints=[])
+
+
+def change_cursor(snapshot: StatusSnapshot) -> str:
+    """Opaque /api/changes cursor for a snapshot.
+
+    Generations are numbered by the process that built the snapshot, so the
+    cursor pairs the generation with the snapshot's origin. Workers and
+    replicas sharing snapshots hand out the same cursor for the same one,
+    and any of them can resolve it; others force a resync instead of
+    reading it against the wrong change log.
+    """
+    return f"{snapshot.origin}.{snapshot.generation}"
+
+
+async def get_changes(since: str | None) -> tuple[StatusSnapshot, set[str] | None]:
+    """Return the current snapshot and the keys changed since a cursor.
+
+    Keys are None when the client has to resync from the full list: since
+    is missing, malformed, or names a snapshot the change log doesn't
+    reach back to.
+    """
+    snapshot = await get_snapshot()
+    if since is None:
+        return snapshot, None
+    origin, _, generation = since.rpartition(".")
+    if not origin or not generation.isdigit():
+        return snapshot, None
+    return snapshot, changes.since(origin, int(generation), snapshot)
+
+
+async def _wait_for_leader() -> StatusSnapshot:
+    """Cold follower: wait (up to the Gatus timeout) for the first shared snapshot."""
+    deadline = time.monotonic() + get_client().timeout
+    while _snapshot is None and time.monotonic() < deadline:
+        await asyncio.sleep(0.1)
+        await _follow_leader()
+    return _snapshot if _snapshot is not None else StatusSnapshot(endpoints=[])
+
+
+async def _refresh_loop() -> None:
+    """Re-poll Gatus on a fixed schedule so handlers never wait on it.
+
+    In multi-worker mode, followers instead watch the shared snapshot file
+    and try to take over leadership on every tick. With push ingestion the
+    leader watches it too between polls, for pushes other workers received.
+    """
+    next_poll = 0.0
+    while True:
+        try:
+            next_poll, delay = await _refresh_tick(next_poll)
+        except Exception:
+            # Never let the loop die: followers only get data through it
+            logger.exception("Background refresh failed")
+            delay = (
+                settings.share_poll_interval_seconds
+                if _leader is not None
+                else settings.poll_interval_seconds
+            )
+        await asyncio.sleep(max(0.0, delay))
+
+
+async def _refresh_tick(next_poll: float) -> tuple[float, float]:
+    """One round of the refresh loop. Returns (next_poll, delay)."""
+    if _leader is None or _leader.try_acquire():
+        if time.monotonic() >= next_poll:
+            await fetches.do("endpoints", refresh_snapshot)
+            next_poll = time.monotonic() + settings.poll_interval_seconds
+        elif _leader is not None:
+            await _follow_leader()
+        delay = next_poll - time.monotonic()
+        if _leader is not None and settings.ingest_token:
+            delay = min(delay, settings.share_poll_interval_seconds)
+        return next_poll, delay
+    await _follow_leader()
+    return next_poll, settings.share_poll_interval_seconds
+
+
+def start_refresher() -> None:
+    """Start the background refresh loop (called from the app lifespan).
+
+    With more than one worker and a snapshot_path, workers elect a leader
+    through a lock file next to the snapshot (and serialize pushes through
+    another one).
+    """
+    global _refresher_task, _leader, _push_file_lock
+    if not settings.background_refresh:
+        return
+    if settings.workers > 1 and settings.snapshot_path is not None:
+        path = settings.snapshot_path
+        _leader = LeaderLock(path.with_name(f"{path.name}.lock"))
+        _push_file_lock = FileLock(path.with_name(f"{path.name}.push.lock"))
+    if _refresher_task is None or _refresher_task.done():
+        _refresher_task = asyncio.create_task(_refresh_loop())
+
+
+async def stop_refresher() -> None:
+    """Cancel the background refresh loop and any in-flight refresh."""
+    global _refresher_task
+    tasks = fetches.cancel_all()
+    if _refresher_task is not None:
+        _refresher_task.cancel()
+        tasks.append(_refresher_task)
+    for task in tasks:
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    _refresher_task = None
+    if _leader is not None:
+        _leader.release()
 
 
 def filter_by_addon_selection(
-    endpoints: list[GatusEndpoint], config: UserConfig
-) -> list[GatusEndpoint]:
-    """Filter endpoints by addon selection only.
+    snapshot: StatusSnapshot, config: UserConfig
+) -> list[EndpointStatus]:
+    """Filter snapshot endpoints by addon selection only.
 
     - If config.addons is None: return all endpoints
     - If config.addons is []: return no endpoints
     - If config.addons has values: return only matching endpoints
+
+    Uses the snapshot index, so the result is already in display order
+    (see ui.sort_endpoints) and must not be mutated.
     """
     if config.wants_no_addons():
         return []
-    if config.addons is None:
-        return endpoints
-
-    wanted = {key.lower() for key in config.addons}
-    return [
-        ep for ep in endpoints if ep.key.lower() in wanted or ep.name.lower() in wanted
-    ]
+    return snapshot.index.select(config.addons)
 
 
 def filter_by_health(
-    endpoints: list[GatusEndpoint], only_down: bool
-) -> list[GatusEndpoint]:
+    endpoints: list[EndpointStatus], only_down: bool
+) -> list[EndpointStatus]:
     """Filter endpoints by health status.
 
     - If only_down is True: return only unhealthy endpoints
@@ -75,92 +690,133 @@ def filter_by_health(
     return [ep for ep in endpoints if not ep.healthy]
 
 
-async def build_catalog(config: UserConfig) -> list[CatalogItem]:
-    """Build catalog items - always shows all health statuses.
+def _catalog_entry(text: ui.EndpointText, now: float) -> dict[str, Any]:
+    """Catalog/meta item for an endpoint, in CatalogItem/Meta field order."""
+    return {
+        "id": text.meta_id,
+        "type": "tv",
+        "name": text.title,
+        "poster": text.poster,
+        "description": text.description(now),
+    }
+
+
+def _stream_entry(name: str, description: str) -> dict[str, Any]:
+    """Stream item, in Stream field order."""
+    return {
+        "name": name,
+        "description": description,
+        "url": f"{settings.public_base_url}",
+        "behaviorHints": {"notWebReady": True},
+    }
+
+
+async def build_catalog_dicts(
+    config: UserConfig, snapshot: StatusSnapshot | None = None
+) -> list[dict[str, Any]]:
+    """Build catalog items as plain dicts (same content as build_catalog).
 
     Only filters by addon selection, never by only_down.
+    Uses the given snapshot, or the current one if omitted.
     """
-    endpoints = await get_status_snapshot()
-    filtered = filter_by_addon_selection(endpoints, config)
-    sorted_eps = ui.sort_endpoints(filtered)
-
-    items: list[CatalogItem] = []
-    for ep in sorted_eps:
-        emoji = ui.status_emoji(ep.healthy)
-        poster = ui.status_poster_url(ep.healthy)
-        items.append(
-            CatalogItem(
-                id=f"{ID_PREFIX}{ep.key}",
-                type="tv",
-                name=f"{emoji} {ep.name}",
-                poster=poster,
-                description=ui.format_catalog_desc(ep),
-            )
-        )
-    return items
+    if snapshot is None:
+        snapshot = await get_snapshot()
+    with timing.phase("filter"):
+        sorted_eps = filter_by_addon_selection(snapshot, config)
+    with timing.phase("format"):
+        now = time.time()
+        text = snapshot.index.text
+        return [_catalog_entry(text(ep), now) for ep in sorted_eps]
 
 
-async def build_meta(addon_id: str, config: UserConfig) -> Meta | None:
-    """Build meta for a specific addon.
+async def build_meta_dict(
+    addon_id: str, config: UserConfig, snapshot: StatusSnapshot | None = None
+) -> dict[str, Any] | None:
+    """Build meta for a specific addon as a plain dict (same as build_meta).
 
     Only filters by addon selection, not by health status.
     This ensures clicking a healthy addon in catalog doesn't 404.
+    Uses the given snapshot, or the current one if omitted.
     """
-    endpoints = await get_status_snapshot()
-    filtered = filter_by_addon_selection(endpoints, config)
+    if snapshot is None:
+        snapshot = await get_snapshot()
+    if config.wants_no_addons():
+        return None
 
     clean_id = addon_id.removeprefix(ID_PREFIX)
-    for ep in filtered:
-        if ep.key == clean_id or ep.name == clean_id:
-            emoji = ui.status_emoji(ep.healthy)
-            poster = ui.status_poster_url(ep.healthy)
-            return Meta(
-                id=f"{ID_PREFIX}{ep.key}",
-                type="tv",
-                name=f"{emoji} {ep.name}",
-                poster=poster,
-                description=ui.format_catalog_desc(ep),
-            )
-    return None
+    with timing.phase("filter"):
+        ep = snapshot.index.find(clean_id, config.addons)
+    if ep is None:
+        return None
+    with timing.phase("format"):
+        return _catalog_entry(snapshot.index.text(ep), time.time())
 
 
-async def build_streams(config: UserConfig) -> list[Stream]:
-    """Build stream list based on user config.
+async def build_stream_dicts(
+    config: UserConfig, snapshot: StatusSnapshot | None = None
+) -> list[dict[str, Any]]:
+    """Build stream list as plain dicts (same content as build_streams).
 
     Respects config.only_down to filter healthy/unhealthy endpoints.
     Sorts: DOWN first, then UP, alphabetically by name.
     Optionally prepends a watchdog summary card.
+    Uses the given snapshot, or the current one if omitted.
     """
-    endpoints = await get_status_snapshot()
+    if snapshot is None:
+        snapshot = await get_snapshot()
 
-    # Get selected endpoints (before health filtering)
-    selected_endpoints = filter_by_addon_selection(endpoints, config)
+    with timing.phase("filter"):
+        # Get selected endpoints (before health filtering), already sorted
+        selected_endpoints = filter_by_addon_selection(snapshot, config)
 
-    filtered = filter_by_health(selected_endpoints, config.only_down)
-    sorted_eps = ui.sort_endpoints(filtered)
+        if config.wants_all_addons() and config.only_down:
+            sorted_eps = snapshot.index.unhealthy
+        else:
+            sorted_eps = filter_by_health(selected_endpoints, config.only_down)
 
-    streams: list[Stream] = []
+    streams: list[dict[str, Any]] = []
 
-    if config.show_watchdog and len(selected_endpoints) > 0:
-        emoji, status, total, last_check = ui.get_status_summary(selected_endpoints)
-        streams.append(
-            Stream(
-                name=f"{emoji} Stremio Status",
-                description=ui.format_watchdog_desc(status, total, last_check),
-                url=f"{settings.public_base_url}",
-                behaviorHints={"notWebReady": True},
+    with timing.phase("format"):
+        if config.show_watchdog and len(selected_endpoints) > 0:
+            emoji, status, total, last_check = ui.get_status_summary(
+                selected_endpoints
             )
-        )
-
-    for ep in sorted_eps:
-        emoji = ui.status_emoji(ep.healthy)
-
-        streams.append(
-            Stream(
-                name=f"{emoji} {ep.name}",
-                description=ui.format_stream_desc(ep),
-                url=f"{settings.public_base_url}",
-                behaviorHints={"notWebReady": True},
+            streams.append(
+                _stream_entry(
+                    f"{emoji} Stremio Status",
+                    ui.format_watchdog_desc(status, total, last_check),
+                )
             )
-        )
+
+        now = time.time()
+        for ep in sorted_eps:
+            text = snapshot.index.text(ep)
+            streams.append(_stream_entry(text.title, text.description(now)))
     return streams
+
+
+async def build_catalog(
+    config: UserConfig, snapshot: StatusSnapshot | None = None
+) -> list[CatalogItem]:
+    """Build validated catalog items - always shows all health statuses."""
+    items = await build_catalog_dicts(config, snapshot)
+    with timing.phase("validate"):
+        return [CatalogItem.model_validate(item) for item in items]
+
+
+async def build_meta(
+    addon_id: str, config: UserConfig, snapshot: StatusSnapshot | None = None
+) -> Meta | None:
+    """Build validated meta for a specific addon."""
+    meta = await build_meta_dict(addon_id, config, snapshot)
+    with timing.phase("validate"):
+        return Meta.model_validate(meta) if meta is not None else None
+
+
+async def build_streams(
+    config: UserConfig, snapshot: StatusSnapshot | None = None
+) -> list[Stream]:
+    """Build validated stream list based on user config."""
+    streams = await build_stream_dicts(config, snapshot)
+    with timing.phase("validate"):
+        return [Stream.model_validate(stream) for stream in streams]
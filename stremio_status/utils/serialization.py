@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # optional speedup, see the "speedups" extra
+    HAS_ORJSON = False
+
+
+def dump_json(content: Any, *, fast: bool = True) -> bytes:
+    """Serialize content to JSON bytes exactly like FastAPI's JSONResponse.
+
+    Compact separators, UTF-8 without ASCII escaping, NaN rejected.
+    With fast=True and orjson installed, orjson produces the same bytes for
+    the str/int/bool/None/list/dict payloads this addon emits.
+    """
+    if fast and HAS_ORJSON:
+        return orjson.dumps(content)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def load_json(data: bytes | memoryview) -> Any:
+    """Parse JSON bytes, directly from a buffer with orjson if installed."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
@@ -1,24 +1,33 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import math
+import time
+from datetime import UTC, datetime
+from functools import cache
 
 from stremio_status.core.config import get_settings
-from stremio_status.core.models import GatusEndpoint
+from stremio_status.core.constants import ID_PREFIX
+from stremio_status.core.models import EndpointStatus
 
 # Bump this version when poster images are updated to bust client caches
 POSTER_VERSION = "2"
 
+# Rendered descriptions (with "Xm ago" texts) are reused for at most this long
+RELATIVE_TIME_BUCKET_SECONDS = 60
+
 
 def status_emoji(healthy: bool) -> str:
     """Return emoji for up/down status."""
     return "✅" if healthy else "⛔"
 
 
+@cache
 def status_poster_url(healthy: bool) -> str:
     """Return URL to static poster image for up/down status.
 
     Uses public_base_url setting to construct the full URL.
     Appends version query param for cache busting.
+    Settings don't change at runtime, so both URLs are built once.
     """
     settings = get_settings()
     base_url = str(settings.public_base_url).rstrip("/")
@@ -26,6 +35,58 @@ def status_poster_url(healthy: bool) -> str:
     return f"{base_url}/static/{filename}?v={POSTER_VERSION}"
 
 
+def parse_timestamp(iso_timestamp: str | None) -> float | None:
+    """Parse an ISO timestamp to a Unix timestamp.
+
+    Returns None if it is missing, invalid or has no timezone.
+    """
+    if not iso_timestamp:
+        return None
+    try:
+        # Parse ISO timestamp (handle 'Z' suffix)
+        dt = datetime.fromisoformat(iso_timestamp.replace("Z", "+00:00"))
+    except (ValueError, TypeError, AttributeError):
+        return None
+    if dt.tzinfo is None:
+        return None
+    return dt.timestamp()
+
+
+def format_timestamp(timestamp: float) -> str:
+    """Format a Unix timestamp like Gatus does (UTC, 'Z' suffix)."""
+    dt = datetime.fromtimestamp(timestamp, UTC)
+    return dt.isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+# (seconds below which, unit in seconds, suffix) of relative time texts
+_RELATIVE_UNITS = (
+    (60, 1, "s"),
+    (3600, 60, "m"),
+    (86400, 3600, "h"),
+    (math.inf, 86400, "d"),
+)
+
+
+def relative_time_span(checked_at: float, now: float) -> tuple[str, float, float]:
+    """Relative time like '2m ago' for checked_at, seen at now.
+
+    Also returns the range [valid_from, valid_until) of now values that
+    produce the same text, so callers can reuse it until it would change.
+    """
+    seconds = int(now - checked_at)
+    if seconds < 0:
+        return "just now", -math.inf, checked_at - 1
+    if now < checked_at:
+        # Less than a second in the future: "0s ago", not worth caching
+        return "0s ago", now, now
+    for limit, unit, suffix in _RELATIVE_UNITS:
+        if seconds < limit:
+            count = seconds // unit
+            start = checked_at + count * unit
+            return f"{count}{suffix} ago", start, start + unit
+    raise AssertionError("unreachable")
+
+
 def format_relative_time(iso_timestamp: str | None) -> str:
     """Convert ISO timestamp to relative time like '2m ago'.
 
@@ -34,58 +95,116 @@ def format_relative_time(iso_timestamp: str | None) -> str:
     """
     if not iso_timestamp:
         return "unknown"
-
-    try:
-        # Parse ISO timestamp (handle 'Z' suffix)
-        dt = datetime.fromisoformat(iso_timestamp.replace("Z", "+00:00"))
-        now = datetime.now(timezone.utc)
-        diff = now - dt
-
-        seconds = int(diff.total_seconds())
-        if seconds < 0:
-            return "just now"
-        elif seconds < 60:
-            return f"{seconds}s ago"
-        elif seconds < 3600:
-            return f"{seconds // 60}m ago"
-        elif seconds < 86400:
-            return f"{seconds // 3600}h ago"
-        else:
-            return f"{seconds // 86400}d ago"
-    except (ValueError, TypeError):
+    checked_at = parse_timestamp(iso_timestamp)
+    if checked_at is None:
         return iso_timestamp
+    return relative_time_span(checked_at, time.time())[0]
+
+
+def _last_check_span(ep: EndpointStatus, now: float) -> tuple[str, float, float]:
+    """Relative last check text of ep and the range of now it is valid for."""
+    if ep.checked_at is None:
+        # Same fallbacks as format_relative_time, which never change
+        return ep.last_updated or "unknown", -math.inf, math.inf
+    return relative_time_span(ep.checked_at, now)
 
 
-def _get_common_details(ep: GatusEndpoint) -> tuple[str, str, str]:
-    """Extract common status details for formatting."""
+def relative_time_bucket() -> tuple[int, float]:
+    """Return the current relative-time bucket and seconds until it ends.
+
+    Bodies containing relative times rendered within one bucket are treated
+    as identical.
+    """
+    now = time.time()
+    bucket, offset = divmod(now, RELATIVE_TIME_BUCKET_SECONDS)
+    return int(bucket), RELATIVE_TIME_BUCKET_SECONDS - offset
+
+
+def format_uptime(uptime: float) -> str:
+    """Format an uptime ratio as a percentage, e.g. 0.9995 -> '99.9%'.
+
+    Rounded down, so only a perfect record shows as 100%.
+    """
+    return f"{math.floor(uptime * 1000) / 10:.1f}%"
+
+
+def _get_common_details(ep: EndpointStatus) -> str:
+    """Status, latency and uptime lines (everything but the last check)."""
     status = "Up" if ep.healthy else "Down"
     latency = f"{int(ep.response_time)}ms" if ep.response_time else "n/a"
-    last_check = format_relative_time(ep.last_updated)
-    return status, latency, last_check
+    if ep.latency_p50 is not None and ep.latency_p95 is not None:
+        latency += f" (p50 {int(ep.latency_p50)}ms, p95 {int(ep.latency_p95)}ms)"
+    lines = f"Status: {status}\nLatency: {latency}\n"
+
+    uptimes = [
+        f"{format_uptime(uptime)} ({window})"
+        for uptime, window in ((ep.uptime_1h, "1h"), (ep.uptime, "24h"))
+        if uptime is not None
+    ]
+    if uptimes:
+        lines += f"Uptime: {', '.join(uptimes)}\n"
+    return lines
+
+
+def _status_desc(details: str, last_check: str) -> str:
+    return f"[Stremio Status]\n{details}Last Check: {last_check}"
 
 
-def format_status_desc(ep: GatusEndpoint) -> str:
+def format_status_desc(ep: EndpointStatus) -> str:
     """Format description with status details (multi-line)."""
-    status, latency, last_check = _get_common_details(ep)
-    return (
-        f"[Stremio Status]\n"
-        f"Status: {status}\n"
-        f"Latency: {latency}\n"
-        f"Last Check: {last_check}"
+    last_check = _last_check_span(ep, time.time())[0]
+    return _status_desc(_get_common_details(ep), last_check)
+
+
+class EndpointText:
+    """Display strings of one endpoint, built once per snapshot.
+
+    Everything but the relative last check time is fixed for a snapshot;
+    the description is cached until its "Xm ago" text would change, so
+    rendering is mostly attribute lookups.
+    """
+
+    __slots__ = (
+        "_description",
+        "_details",
+        "_valid_from",
+        "_valid_until",
+        "ep",
+        "meta_id",
+        "poster",
+        "title",
     )
 
+    def __init__(self, ep: EndpointStatus) -> None:
+        self.ep = ep
+        self.meta_id = f"{ID_PREFIX}{ep.key}"
+        self.title = f"{status_emoji(ep.healthy)} {ep.name}"
+        self.poster = status_poster_url(ep.healthy)
+        self._details = _get_common_details(ep)
+        self._description = ""
+        self._valid_from = self._valid_until = 0.0
+
+    def description(self, now: float) -> str:
+        """Same text as format_status_desc(ep) at time now."""
+        if not self._valid_from <= now < self._valid_until:
+            last_check, self._valid_from, self._valid_until = _last_check_span(
+                self.ep, now
+            )
+            self._description = _status_desc(self._details, last_check)
+        return self._description
+
 
 # Backward compatibility / specific aliases
 format_catalog_desc = format_status_desc
 format_stream_desc = format_status_desc
 
 
-def sort_endpoints(endpoints: list[GatusEndpoint]) -> list[GatusEndpoint]:
+def sort_endpoints(endpoints: list[EndpointStatus]) -> list[EndpointStatus]:
     """Sort endpoints: unhealthy first, then healthy, then by name."""
     return sorted(endpoints, key=lambda ep: (ep.healthy, ep.name.lower()))
 
 
-def get_status_summary(endpoints: list[GatusEndpoint]) -> tuple[str, str, int, str]:
+def get_status_summary(endpoints: list[EndpointStatus]) -> tuple[str, str, int, str]:
     """Calculate monitoring status summary for endpoints.
 
     Returns emoji (✅/⚠️/⛔), status text, total count, and last check time.
@@ -104,11 +223,18 @@ def get_status_summary(endpoints: list[GatusEndpoint]) -> tuple[str, str, int, s
         emoji = "⚠️"
         status = f"{down} down, {total - down} up"
 
-    recent_ts = max(
-        (ep.last_updated for ep in endpoints if ep.last_updated),
+    recent = max(
+        (ep.checked_at for ep in endpoints if ep.checked_at is not None),
         default=None,
     )
-    last_check = format_relative_time(recent_ts)
+    if recent is not None:
+        last_check = relative_time_span(recent, time.time())[0]
+    else:
+        recent_ts = max(
+            (ep.last_updated for ep in endpoints if ep.last_updated),
+            default=None,
+        )
+        last_check = format_relative_time(recent_ts)
 
     return emoji, status, total, last_check
 
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+import pytest
+import uvicorn
+
+from benchmarks.fake_gatus import FakeGatus, FakeGatusConfig
+from stremio_status.clients import gatus_client
+from stremio_status.clients.gatus_client import GatusClient
+from stremio_status.core import cache_backend
+from stremio_status.core.cache_backend import MemoryCacheBackend
+from stremio_status.core.changelog import ChangeLog
+from stremio_status.core.circuit_breaker import CircuitBreaker
+from stremio_status.core.singleflight import SingleFlight
+from stremio_status.endpoints import stremio
+from stremio_status.main import create_app
+from stremio_status.services import status_service
+from stremio_status.services.response_cache import ResponseCache
+
+INGEST_TOKEN = "test-token"
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Run async tests (marked anyio) on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture
+def auth() -> dict[str, str]:
+    """Headers of an authorized push."""
+    return {"Authorization": f"Bearer {INGEST_TOKEN}"}
+
+
+@pytest.fixture
+async def gatus_url() -> AsyncIterator[str]:
+    """A fake Gatus (5 healthy endpoints) listening on a local port."""
+    fake = FakeGatus(FakeGatusConfig(size=5, results=1, failure_rate=0.0))
+    config = uvicorn.Config(fake.app(), host="127.0.0.1", port=0, log_level="warning")
+    server = uvicorn.Server(config)
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    server.should_exit = True
+    await task
+
+
+@pytest.fixture
+def service(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fresh status service state (no snapshot, caches or workers)."""
+    settings = status_service.settings
+    state: dict[str, Any] = {
+        "_snapshot": None,
+        "_generation": 0,
+        "_adopted_from": None,
+        "_leader": None,
+        "_push_lock": asyncio.Lock(),
+        "_push_file_lock": None,
+        "changes": ChangeLog(settings.change_log_size),
+        "fetches": SingleFlight(),
+        "breaker": CircuitBreaker("gatus"),
+    }
+    for name, value in state.items():
+        monkeypatch.setattr(status_service, name, value)
+    monkeypatch.setattr(stremio, "response_cache", ResponseCache(100))
+    monkeypatch.setattr(cache_backend, "_backend", MemoryCacheBackend())
+
+
+@pytest.fixture
+async def addon(
+    gatus_url: str, service: None, monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[httpx.AsyncClient]:
+    """The addon on a fake Gatus, with push ingestion enabled."""
+    monkeypatch.setattr(status_service.settings, "ingest_token", INGEST_TOKEN)
+    client = GatusClient(gatus_url)
+    monkeypatch.setattr(gatus_client, "_client", client)
+
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://addon") as http:
+        yield http
+    await client.close()
@@ -0,0 +1,139 @@
+"""In-process stand-in for a Redis server, for exercising the redis cache backend.
+
+Speaks enough RESP2 for the redis.asyncio client the backend uses: PING,
+AUTH, SELECT, GET, SET (PX, NX), DEL and EVAL; anything else (e.g. the
+CLIENT SETINFO sent on connect) gets an error reply. EVAL only understands
+the lock release script (compare and delete). Run standalone with:
+
+    python -m tests.fake_redis [port]
+
+and point ADDON_REDIS_URL at it, or use FakeRedis in-process:
+
+    async with FakeRedis() as server:
+        client = redis.asyncio.Redis.from_url(server.url, protocol=2)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from types import TracebackType
+from typing import Self
+
+
+def _bulk(value: bytes | None) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+async def _read_command(reader: asyncio.StreamReader) -> list[bytes]:
+    header = await reader.readuntil(b"\r\n")
+    if not header.startswith(b"*"):
+        raise ValueError("Expected a RESP array")
+    args = []
+    for _ in range(int(header[1:-2])):
+        size = int((await reader.readuntil(b"\r\n"))[1:-2])
+        args.append((await reader.readexactly(size + 2))[:-2])
+    return args
+
+
+class FakeRedis:
+    """Single-database key/value store with millisecond expiry."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.host = host
+        self.port = port
+        self.commands: list[str] = []
+        self._data: dict[bytes, tuple[bytes, float | None]] = {}
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        return f"redis://{self.host}:{self.port}/0"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+    def _lookup(self, key: bytes) -> bytes | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires = entry
+        if expires is not None and time.monotonic() >= expires:
+            del self._data[key]
+            return None
+        return value
+
+    def _handle(self, args: list[bytes]) -> bytes:
+        name = args[0].upper().decode()
+        self.commands.append(name)
+        if name in ("PING", "AUTH", "SELECT"):
+            return b"+OK\r\n" if name != "PING" else b"+PONG\r\n"
+        if name == "GET":
+            return _bulk(self._lookup(args[1]))
+        if name == "DEL":
+            removed = sum(self._data.pop(key, None) is not None for key in args[1:])
+            return b":%d\r\n" % removed
+        if name == "SET":
+            key, value = args[1], args[2]
+            options = [arg.upper() for arg in args[3:]]
+            if b"NX" in options and self._lookup(key) is not None:
+                return _bulk(None)
+            expires = None
+            if b"PX" in options:
+                ms = int(options[options.index(b"PX") + 1])
+                expires = time.monotonic() + ms / 1000
+            self._data[key] = (value, expires)
+            return b"+OK\r\n"
+        if name == "EVAL":
+            # Lock release: delete KEYS[1] if it holds ARGV[1]
+            key, token = args[3], args[4]
+            if self._lookup(key) == token:
+                del self._data[key]
+                return b":1\r\n"
+            return b":0\r\n"
+        return b"-ERR unknown command '%s'\r\n" % name.encode()
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                args = await _read_command(reader)
+                writer.write(self._handle(args))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _main(port: int) -> None:
+    server = FakeRedis(port=port)
+    await server.start()
+    print(f"Fake Redis listening on {server.url}")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main(int(sys.argv[1]) if len(sys.argv) > 1 else 6379))
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from stremio_status.clients.aggregate_client import AggregateClient
+from stremio_status.clients.base import StatusSource
+from stremio_status.core.models import EndpointStatus
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeSource(StatusSource):
+    """Serves fixed endpoints until told to fail."""
+
+    def __init__(self, name: str, keys: list[str]) -> None:
+        super().__init__(timeout=1.0, name=name)
+        self.keys = keys
+        self.failing = False
+
+    async def _fetch(self) -> list[EndpointStatus]:
+        if self.failing:
+            raise ConnectionError(f"{self.name} is down")
+        if self.last_endpoints is None:
+            self.last_endpoints = [
+                EndpointStatus(
+                    name=key, group="", key=key, healthy=True, source=self.name
+                )
+                for key in self.keys
+            ]
+        return self.last_endpoints
+
+
+def keys(endpoints: list[EndpointStatus]) -> list[str]:
+    return [ep.key for ep in endpoints]
+
+
+async def test_merges_sources_and_detects_no_change() -> None:
+    eu = FakeSource("eu", ["a", "b"])
+    us = FakeSource("us", ["b", "c"])
+    client = AggregateClient([eu, us])
+    merged = await client.fetch_statuses()
+    assert keys(merged) == ["a", "b", "c"]
+    assert merged[1].source == "eu"
+    assert await client.fetch_statuses() is merged
+
+
+async def test_failing_source_is_dropped_once_stale() -> None:
+    eu = FakeSource("eu", ["a"])
+    us = FakeSource("us", ["b"])
+    client = AggregateClient([eu, us], max_stale_seconds=0.1)
+    merged = await client.fetch_statuses()
+
+    us.failing = True
+    assert await client.fetch_statuses() is merged
+
+    await asyncio.sleep(0.15)
+    assert keys(await client.fetch_statuses()) == ["a"]
+
+    us.failing = False
+    assert keys(await client.fetch_statuses()) == ["a", "b"]
+
+
+async def test_fails_only_if_all_sources_fail() -> None:
+    eu = FakeSource("eu", ["a"])
+    eu.failing = True
+    client = AggregateClient([eu])
+    with pytest.raises(ConnectionError):
+        await client.fetch_statuses()
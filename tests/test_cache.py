@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from stremio_status.core import cache
+from stremio_status.core.cache import LRUCache, TTLCache
+
+pytestmark = pytest.mark.anyio
+
+
+class Clock:
+    """Stands in for the time module in core.cache."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(cache, "time", clock)
+    return clock
+
+
+def test_evicts_least_recently_used() -> None:
+    lru = LRUCache(max_entries=2)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    assert lru.get("a") == 1
+    lru.set("c", 3)
+    assert (lru.get("a"), lru.get("b"), lru.get("c")) == (1, None, 3)
+    assert len(lru) == 2
+    assert lru.stats() == {
+        "size": 2,
+        "max_entries": 2,
+        "hits": 3,
+        "misses": 1,
+        "evictions": 1,
+        "expirations": 0,
+    }
+
+
+def test_entries_expire(clock: Clock) -> None:
+    ttl = TTLCache(ttl_seconds=10, sweep_interval=None)
+    ttl.set("default", 1)
+    ttl.set("short", 2, ttl=5)
+    clock.now += 5
+    assert (ttl.get("default"), ttl.get("short")) == (1, None)
+    clock.now += 5
+    assert ttl.get("default") is None
+    assert ttl.stats()["expirations"] == 2
+    assert len(ttl) == 0
+
+
+def test_sweep_drops_unread_expired_entries(clock: Clock) -> None:
+    ttl = TTLCache(ttl_seconds=10)
+    for key in range(5):
+        ttl.set(key, key)
+    clock.now += 10
+    # The sweep runs from set(), at most every sweep_interval
+    ttl.set("new", 0)
+    assert len(ttl) == 1
+    assert ttl.stats()["expirations"] == 5
+
+
+async def test_concurrent_misses_compute_once() -> None:
+    ttl = TTLCache(ttl_seconds=10)
+    calls = 0
+
+    async def compute() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(
+        *(ttl.get_or_compute("key", compute) for _ in range(5))
+    )
+    assert (results, calls) == (["value"] * 5, 1)
+    assert await ttl.get_or_compute("key", compute) == "value"
+    assert calls == 1
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from stremio_status.core.cache_backend import CacheBackendError, RedisCacheBackend
+from tests.fake_redis import FakeRedis
+
+redis = pytest.importorskip("redis.asyncio")
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def server() -> AsyncIterator[FakeRedis]:
+    async with FakeRedis() as server:
+        yield server
+
+
+def make_backend(server: FakeRedis, **kwargs: float) -> RedisCacheBackend:
+    client = redis.Redis.from_url(server.url, protocol=2, socket_timeout=1.0)
+    return RedisCacheBackend(client, prefix="test:", **kwargs)
+
+
+async def test_set_get_and_expiry(server: FakeRedis) -> None:
+    backend = make_backend(server)
+    await backend.set("key", b"value", ttl=0.2)
+    assert await backend.get("key") == b"value"
+    assert await backend.get("missing") is None
+    await asyncio.sleep(0.3)
+    assert await backend.get("key") is None
+    await backend.close()
+
+
+async def test_lock_is_exclusive_and_released_by_owner_only(server: FakeRedis) -> None:
+    backend = make_backend(server)
+    token = await backend.acquire_lock("refresh", ttl=5)
+    assert token is not None
+    assert await backend.acquire_lock("refresh", ttl=5) is None
+
+    await backend.release_lock("refresh", "not-the-owner")
+    assert await backend.acquire_lock("refresh", ttl=5) is None
+
+    await backend.release_lock("refresh", token)
+    assert await backend.acquire_lock("refresh", ttl=5) is not None
+    await backend.close()
+
+
+async def test_get_or_compute_refreshes_once_across_replicas(
+    server: FakeRedis,
+) -> None:
+    replicas = [make_backend(server, poll_interval=0.01) for _ in range(3)]
+    calls = 0
+
+    async def compute() -> bytes:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        return b"snapshot"
+
+    results = await asyncio.gather(
+        *(backend.get_or_compute("snapshot", 10, compute) for backend in replicas)
+    )
+    assert results == [b"snapshot"] * 3
+    assert calls == 1
+    # The refresh lock is released once the value is stored
+    assert await replicas[0].acquire_lock("snapshot:lock", ttl=5) is not None
+    for backend in replicas:
+        await backend.close()
+
+
+async def test_unavailable_compute_result_is_not_cached(server: FakeRedis) -> None:
+    backend = make_backend(server)
+
+    async def compute() -> bytes | None:
+        return None
+
+    assert await backend.get_or_compute("snapshot", 10, compute) is None
+    assert await backend.get("snapshot") is None
+    await backend.close()
+
+
+async def test_unreachable_server_raises_backend_error() -> None:
+    server = FakeRedis()
+    await server.start()
+    backend = make_backend(server)
+    await server.stop()
+    with pytest.raises(CacheBackendError):
+        await backend.get("key")
+    await backend.close()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import dataclasses
+import time
+
+import httpx
+import pytest
+
+from stremio_status.core.snapshot import StatusSnapshot
+from stremio_status.services import status_service
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_changes_since_cursor(
+    addon: httpx.AsyncClient, auth: dict[str, str]
+) -> None:
+    cursor = (await addon.get("/api/endpoints")).json()["cursor"]
+    resp = (await addon.get("/api/changes", params={"since": cursor})).json()
+    assert (resp["resync"], resp["endpoints"], resp["cursor"]) == (False, [], cursor)
+
+    await addon.post(
+        "/api/v1/endpoints/addons_service-0/external",
+        params={"success": "false"},
+        headers=auth,
+    )
+    resp = (await addon.get("/api/changes", params={"since": cursor})).json()
+    assert resp["resync"] is False
+    assert [(ep["key"], ep["healthy"]) for ep in resp["endpoints"]] == [
+        ("addons_service-0", False)
+    ]
+    assert resp["cursor"] != cursor
+
+
+@pytest.mark.parametrize("since", [None, "", "1", "garbage", "x.1"])
+async def test_missing_or_malformed_cursor_resyncs(
+    addon: httpx.AsyncClient, since: str | None
+) -> None:
+    params = {} if since is None else {"since": since}
+    resp = (await addon.get("/api/changes", params=params)).json()
+    assert resp["resync"] is True
+    assert len(resp["endpoints"]) == 5
+
+
+async def test_cursor_of_an_unknown_snapshot_resyncs(
+    addon: httpx.AsyncClient,
+) -> None:
+    cursor = (await addon.get("/api/endpoints")).json()["cursor"]
+    origin, _, generation = cursor.rpartition(".")
+    # Same generation built by another process, or a future one
+    for since in [f"other.{generation}", f"{origin}.{int(generation) + 1}"]:
+        resp = await addon.get("/api/changes", params={"since": since})
+        assert resp.json()["resync"] is True
+        assert resp.json()["cursor"] == cursor
+
+
+async def test_cursor_issued_by_another_worker(addon: httpx.AsyncClient) -> None:
+    await addon.get("/api/endpoints")
+    ours = status_service._snapshot
+    assert ours is not None
+
+    # Snapshots another worker built and published, adopted here as-is
+    first = StatusSnapshot(ours.endpoints, ours.generation + 1, origin="other")
+    down = [
+        dataclasses.replace(ep, healthy=False) if ep.key == "addons_service-0" else ep
+        for ep in ours.endpoints
+    ]
+    second = StatusSnapshot(down, ours.generation + 2, origin="other")
+    status_service._adopt(first, time.time())
+    cursor = status_service.change_cursor(first)
+    status_service._adopt(second, time.time())
+
+    resp = (await addon.get("/api/changes", params={"since": cursor})).json()
+    assert resp["resync"] is False
+    assert [ep["key"] for ep in resp["endpoints"]] == ["addons_service-0"]
+    assert resp["cursor"] == f"other.{ours.generation + 2}"
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import pytest
+
+from stremio_status.core import circuit_breaker
+from stremio_status.core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class Clock:
+    """Stands in for the time module in circuit_breaker."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(circuit_breaker, "time", clock)
+    return clock
+
+
+def trip(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+async def fail() -> None:
+    raise OSError("down")
+
+
+async def succeed() -> str:
+    return "ok"
+
+
+async def test_opens_after_threshold_and_rejects_calls(clock: Clock) -> None:
+    breaker = CircuitBreaker("test", failure_threshold=3, backoff_seconds=5)
+    for _ in range(2):
+        with pytest.raises(OSError):
+            await breaker.call(fail)
+    assert breaker.is_closed()
+
+    with pytest.raises(OSError):
+        await breaker.call(fail)
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.retry_in() == 5
+
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(succeed)
+
+
+async def test_half_open_probe_closes_or_reopens(clock: Clock) -> None:
+    breaker = CircuitBreaker("test", failure_threshold=1, backoff_seconds=5)
+    trip(breaker)
+
+    clock.now += 5
+    assert breaker.allow()
+    assert breaker.state is CircuitState.HALF_OPEN
+    # Only one probe at a time
+    assert not breaker.allow()
+
+    # Failed probe: open again, for twice as long (retry_in is 0 unless open)
+    breaker.record_failure()
+    assert breaker.retry_in() == 10
+
+    clock.now += 10
+    assert await breaker.call(succeed) == "ok"
+    assert breaker.is_closed()
+    assert breaker.failures == 0
+
+    # Recovered: the backoff starts over
+    trip(breaker)
+    assert breaker.retry_in() == 5
+
+
+def test_backoff_is_capped(clock: Clock) -> None:
+    breaker = CircuitBreaker(
+        "test", failure_threshold=1, backoff_seconds=5, max_backoff_seconds=60
+    )
+    delays = []
+    for _ in range(2000):
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        delays.append(breaker.retry_in())
+        clock.now += delays[-1]
+        assert breaker.allow()
+    assert delays[:6] == [5, 10, 20, 40, 60, 60]
+    assert delays[-1] == 60
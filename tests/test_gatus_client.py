@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from stremio_status.clients.gatus_client import GatusClient
+from stremio_status.services import status_service
+
+pytestmark = pytest.mark.anyio
+
+
+class Statuses:
+    """Serves a mutable statuses list, counting requests."""
+
+    def __init__(self, etag: str | None = None) -> None:
+        self.etag = etag
+        self.healthy = True
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.etag and request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304)
+        ep: dict[str, Any] = {
+            "key": "core_api",
+            "name": "api",
+            "results": [
+                {
+                    "success": self.healthy,
+                    "duration": 50_000_000,
+                    "timestamp": "2024-01-01T00:00:00Z",
+                }
+            ],
+        }
+        headers = {"ETag": self.etag} if self.etag else {}
+        return httpx.Response(200, content=json.dumps([ep]), headers=headers)
+
+
+def client_for(statuses: Statuses) -> GatusClient:
+    client = GatusClient("http://gatus")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(statuses))
+    return client
+
+
+async def test_same_body_is_not_parsed_again() -> None:
+    statuses = Statuses()
+    client = client_for(statuses)
+    first = await client.fetch_statuses()
+    assert await client.fetch_statuses() is first
+    assert len(statuses.requests) == 2
+
+    statuses.healthy = False
+    [ep] = await client.fetch_statuses()
+    assert ep.healthy is False
+    await client.close()
+
+
+async def test_not_modified_reuses_previous_result() -> None:
+    statuses = Statuses(etag='"v1"')
+    client = client_for(statuses)
+    first = await client.fetch_statuses()
+    assert "If-None-Match" not in statuses.requests[0].headers
+
+    assert await client.fetch_statuses() is first
+    assert statuses.requests[1].headers["If-None-Match"] == '"v1"'
+
+    statuses.etag = '"v2"'
+    statuses.healthy = False
+    second = await client.fetch_statuses()
+    assert second is not first
+    assert second[0].healthy is False
+    await client.close()
+
+
+async def test_unchanged_fetch_keeps_the_snapshot_generation(
+    addon: httpx.AsyncClient,
+) -> None:
+    first = await status_service.refresh_snapshot()
+    second = await status_service.refresh_snapshot()
+    assert first is not None and second is not None
+    assert second.endpoints is first.endpoints
+    assert second.generation == first.generation
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import pytest
+
+from stremio_status.clients.base import StatusSource
+from stremio_status.core.history import EndpointHistory
+from stremio_status.core.models import EndpointStatus
+from stremio_status.utils import ui
+
+pytestmark = pytest.mark.anyio
+
+START = 1_700_000_000
+
+
+def result(at: int, success: bool = True) -> dict[str, Any]:
+    return {
+        "success": success,
+        "duration": 50_000_000,
+        "timestamp": ui.format_timestamp(at),
+    }
+
+
+class OnceSource(StatusSource):
+    """Returns one parsed endpoint, then reports "unchanged" forever."""
+
+    def __init__(self, results: list[dict[str, Any]]) -> None:
+        super().__init__(timeout=1.0, history_size=100)
+        self.results = results
+
+    async def _fetch(self) -> list[EndpointStatus]:
+        if self.last_endpoints is not None:
+            return self._unchanged()
+        ep = {"key": "core_api", "name": "api", "results": self.results}
+        self.last_endpoints = [self._parse_endpoint(ep)]
+        self._stats_at = time.time()
+        return self.last_endpoints
+
+
+def test_results_seen_again_are_skipped() -> None:
+    history = EndpointHistory(100)
+    assert history.add_results([result(START), result(START + 60)]) == 2
+    # The last seen result is not in the page (here: reformatted), so the
+    # page is matched on timestamps instead
+    again = result(START + 60, success=False)
+    again["timestamp"] = again["timestamp"].replace("Z", ".000+00:00")
+    assert history.add_results([result(START), again, result(START + 120)]) == 1
+    assert list(history.timestamps) == [START, START + 60, START + 120]
+    assert list(history.successes) == [1, 1, 1]
+
+
+async def test_unchanged_source_recomputes_stats_on_age(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = START + 600
+    monkeypatch.setattr(time, "time", lambda: now)
+    source = OnceSource([result(START, success=False), result(START + 60)])
+
+    first = await source.fetch_statuses()
+    assert first[0].uptime_1h == 0.5
+
+    now += 30
+    assert await source.fetch_statuses() is first
+
+    # Once the samples leave the 1h window, uptime_1h becomes unknown
+    now = START + 3700
+    second = await source.fetch_statuses()
+    assert second is not first
+    assert second[0].uptime_1h is None
+    assert second[0].uptime == 0.5
+    assert await source.fetch_statuses() is second
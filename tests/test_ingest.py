@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import dataclasses
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from stremio_status.core import cache_backend
+from stremio_status.core.cache_backend import RedisCacheBackend
+from stremio_status.core.snapshot import StatusSnapshot
+from stremio_status.core.snapshot_store import decode_snapshot, encode_snapshot
+from stremio_status.services import status_service
+from tests.fake_redis import FakeRedis
+
+pytestmark = pytest.mark.anyio
+
+CATALOG = "/catalog/other/addon-status.json"
+
+
+async def down_keys(addon: httpx.AsyncClient) -> set[str]:
+    resp = await addon.get(CATALOG)
+    assert resp.status_code == 200
+    metas: list[dict[str, Any]] = resp.json()["metas"]
+    return {
+        meta["id"].removeprefix("stremio-status:")
+        for meta in metas
+        if "down.png" in meta["poster"]
+    }
+
+
+def pushed_elsewhere(snapshot: StatusSnapshot, key: str) -> StatusSnapshot:
+    """snapshot with key down, as published by another worker or replica."""
+    endpoints = [
+        dataclasses.replace(ep, healthy=False) if ep.key == key else ep
+        for ep in snapshot.endpoints
+    ]
+    return StatusSnapshot(endpoints, generation=snapshot.generation, origin="other")
+
+
+async def test_alert_webhook_and_external_result_update_the_catalog(
+    addon: httpx.AsyncClient,
+    auth: dict[str, str],
+) -> None:
+    assert await down_keys(addon) == set()
+    etag = (await addon.get(CATALOG)).headers["ETag"]
+
+    resp = await addon.post(
+        "/api/ingest/alert",
+        json={"key": "addons_service-0", "status": "TRIGGERED"},
+        headers=auth,
+    )
+    assert resp.json() == {"result": "applied"}
+    assert await down_keys(addon) == {"addons_service-0"}
+    resp = await addon.get(CATALOG, headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+
+    resp = await addon.post(
+        "/api/v1/endpoints/debrid_service-1/external",
+        params={"success": "false", "error": "timeout", "duration": "1.5s"},
+        headers=auth,
+    )
+    assert resp.json() == {"result": "applied"}
+    assert await down_keys(addon) == {"addons_service-0", "debrid_service-1"}
+
+    resp = await addon.post(
+        "/api/ingest/alert",
+        json={"name": "Service 0", "group": "Addons", "status": "RESOLVED"},
+        headers=auth,
+    )
+    assert resp.json() == {"result": "applied"}
+    assert await down_keys(addon) == {"debrid_service-1"}
+
+
+async def test_rejected_and_unknown_pushes(
+    addon: httpx.AsyncClient, auth: dict[str, str]
+) -> None:
+    await down_keys(addon)
+    resp = await addon.post(
+        "/api/ingest/alert",
+        json={"key": "addons_service-0", "status": "TRIGGERED"},
+        headers={"Authorization": "Bearer wrong"},
+    )
+    assert resp.status_code == 401
+
+    resp = await addon.post(
+        "/api/v1/endpoints/unknown/external", params={"success": "false"}, headers=auth
+    )
+    assert resp.status_code == 404
+    assert await down_keys(addon) == set()
+
+
+async def test_adopting_another_workers_snapshot_of_the_same_generation(
+    addon: httpx.AsyncClient,
+) -> None:
+    await down_keys(addon)
+    ours = status_service._snapshot
+    assert ours is not None
+
+    # Another worker applied a different push on top of the same generation
+    theirs = pushed_elsewhere(ours, "addons_service-0")
+    adopted = status_service._adopt(theirs, time.time())
+
+    assert adopted.generation > ours.generation
+    assert await down_keys(addon) == {"addons_service-0"}
+    # A re-published copy of it is recognized as the same content
+    assert status_service._adopt(theirs, time.time()).generation == adopted.generation
+
+
+async def test_concurrent_pushes_to_replicas_are_not_lost(
+    addon: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch, auth: dict[str, str]
+) -> None:
+    redis = pytest.importorskip("redis.asyncio")
+    async with FakeRedis() as server:
+        client = redis.Redis.from_url(server.url, protocol=2, socket_timeout=1.0)
+        backend = RedisCacheBackend(client, prefix="test:")
+        monkeypatch.setattr(cache_backend, "_backend", backend)
+        await down_keys(addon)
+        ours = status_service._snapshot
+        assert ours is not None
+
+        # Another replica pushed service 0 down, numbered like our snapshot
+        theirs = pushed_elsewhere(ours, "addons_service-0")
+        await backend.set(status_service.SNAPSHOT_KEY, encode_snapshot(theirs), 60)
+
+        resp = await addon.post(
+            "/api/v1/endpoints/debrid_service-1/external",
+            params={"success": "false"},
+            headers=auth,
+        )
+        assert resp.json() == {"result": "applied"}
+
+        both = {"addons_service-0", "debrid_service-1"}
+        assert await down_keys(addon) == both
+        data = await backend.get(status_service.SNAPSHOT_KEY)
+        assert data is not None
+        decoded = decode_snapshot(data)
+        assert decoded is not None
+        shared = decoded[0]
+        assert {ep.key for ep in shared.endpoints if not ep.healthy} == both
+        await backend.close()
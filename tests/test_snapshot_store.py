@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from stremio_status.core.models import EndpointStatus
+from stremio_status.core.snapshot import StatusSnapshot
+from stremio_status.core.snapshot_store import (
+    decode_snapshot,
+    encode_snapshot,
+    load_snapshot,
+    save_snapshot,
+)
+
+SNAPSHOT = StatusSnapshot(
+    endpoints=[
+        EndpointStatus("api", "core", "core_api", True, uptime=0.99, checked_at=1.5),
+        EndpointStatus("web", "core", "core_web", False, source="eu"),
+    ],
+    generation=7,
+    origin="a1b2",
+)
+
+
+def test_round_trip() -> None:
+    decoded = decode_snapshot(encode_snapshot(SNAPSHOT))
+    assert decoded is not None
+    snapshot, _ = decoded
+    assert snapshot.endpoints == SNAPSHOT.endpoints
+    assert (snapshot.generation, snapshot.origin) == (7, "a1b2")
+    assert snapshot.stale
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_saved_file_round_trip(tmp_path: Path, use_mmap: bool) -> None:
+    path = tmp_path / "snapshot.json"
+    save_snapshot(SNAPSHOT, path)
+    loaded = load_snapshot(path, use_mmap=use_mmap)
+    assert loaded is not None
+    assert loaded[0].endpoints == SNAPSHOT.endpoints
+    assert load_snapshot(tmp_path / "missing.json") is None
+
+
+def with_rows(rows: Any) -> bytes:
+    doc = json.loads(encode_snapshot(SNAPSHOT))
+    doc["endpoints"] = rows
+    return json.dumps(doc).encode()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"{",
+        b"[1, 2]",
+        b'"snapshot"',
+        b"null",
+        with_rows([["api", "core"]]),
+        with_rows(["api_core_core-api_true_xx_xx_xx_xx_xx"]),
+        with_rows([{"name": "api"}]),
+        with_rows(7),
+        encode_snapshot(SNAPSHOT).replace(b'"origin"', b'"source"'),
+    ],
+)
+def test_corrupt_input_is_ignored(data: bytes) -> None:
+    assert decode_snapshot(data) is None
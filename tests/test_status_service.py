@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import time
+
+import pytest
+
+from stremio_status.clients import gatus_client
+from stremio_status.clients.base import StatusSource
+from stremio_status.core.models import EndpointStatus
+from stremio_status.services import status_service
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_refresh_loop_survives_unexpected_errors(
+    service: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = 0
+
+    async def refresh() -> None:
+        nonlocal calls
+        calls += 1
+        raise RuntimeError("unexpected")
+
+    monkeypatch.setattr(status_service, "refresh_snapshot", refresh)
+    monkeypatch.setattr(status_service.settings, "refresh_interval_seconds", 0)
+    task = asyncio.create_task(status_service._refresh_loop())
+    await asyncio.sleep(0.05)
+    assert not task.done()
+    assert calls >= 2
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+class GatedSource(StatusSource):
+    """Returns a new endpoint list per fetch, each waiting for the gate."""
+
+    def __init__(self) -> None:
+        super().__init__(timeout=1.0)
+        self.gate = asyncio.Event()
+        self.calls = 0
+
+    async def _fetch(self) -> list[EndpointStatus]:
+        self.calls += 1
+        await self.gate.wait()
+        ep = {"key": "core_api", "name": "api", "results": []}
+        self.last_endpoints = [self._parse_endpoint(ep)]
+        return self.last_endpoints
+
+
+@pytest.fixture
+def source(service: None, monkeypatch: pytest.MonkeyPatch) -> GatedSource:
+    source = GatedSource()
+    monkeypatch.setattr(gatus_client, "_client", source)
+    return source
+
+
+async def test_concurrent_misses_share_one_fetch(source: GatedSource) -> None:
+    waiters = [asyncio.create_task(status_service.get_snapshot()) for _ in range(10)]
+    await asyncio.sleep(0.01)
+    assert status_service.fetches.in_flight() == 1
+
+    source.gate.set()
+    snapshots = await asyncio.gather(*waiters)
+    assert source.calls == 1
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+    assert status_service.fetches.stats() == {
+        "calls": 1,
+        "coalesced": 9,
+        "in_flight": 0,
+    }
+
+
+async def test_expired_snapshot_is_served_while_refreshing(
+    source: GatedSource,
+) -> None:
+    source.gate.set()
+    first = await status_service.get_snapshot()
+    ttl = status_service.settings.snapshot_ttl_seconds
+    expired = dataclasses.replace(first, fetched_at=time.monotonic() - ttl - 1)
+    status_service._snapshot = expired
+
+    source.gate.clear()
+    # Answered from the expired snapshot, with a single refresh behind it
+    assert await status_service.get_snapshot() is expired
+    assert await status_service.get_snapshot() is expired
+    await asyncio.sleep(0.01)
+    assert (source.calls, status_service.fetches.in_flight()) == (2, 1)
+
+    source.gate.set()
+    fresh = await status_service._revalidate()
+    assert fresh is not None
+    assert status_service._snapshot is fresh
+    assert fresh.generation == first.generation + 1
+    assert fresh.age() < ttl
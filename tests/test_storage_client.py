@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from stremio_status.clients import storage_client
+from stremio_status.clients.storage_client import Row, StorageClient, _fetch_all
+
+pytestmark = pytest.mark.anyio
+
+# The tables Gatus creates in SQLite, reduced to the columns read here
+SCHEMA = """
+CREATE TABLE endpoints (
+    endpoint_id INTEGER PRIMARY KEY,
+    endpoint_key TEXT UNIQUE,
+    endpoint_name TEXT NOT NULL,
+    endpoint_group TEXT NOT NULL
+);
+CREATE TABLE endpoint_results (
+    endpoint_result_id INTEGER PRIMARY KEY,
+    endpoint_id INTEGER NOT NULL REFERENCES endpoints(endpoint_id),
+    success INTEGER NOT NULL,
+    duration INTEGER NOT NULL,
+    timestamp TIMESTAMP NOT NULL
+);
+"""
+
+# Runs for minutes unless interrupted
+SLOW_QUERY = """
+WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n)
+SELECT count(*) FROM n WHERE i > 1e12
+"""
+
+
+@pytest.fixture
+def database(tmp_path: Path) -> Path:
+    path = tmp_path / "data.db"
+    with sqlite3.connect(path) as db:
+        db.executescript(SCHEMA)
+        db.execute("INSERT INTO endpoints VALUES (1, 'core_api', 'api', 'core')")
+        add_result(db, "2024-01-01 00:00:00+00:00", success=True)
+    return path
+
+
+def add_result(db: sqlite3.Connection, timestamp: str, success: bool) -> None:
+    db.execute(
+        "INSERT INTO endpoint_results (endpoint_id, success, duration, timestamp) "
+        "VALUES (1, ?, 50000000, ?)",
+        (success, timestamp),
+    )
+
+
+async def test_reads_latest_results_and_every_new_one(database: Path) -> None:
+    client = StorageClient(f"sqlite:///{database}", history_size=100)
+    [ep] = await client.fetch_statuses()
+    assert (ep.key, ep.healthy, ep.last_updated) == (
+        "core_api",
+        True,
+        "2024-01-01T00:00:00Z",
+    )
+    assert await client.fetch_statuses() == [ep]
+
+    with sqlite3.connect(database) as db:
+        add_result(db, "2024-01-01 00:01:00+00:00", success=False)
+        add_result(db, "2024-01-01 00:02:00+00:00", success=True)
+    [ep] = await client.fetch_statuses()
+    assert ep.last_updated == "2024-01-01T00:02:00Z"
+    assert client.history is not None
+    history = client.history.get("core_api")
+    assert history is not None
+    assert list(history.successes) == [1, 0, 1]
+    await client.close()
+
+
+async def test_timed_out_query_is_interrupted(
+    database: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    outcomes: list[BaseException | None] = []
+
+    def fetch_all(conn: sqlite3.Connection, query: str) -> list[Row]:
+        try:
+            rows = _fetch_all(conn, query)
+        except BaseException as e:
+            outcomes.append(e)
+            raise
+        outcomes.append(None)
+        return rows
+
+    monkeypatch.setattr(storage_client, "_fetch_all", fetch_all)
+    client = StorageClient(f"sqlite:///{database}", timeout=0.2)
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        await client._query(SLOW_QUERY)
+    assert time.monotonic() - start < 1.0
+
+    # The worker thread stops too instead of running on in the background
+    deadline = time.monotonic() + 1.0
+    while not outcomes and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+    [error] = outcomes
+    assert isinstance(error, sqlite3.OperationalError)
+    assert "interrupted" in str(error)
+
+    [ep] = await client.fetch_statuses()
+    assert ep.key == "core_api"
+    await client.close()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import re
+
+import httpx
+import pytest
+
+from stremio_status.core.config import get_settings
+from stremio_status.endpoints import stremio
+from stremio_status.services.response_cache import ResponseCache
+
+pytestmark = pytest.mark.anyio
+
+CATALOG = "/catalog/other/addon-status.json"
+META = "/meta/tv/stremio-status:addons_service-0.json"
+STREAM = "/stream/tv/stremio-status:addons_service-0.json"
+
+
+@pytest.mark.parametrize("path", [CATALOG, META])
+async def test_cached_body_and_conditional_requests(
+    addon: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch, path: str
+) -> None:
+    cache = ResponseCache(100)
+    monkeypatch.setattr(stremio, "response_cache", cache)
+    first = await addon.get(path)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    cache_control = first.headers["Cache-Control"]
+    assert re.fullmatch(
+        r"public, max-age=\d+, stale-while-revalidate=555", cache_control
+    )
+    assert cache.stats()["misses"] == 1
+
+    second = await addon.get(path)
+    assert (second.content, second.headers["ETag"]) == (first.content, etag)
+    assert cache.stats()["hits"] == 1
+
+    for if_none_match in [etag, f"W/{etag}", f'"other", {etag}']:
+        resp = await addon.get(path, headers={"If-None-Match": if_none_match})
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["ETag"] == etag
+        assert "Cache-Control" in resp.headers
+
+    resp = await addon.get(path, headers={"If-None-Match": '"other"'})
+    assert (resp.status_code, resp.content) == (200, first.content)
+
+
+@pytest.mark.parametrize("path", [CATALOG, META, STREAM])
+async def test_fast_serialization_renders_the_same_bytes(
+    addon: httpx.AsyncClient,
+    auth: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+    path: str,
+) -> None:
+    # Streams only list endpoints that are down (by default)
+    await addon.get(CATALOG)
+    await addon.post(
+        "/api/v1/endpoints/addons_service-0/external",
+        params={"success": "false", "error": "timeout"},
+        headers=auth,
+    )
+    bodies = []
+    for fast in [False, True]:
+        monkeypatch.setattr(get_settings(), "fast_serialization", fast)
+        monkeypatch.setattr(stremio, "response_cache", ResponseCache(100))
+        resp = await addon.get(path)
+        assert resp.status_code == 200
+        bodies.append(resp.content)
+    assert b"Service 0" in bodies[0]
+    assert bodies[0] == bodies[1]
+
+
+async def test_request_metrics_bound_the_method_label(
+    addon: httpx.AsyncClient,
+) -> None:
+    await addon.request("PROPFIND", "/manifest.json")
+    await addon.request("X-RANDOM-1", "/manifest.json")
+    text = (await addon.get("/metrics")).text
+    assert 'route="/manifest.json",method="other",status="405"}' in text
+    assert "PROPFIND" not in text
+    assert "X-RANDOM-1" not in text